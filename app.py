@@ -1,13 +1,220 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
+import functools
+import io
 import math
+import os
+import threading
+
+import numpy as np
+
+from model_matematika import (
+    optimasi_lp_2d, optimasi_bauran_produksi, LPInkremental,
+    hitung_eoq, eoq_terkendala, wagner_whitin, eoq_diskon, simulasi_persediaan, ringkasan_simulasi,
+    hitung_mmc, replikasi_antrian, profil_sepotong, antrian_transien, kebutuhan_server, jadwal_shift,
+    keandalan_struktur, seri, alokasi_redundansi, GudangSkenario,
+)
+from tampilan import CacheGrafik, KolamRender, Profiler
+from tampilan.grafik import (
+    grafik_lp, grafik_biaya_eoq, grafik_siklus_persediaan, grafik_ukuran_lot,
+    grafik_waktu_antrian, grafik_pn_antrian, grafik_keandalan,
+    grafik_heatmap, grafik_tornado, grafik_jejak_persediaan, grafik_jejak_antrian, grafik_antrian_transien,
+    grafik_jadwal_staf, grafik_frontier_redundansi,
+)
+from tampilan.grafik_klien import (
+    klien_biaya_eoq, klien_siklus_persediaan, klien_pn_antrian, klien_jejak_persediaan, klien_jejak_antrian,
+    klien_antrian_transien, distribusi_layanan,
+)
 
 # --- KONFIGURASI HALAMAN ---
 st.set_page_config(page_title="Dashboard Model Matematika Industri", layout="wide", initial_sidebar_state="expanded")
 st.title("📈 Dashboard Model Matematika untuk Industri")
 st.markdown("Sebuah aplikasi interaktif untuk memahami penerapan model matematika kunci dalam skenario bisnis di dunia nyata.")
 
+# --- CACHE GRAFIK ---
+# Satu cache untuk semua sesi; batas memori diatur lewat env CACHE_GRAFIK_MB
+@st.cache_resource
+def ambil_cache_grafik():
+    return CacheGrafik(batas_byte=int(float(os.environ.get("CACHE_GRAFIK_MB", 64)) * 1024 * 1024))
+
+# --- PROFIL KINERJA (opt-in lewat env PROFIL_DASHBOARD=1) ---
+# PROFIL_JSONL dan PROFIL_PROMETHEUS mengaktifkan ekspor berkala (thread latar) setiap PROFIL_INTERVAL detik
+@st.cache_resource
+def ambil_profiler():
+    return Profiler.dari_env()
+
+def diprofilkan(nama_tab):
+    def dekorator(fungsi):
+        @functools.wraps(fungsi)
+        def bungkus(*args, **kwargs):
+            with ambil_profiler().tab(nama_tab):
+                return fungsi(*args, **kwargs)
+        return bungkus
+    return dekorator
+
+# --- KOLAM RENDER ---
+# Grafik dirender di thread pekerja; ukuran diatur lewat env RENDER_PEKERJA dan RENDER_ANTREAN
+@st.cache_resource
+def ambil_kolam_render():
+    return KolamRender(ambil_cache_grafik(), n_pekerja=int(os.environ.get("RENDER_PEKERJA", 2)),
+                       kedalaman_antrean=int(os.environ.get("RENDER_ANTREAN", 16)))
+
+_grafik_tertunda = threading.local()
+
+# --- GUDANG SKENARIO (opt-in lewat env GUDANG_SKENARIO=<berkas .db>) ---
+# Hasil perhitungan mahal dan skenario bernama disimpan di SQLite; batas ukuran lewat env GUDANG_SKENARIO_MB
+@st.cache_resource
+def ambil_gudang():
+    path = os.environ.get("GUDANG_SKENARIO")
+    if not path:
+        return None
+    return GudangSkenario(path, batas_byte=int(float(os.environ.get("GUDANG_SKENARIO_MB", 256)) * 1024 * 1024))
+
+def memo(model, parameter, fungsi):
+    gudang = ambil_gudang()
+    return fungsi() if gudang is None else gudang.hitung(model, parameter, fungsi)
+
+def muat_skenario(kunci_widget, nama_key):
+    hasil = ambil_gudang().ambil_skenario(st.session_state[nama_key])
+    if hasil is not None:
+        for k, v in hasil[1].items():
+            if k in kunci_widget:
+                st.session_state[k] = v
+
+def panel_skenario(model, kunci_widget):
+    gudang = ambil_gudang()
+    if gudang is None:
+        return
+    with st.expander("💾 Skenario Tersimpan"):
+        col_a, col_b = st.columns(2)
+        with col_a:
+            nama = st.text_input("Nama skenario", key=f"skenario_nama_{model}")
+            if st.button("Simpan parameter saat ini", key=f"skenario_simpan_{model}", disabled=not nama):
+                gudang.simpan_skenario(nama, model, {k: st.session_state[k] for k in kunci_widget})
+                st.toast(f"Skenario '{nama}' tersimpan.")
+        with col_b:
+            daftar = gudang.daftar_skenario(model)
+            st.selectbox("Skenario", daftar, key=f"skenario_pilih_{model}", index=None,
+                         placeholder="Belum ada skenario" if not daftar else "Pilih skenario")
+            st.button("Muat", key=f"skenario_muat_{model}", disabled=not daftar,
+                      on_click=muat_skenario, args=(kunci_widget, f"skenario_pilih_{model}"))
+
+# --- MODE GRAFIK ---
+# MODE_GRAFIK=klien mengirim data ringkas (Arrow) ke browser untuk digambar oleh Vega-Lite
+MODE_GRAFIK_KLIEN = os.environ.get("MODE_GRAFIK", "gambar") == "klien"
+
+def tampilkan_grafik(model, parameter, buat_figure, buat_klien=None):
+    if buat_klien is not None and st.session_state.get("grafik_klien", MODE_GRAFIK_KLIEN):
+        with ambil_profiler().fase('plot'):
+            data, spec = buat_klien(*parameter)
+        st.vega_lite_chart(data, spec, width="stretch")
+        return
+    future = ambil_kolam_render().kirim(model, parameter, buat_figure)
+    daftar = getattr(_grafik_tertunda, 'daftar', None)
+    if future.done() or daftar is None:
+        with ambil_profiler().fase('plot'):
+            data = future.result()
+        st.image(data, width="stretch")
+        return
+    # Sisakan tempat; gambar diisi setelah seluruh metrik tab terkirim
+    tempat = st.empty()
+    tempat.caption("⏳ Menyiapkan grafik...")
+    daftar.append((tempat, future))
+
+def grafik_menyusul(fungsi):
+    @functools.wraps(fungsi)
+    def bungkus(*args, **kwargs):
+        induk = getattr(_grafik_tertunda, 'daftar', None)
+        _grafik_tertunda.daftar = daftar = []
+        try:
+            hasil = fungsi(*args, **kwargs)
+        finally:
+            _grafik_tertunda.daftar = induk
+        for tempat, future in daftar:
+            with ambil_profiler().fase('plot'):
+                data = future.result()
+            tempat.image(data, width="stretch")
+        return hasil
+    return bungkus
+
+# --- ANALISIS SENSITIVITAS ---
+# Peta panas dihitung pada grid RESOLUSI x RESOLUSI dalam satu batch
+RESOLUSI_SENSITIVITAS = 200
+
+def tampilkan_sensitivitas(model, parameter_dasar, label, keluaran, label_keluaran, sumbu_awal, batas=None):
+    st.markdown("#### Analisis Sensitivitas")
+    if not st.toggle("Tampilkan peta panas dan diagram tornado", value=False, key=f"sensitivitas_{model}"):
+        return
+    batas = batas or {}
+    # Parameter bernilai nol tidak dapat digeser secara relatif
+    nama = [n for n in label if parameter_dasar[n] != 0]
+    col_a, col_b, col_c = st.columns(3)
+    with col_a:
+        sumbu_x = st.selectbox("Sumbu X", nama, index=nama.index(sumbu_awal[0]), format_func=label.get,
+                               key=f"sensitivitas_x_{model}")
+    with col_b:
+        pilihan_y = [n for n in nama if n != sumbu_x]
+        awal_y = sumbu_awal[1] if sumbu_awal[1] in pilihan_y else pilihan_y[0]
+        sumbu_y = st.selectbox("Sumbu Y", pilihan_y, index=pilihan_y.index(awal_y), format_func=label.get,
+                               key=f"sensitivitas_y_{model}")
+    with col_c:
+        rentang = st.slider("Rentang (± % dari nilai saat ini)", 10, 90, 50, 10, key=f"sensitivitas_rentang_{model}") / 100
+
+    def rentang_sumbu(n):
+        rendah, tinggi = parameter_dasar[n] * (1 - rentang), parameter_dasar[n] * (1 + rentang)
+        if n in batas:
+            rendah, tinggi = max(rendah, batas[n][0]), min(tinggi, batas[n][1])
+        return (rendah, tinggi, RESOLUSI_SENSITIVITAS)
+
+    dasar = tuple(parameter_dasar.items())
+    tampilkan_grafik('sensitivitas_heatmap', (model, dasar, sumbu_x, rentang_sumbu(sumbu_x), sumbu_y, rentang_sumbu(sumbu_y),
+                                              keluaran, label[sumbu_x], label[sumbu_y], label_keluaran), grafik_heatmap)
+    tampilkan_grafik('sensitivitas_tornado', (model, dasar, keluaran, 0.2, tuple(label.items()), label_keluaran,
+                                              tuple(batas.items())), grafik_tornado)
+    st.caption("Peta panas menunjukkan hasil model untuk setiap kombinasi dua parameter (tanda x = nilai saat ini). "
+               "Diagram tornado mengurutkan parameter berdasarkan besarnya perubahan hasil saat parameter digeser ±20%.")
+
+def format_rentang(bawah, atas, fmt):
+    teks = lambda v: ('-∞' if v < 0 else '∞') if math.isinf(v) else format(v, fmt)
+    return f"{teks(bawah)} – {teks(atas)}"
+
+# --- DATA PERSEDIAAN ---
+BULAN = ('Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des')
+
+# Permintaan bulanan dengan puncak saat Ramadan (Maret) dan akhir tahun (Desember)
+def permintaan_musiman(D, puncak):
+    faktor = [1 + puncak if b in ('Mar', 'Des') else 1 for b in BULAN]
+    return tuple(round(D * f / sum(faktor), 1) for f in faktor)
+
+# SKU contoh untuk mode multi-item; dibangkitkan sekali dengan seed tetap
+@st.cache_data
+def contoh_sku(n):
+    rng = np.random.default_rng(0)
+    return {'D': rng.uniform(100, 5000, n), 'S': rng.uniform(1e5, 1e6, n), 'H': rng.uniform(5e3, 5e4, n),
+            'ruang': rng.uniform(0.01, 0.5, n), 'harga': rng.uniform(2e4, 3e5, n)}
+
+def tabel_csv(tabel):
+    kolom = list(tabel)
+    baris = zip(*(map('{:.6g}'.format, v.tolist()) for v in tabel.values()))
+    return ','.join(kolom) + '\n' + '\n'.join(map(','.join, baris)) + '\n'
+
+# --- DATA ANTRIAN ---
+HARI = ('Sen', 'Sel', 'Rab', 'Kam', 'Jum', 'Sab', 'Min')
+# Pengali laju kedatangan menurut jam (jam, pengali); puncak makan siang dan makan malam
+POLA_JAM = ((0, 0.1), (6, 0.5), (11, 1.0), (12, 1.6), (13, 1.3), (14, 0.7), (18, 1.2), (20, 0.9), (22, 0.2), (24, 0.1))
+
+# Prakiraan kedatangan 168 jam per toko; toko pertama memakai λ dari slider, toko lain diskalakan acak (seed tetap)
+@st.cache_data
+def prakiraan_mingguan(lmbda, n_toko):
+    jam = np.arange(7 * 24)
+    pola = np.interp(jam % 24, *zip(*POLA_JAM)) * np.where(jam // 24 >= 5, 1.2, 1.0)
+    skala = np.random.default_rng(0).uniform(0.5, 1.5, (n_toko, 1))
+    skala[0] = 1.0
+    return lmbda * skala * pola
+
+# --- DATA KEANDALAN ---
+# Harga satu unit mesin cadangan (Rp juta) untuk studi kasus lini perakitan
+BIAYA_UNIT_MESIN = {'Stamping': 150.0, 'Welding': 120.0, 'Painting': 80.0, 'Assembly': 100.0}
+
 # --- SIDEBAR ---
 with st.sidebar:
     st.header("Panduan Aplikasi")
@@ -15,6 +222,9 @@ with st.sidebar:
     Aplikasi ini mendemonstrasikan empat model matematika melalui studi kasus yang relevan dengan industri di Indonesia. Setiap tab menyediakan **analisis, visualisasi, dan wawasan bisnis** yang dapat ditindaklanjuti.
     """)
     st.info("**Tips:** Ubah parameter di setiap model untuk melihat bagaimana hasilnya berubah secara real-time!")
+    st.toggle("Grafik interaktif (digambar di browser)", value=MODE_GRAFIK_KLIEN, key="grafik_klien",
+              help="Kurva dan jejak simulasi dikirim sebagai data ringkas dan dapat di-zoom; "
+                   "grafik lain tetap berupa gambar.")
     
     st.markdown("""
     ---
@@ -34,6 +244,9 @@ with st.sidebar:
     st.caption("Matematika Terapan | Teknik Informatika - Universitas Pelita Bangsa")
 
 # --- TAB 1: OPTIMASI PRODUKSI ---
+@st.fragment
+@diprofilkan('produksi')
+@grafik_menyusul
 def optimasi_produksi():
     st.header("📊 Optimasi Produksi Furnitur")
     st.subheader("Studi Kasus: UKM Mebel Jati 'Jati Indah'")
@@ -48,15 +261,17 @@ def optimasi_produksi():
         
         with st.container(border=True):
             st.subheader("🛠️ Parameter Model")
-            profit_meja = st.number_input("Keuntungan per Meja (Rp)", min_value=0, value=750000, step=50000)
-            profit_kursi = st.number_input("Keuntungan per Kursi (Rp)", min_value=0, value=300000, step=25000)
-            jam_meja = st.number_input("Jam Kerja per Meja", min_value=1.0, value=6.0, step=0.5)
-            jam_kursi = st.number_input("Jam Kerja per Kursi", min_value=1.0, value=2.0, step=0.5)
-            kayu_meja = st.number_input("Kayu untuk Meja (unit)", min_value=1.0, value=4.0, step=0.5)
-            kayu_kursi = st.number_input("Kayu untuk Kursi (unit)", min_value=1.0, value=1.5, step=0.5)
-            total_jam = st.number_input("Total Jam Kerja Tim per Minggu", min_value=1, value=240, step=10)
-            total_kayu = st.number_input("Total Kayu Jati Tersedia (unit)", min_value=1, value=120, step=10)
+            profit_meja = st.number_input("Keuntungan per Meja (Rp)", min_value=0, value=750000, step=50000, key="lp_profit_meja")
+            profit_kursi = st.number_input("Keuntungan per Kursi (Rp)", min_value=0, value=300000, step=25000, key="lp_profit_kursi")
+            jam_meja = st.number_input("Jam Kerja per Meja", min_value=1.0, value=6.0, step=0.5, key="lp_jam_meja")
+            jam_kursi = st.number_input("Jam Kerja per Kursi", min_value=1.0, value=2.0, step=0.5, key="lp_jam_kursi")
+            kayu_meja = st.number_input("Kayu untuk Meja (unit)", min_value=1.0, value=4.0, step=0.5, key="lp_kayu_meja")
+            kayu_kursi = st.number_input("Kayu untuk Kursi (unit)", min_value=1.0, value=1.5, step=0.5, key="lp_kayu_kursi")
+            total_jam = st.number_input("Total Jam Kerja Tim per Minggu", min_value=1, value=240, step=10, key="lp_total_jam")
+            total_kayu = st.number_input("Total Kayu Jati Tersedia (unit)", min_value=1, value=120, step=10, key="lp_total_kayu")
             
+        panel_skenario('lp', ('lp_profit_meja', 'lp_profit_kursi', 'lp_jam_meja', 'lp_jam_kursi', 'lp_kayu_meja', 'lp_kayu_kursi', 'lp_total_jam', 'lp_total_kayu'))
+
         with st.expander("Penjelasan Rumus Model: Linear Programming"):
             st.markdown("""
             Linear Programming adalah metode untuk mencapai hasil terbaik (seperti keuntungan maksimal atau biaya minimal) dalam suatu model matematika yang persyaratannya diwakili oleh hubungan linear.
@@ -80,34 +295,19 @@ def optimasi_produksi():
             st.latex(r'''3. \quad x \ge 0, y \ge 0''')
 
         # --- Perhitungan ---
-        A_matrix = np.array([[jam_meja, jam_kursi], [kayu_meja, kayu_kursi]])
-        b_vector = np.array([total_jam, total_kayu])
-        x_intercept1 = total_jam / jam_meja if jam_meja > 0 else float('inf')
-        y_intercept1 = total_jam / jam_kursi if jam_kursi > 0 else float('inf')
-        x_intercept2 = total_kayu / kayu_meja if kayu_meja > 0 else float('inf')
-        y_intercept2 = total_kayu / kayu_kursi if kayu_kursi > 0 else float('inf')
-        try:
-            intersect_point = np.linalg.solve(A_matrix, b_vector)
-            if intersect_point[0] < 0 or intersect_point[1] < 0: intersect_point = (0, 0)
-        except np.linalg.LinAlgError:
-            intersect_point = (0, 0)
-        
-        corner_points = [(0, 0)]
-        if y_intercept1 != float('inf') and (kayu_meja*0 + kayu_kursi*y_intercept1 <= total_kayu): corner_points.append((0, y_intercept1))
-        if y_intercept2 != float('inf') and (jam_meja*0 + jam_kursi*y_intercept2 <= total_jam): corner_points.append((0, y_intercept2))
-        if x_intercept1 != float('inf') and (kayu_meja*x_intercept1 + kayu_kursi*0 <= total_kayu): corner_points.append((x_intercept1, 0))
-        if x_intercept2 != float('inf') and (jam_meja*x_intercept2 + jam_kursi*0 <= total_jam): corner_points.append((x_intercept2, 0))
-        if intersect_point[0] > 0 and intersect_point[1] > 0: corner_points.append(tuple(intersect_point))
-        
-        corner_points_unique = sorted(list(set(corner_points)), key=lambda k: (k[0], k[1]))
-
-        optimal_profit, optimal_point = 0, (0, 0)
-        profits_at_corners = []
-        for x, y in corner_points_unique:
-            profit = profit_meja * x + profit_kursi * y
-            profits_at_corners.append({'x': round(x, 2), 'y': round(y, 2), 'profit': round(profit, 2)})
-            if profit > optimal_profit:
-                optimal_profit, optimal_point = profit, (math.floor(x), math.floor(y))
+        with ambil_profiler().fase('compute'):
+            hasil = optimasi_lp_2d(profit_meja, profit_kursi, jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu)
+            corner_points = [(float(x), float(y)) for x, y, ok in zip(hasil.titik_x, hasil.titik_y, hasil.layak) if ok]
+            corner_points_unique = sorted(list(set(corner_points)), key=lambda k: (k[0], k[1]))
+
+            lp_point = (int(hasil.x_bulat), int(hasil.y_bulat))
+
+            # Jumlah produksi harus bulat: gunakan branch-and-bound, bukan pembulatan ke bawah
+            hasil_bulat = optimasi_bauran_produksi([profit_meja, profit_kursi], [[jam_meja, jam_kursi], [kayu_meja, kayu_kursi]], [total_jam, total_kayu])
+            optimal_profit = hasil_bulat.nilai
+            optimal_point = (int(hasil_bulat.x[0]), int(hasil_bulat.x[1]))
+            profits_at_corners = [{'x': round(x, 2), 'y': round(y, 2), 'profit': round(profit_meja * x + profit_kursi * y, 2)}
+                                  for x, y in corner_points_unique]
         
         with st.expander("Lihat Proses Perhitungan"):
             st.markdown("**Fungsi Tujuan dengan Angka:**")
@@ -117,8 +317,10 @@ def optimasi_produksi():
             st.latex(f"2. \quad {kayu_meja}x + {kayu_kursi}y \le {total_kayu}")
             st.markdown("**Perhitungan di Titik-Titik Sudut:**")
             for p in profits_at_corners:
-                is_optimal = (math.floor(p['x']) == optimal_point[0] and math.floor(p['y']) == optimal_point[1])
+                is_optimal = (math.floor(p['x']) == lp_point[0] and math.floor(p['y']) == lp_point[1])
                 st.write(f"- Titik ({p['x']}, {p['y']}): Keuntungan = Rp {p['profit']:,.0f} {'**(Optimal)**' if is_optimal else ''}")
+            st.markdown("**Solusi Bilangan Bulat (Branch & Bound):**")
+            st.write(f"- Titik {optimal_point}: Keuntungan = Rp {optimal_profit:,.0f} ({hasil_bulat.node} node dievaluasi)")
 
     with col2:
         st.subheader("💡 Hasil dan Wawasan Bisnis")
@@ -146,30 +348,7 @@ def optimasi_produksi():
 
         # Ini code untuk membuat grafiknya
         st.markdown("#### Visualisasi Daerah Produksi yang Layak")
-        fig, ax = plt.subplots(figsize=(10, 5))
-        
-        max_x = max(x_intercept1, x_intercept2) if max(x_intercept1, x_intercept2) > 0 else 50
-        x_vals = np.linspace(0, max_x * 1.1, 400)
-        
-        y1 = (total_jam - jam_meja * x_vals) / jam_kursi if jam_kursi > 0 else np.full_like(x_vals, float('inf'))
-        ax.plot(x_vals, y1, label=f'Batas Jam Kerja')
-        
-        y2 = (total_kayu - kayu_meja * x_vals) / kayu_kursi if kayu_kursi > 0 else np.full_like(x_vals, float('inf'))
-        ax.plot(x_vals, y2, label=f'Batas Stok Kayu')
-        
-        y_feasible = np.minimum(y1, y2)
-        ax.fill_between(x_vals, 0, y_feasible, where=(y_feasible>=0), color='green', alpha=0.2, label='Daerah Produksi Layak')
-        
-        ax.plot(optimal_point[0], optimal_point[1], 'ro', markersize=12, label=f'Titik Optimal ({optimal_point[0]}, {optimal_point[1]})')
-        
-        ax.set_xlabel('Jumlah Meja (x)')
-        ax.set_ylabel('Jumlah Kursi (y)')
-        ax.set_title('Grafik Optimasi Produksi Mebel', fontsize=16)
-        ax.legend()
-        ax.grid(True)
-        ax.set_xlim(left=0)
-        ax.set_ylim(bottom=0)
-        st.pyplot(fig)
+        tampilkan_grafik('lp', (jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu, *optimal_point), grafik_lp)
 
         with st.container(border=True):
             st.markdown("**🔍 Penjelasan Grafik:**")
@@ -180,7 +359,49 @@ def optimasi_produksi():
             - **Titik Merah (Solusi Optimal):** Dari semua titik di sudut daerah hijau, titik ini adalah yang memberikan **keuntungan tertinggi**. Ini adalah jawaban yang kita cari.
             """)
 
+        # Ini code untuk harga bayangan dan rentang optimalitas dari basis simpleks
+        st.markdown("#### Harga Bayangan & Rentang Optimalitas")
+        if st.toggle("Tampilkan analisis dual (solusi kontinu)", value=False, key="lp_dual"):
+            c_lp, A_lp, b_lp = [profit_meja, profit_kursi], [[jam_meja, jam_kursi], [kayu_meja, kayu_kursi]], [total_jam, total_kayu]
+            with ambil_profiler().fase('compute'):
+                # Basis optimal disimpan per sesi; perubahan di dalam rentang tidak memerlukan pivot
+                lp = st.session_state.get('lp_inkremental')
+                if lp is None:
+                    lp = st.session_state['lp_inkremental'] = LPInkremental(c_lp, A_lp, b_lp)
+                else:
+                    lp.perbarui(c_lp, A_lp, b_lp)
+                sens = lp.sensitivitas()
+            if lp.hasil.status != 'optimal':
+                st.warning("Relaksasi LP tidak memiliki solusi optimal untuk parameter ini.")
+            else:
+                st.dataframe([{'Sumber Daya': nama, 'Harga Bayangan (Rp/unit)': f"{dual + 0:,.0f}",
+                               'Sisa': f"{sisa:,.2f}", 'Rentang Kapasitas Berlaku': format_rentang(*rentang, ',.1f')}
+                              for nama, dual, sisa, rentang in zip(('Jam Kerja', 'Kayu Jati'), sens.dual, sens.slack,
+                                                                   sens.rentang_b)], hide_index=True)
+                st.dataframe([{'Produk': nama, 'Jumlah (kontinu)': f"{x:,.2f}", 'Reduced Cost (Rp)': f"{rc + 0:,.0f}",
+                               'Rentang Keuntungan per Unit (Rp)': format_rentang(*rentang, ',.0f')}
+                              for nama, x, rc, rentang in zip(('Meja', 'Kursi'), lp.hasil.x, sens.reduced_cost,
+                                                              sens.rentang_c)], hide_index=True)
+                st.caption("Harga bayangan = tambahan keuntungan dari satu unit sumber daya tambahan, berlaku selama "
+                           "kapasitas berada di rentangnya. Selama keuntungan per unit berada di rentangnya, jumlah "
+                           "produksi optimal tidak berubah. "
+                           f"Sesi ini: {lp.inkremental} perubahan diperbarui langsung dari basis tersimpan, "
+                           f"{lp.diselesaikan_ulang} kali diselesaikan ulang.")
+
+        # Ini code untuk analisis sensitivitas keuntungan terhadap parameter
+        tampilkan_sensitivitas('lp', {'profit_meja': profit_meja, 'profit_kursi': profit_kursi, 'jam_meja': jam_meja,
+                                      'jam_kursi': jam_kursi, 'kayu_meja': kayu_meja, 'kayu_kursi': kayu_kursi,
+                                      'total_jam': total_jam, 'total_kayu': total_kayu},
+                               {'profit_meja': 'Keuntungan per Meja (Rp)', 'profit_kursi': 'Keuntungan per Kursi (Rp)',
+                                'jam_meja': 'Jam Kerja per Meja', 'jam_kursi': 'Jam Kerja per Kursi',
+                                'kayu_meja': 'Kayu untuk Meja', 'kayu_kursi': 'Kayu untuk Kursi',
+                                'total_jam': 'Total Jam Kerja', 'total_kayu': 'Total Kayu Jati'},
+                               'profit_optimal', 'Keuntungan Maksimal LP (Rp)', ('profit_meja', 'total_kayu'))
+
 # --- TAB 2: MODEL PERSEDIAAN ---
+@st.fragment
+@diprofilkan('persediaan')
+@grafik_menyusul
 def model_persediaan():
     st.header("📦 Manajemen Persediaan (EOQ)")
     st.subheader("Studi Kasus: Kedai Kopi 'Kopi Kita'")
@@ -195,12 +416,14 @@ def model_persediaan():
         
         with st.container(border=True):
             st.subheader("⚙️ Parameter Model")
-            D = st.number_input("Permintaan Tahunan (kg)", min_value=1, value=1200)
-            S = st.number_input("Biaya Pemesanan per Pesanan (Rp)", min_value=0, value=500000)
-            H = st.number_input("Biaya Penyimpanan per kg per Tahun (Rp)", min_value=0, value=25000)
-            lead_time = st.number_input("Lead Time Pengiriman (hari)", min_value=1, value=14)
-            safety_stock = st.number_input("Stok Pengaman (Safety Stock) (kg)", min_value=0, value=10, help="Stok tambahan untuk mengantisipasi ketidakpastian permintaan atau keterlambatan.")
+            D = st.number_input("Permintaan Tahunan (kg)", min_value=1, value=1200, key="eoq_D")
+            S = st.number_input("Biaya Pemesanan per Pesanan (Rp)", min_value=0, value=500000, key="eoq_S")
+            H = st.number_input("Biaya Penyimpanan per kg per Tahun (Rp)", min_value=0, value=25000, key="eoq_H")
+            lead_time = st.number_input("Lead Time Pengiriman (hari)", min_value=1, value=14, key="eoq_lead_time")
+            safety_stock = st.number_input("Stok Pengaman (Safety Stock) (kg)", min_value=0, value=10, help="Stok tambahan untuk mengantisipasi ketidakpastian permintaan atau keterlambatan.", key="eoq_safety_stock")
         
+        panel_skenario('eoq', ('eoq_D', 'eoq_S', 'eoq_H', 'eoq_lead_time', 'eoq_safety_stock'))
+
         with st.expander("Penjelasan Rumus Model: Economic Order Quantity (EOQ)"):
             st.markdown("""
             **Variabel Utama:**
@@ -221,17 +444,10 @@ def model_persediaan():
             st.latex(r'''ROP = (\text{Permintaan Harian}) \times \text{Lead Time} + \text{Stok Pengaman}''')
             st.latex(r''' TC = \left(\frac{D}{Q}\right)S + \left(\frac{Q}{2}\right)H ''')
 
-        if H > 0 and D > 0:
-            eoq = math.sqrt((2 * D * S) / H)
-            frekuensi_pesanan = D / eoq if eoq > 0 else 0
-            biaya_pemesanan = (D/eoq) * S if eoq > 0 else 0
-            biaya_penyimpanan = (eoq/2) * H
-            total_biaya = biaya_pemesanan + biaya_penyimpanan
-            permintaan_harian = D / 360
-            rop = (permintaan_harian * lead_time) + safety_stock
-            siklus_pemesanan = 360 / frekuensi_pesanan if frekuensi_pesanan > 0 else 0
-        else:
-            eoq = 0; total_biaya = 0; rop = 0; siklus_pemesanan = 0
+        with ambil_profiler().fase('compute'):
+            hasil = hitung_eoq(D, S, H, lead_time, safety_stock)
+            eoq = float(hasil.eoq); total_biaya = float(hasil.total_biaya); rop = float(hasil.rop)
+            siklus_pemesanan = float(hasil.siklus_pemesanan); permintaan_harian = float(hasil.permintaan_harian)
 
         # Proses Perhitungan EOQ, ROP, dan TC    
         with st.expander("Lihat Proses Perhitungan"):
@@ -265,27 +481,7 @@ def model_persediaan():
         
         # Ini code untuk membuat grafik visualisasi analisis biaya
         st.markdown("#### Visualisasi Analisis Biaya")
-        q = np.linspace(max(1, eoq * 0.1), eoq * 2 if eoq > 0 else 200, 100)
-        holding_costs = (q / 2) * H
-        ordering_costs = (D / q) * S
-        total_costs = holding_costs + ordering_costs
-        
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.plot(q, holding_costs, 'b-', label='Biaya Penyimpanan')
-        ax.plot(q, ordering_costs, 'g-', label='Biaya Pemesanan')
-        ax.plot(q, total_costs, 'r-', linewidth=3, label='Total Biaya')
-        if eoq > 0:
-            ax.axvline(x=eoq, color='purple', linestyle='--', label=f'EOQ')
-            ax.annotate(f'Biaya Terendah\nRp {total_biaya:,.0f}', xy=(eoq, total_biaya), xytext=(eoq*1.3, total_biaya*0.6),
-                        arrowprops=dict(facecolor='black', shrink=0.05), fontsize=12)
-
-        ax.set_xlabel('Kuantitas Pemesanan (kg)')
-        ax.set_ylabel('Biaya Tahunan (Rp)')
-        ax.set_title('Analisis Biaya Persediaan (EOQ)', fontsize=16)
-        ax.legend()
-        ax.grid(True)
-        ax.ticklabel_format(style='plain', axis='y')
-        st.pyplot(fig)
+        tampilkan_grafik('eoq_biaya', (D, S, H), grafik_biaya_eoq, klien_biaya_eoq)
 
         with st.container(border=True):
              st.markdown("**🔍 Penjelasan Grafik Analisis Biaya:**")
@@ -299,33 +495,7 @@ def model_persediaan():
 
         # Ini code untuk membuat grafik visualisasi siklus persediaan
         st.markdown("#### Visualisasi Siklus Persediaan")
-        fig2, ax2 = plt.subplots(figsize=(10, 5))
-        if siklus_pemesanan > 0 and eoq > 0:
-            t_total = siklus_pemesanan * 2
-            t = np.linspace(0, t_total, 200)
-            stok_level = []
-            for time_point in t:
-                sisa_waktu_siklus = time_point % siklus_pemesanan
-                stok = (eoq + safety_stock) - permintaan_harian * sisa_waktu_siklus
-                stok_level.append(max(stok, safety_stock))
-            
-            ax2.plot(t, stok_level, label='Tingkat Persediaan')
-            ax2.axhline(y=rop, color='orange', linestyle='--', label=f'ROP ({rop:.1f} kg)')
-            ax2.axhline(y=safety_stock, color='red', linestyle=':', label=f'Stok Pengaman ({safety_stock} kg)')
-            
-            t_pesan = siklus_pemesanan - lead_time
-            if t_pesan > 0:
-                ax2.scatter(t_pesan, rop, color='red', s=100, zorder=5)
-                ax2.annotate('Pesan Ulang!', xy=(t_pesan, rop), xytext=(t_pesan, rop + eoq*0.3),
-                             arrowprops=dict(facecolor='red', shrink=0.05))
-
-        ax2.set_xlabel('Waktu (Hari)')
-        ax2.set_ylabel('Jumlah Stok (kg)')
-        ax2.set_title('Simulasi Siklus Persediaan', fontsize=16)
-        ax2.legend()
-        ax2.grid(True)
-        ax2.set_ylim(bottom=0)
-        st.pyplot(fig2)
+        tampilkan_grafik('eoq_siklus', (D, S, H, lead_time, safety_stock), grafik_siklus_persediaan, klien_siklus_persediaan)
 
         with st.container(border=True):
              st.markdown("**🔍 Penjelasan Grafik Siklus:**")
@@ -337,12 +507,142 @@ def model_persediaan():
              - **Siklus:** Stok akan kembali penuh (ke level EOQ + Stok Pengaman) setelah pesanan baru tiba.
              """)
 
+        # Ini code untuk analisis sensitivitas total biaya terhadap parameter
+        tampilkan_sensitivitas('eoq', {'D': D, 'S': S, 'H': H, 'lead_time': lead_time, 'safety_stock': safety_stock},
+                               {'D': 'Permintaan Tahunan (kg)', 'S': 'Biaya Pemesanan (Rp)', 'H': 'Biaya Penyimpanan (Rp/kg/tahun)',
+                                'lead_time': 'Lead Time (hari)', 'safety_stock': 'Stok Pengaman (kg)'},
+                               'total_biaya', 'Total Biaya Tahunan (Rp)', ('D', 'H'))
+
+        # Ini code untuk simulasi Monte Carlo kebijakan (Q, ROP)
+        st.markdown("#### Simulasi Stokastik (Monte Carlo)")
+        if st.toggle("Jalankan simulasi dengan permintaan dan lead time acak", value=False) and eoq > 0:
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                sd_permintaan = st.number_input("Std. Deviasi Permintaan Harian (kg)", min_value=0.0, value=1.0, step=0.5, help="Isi 0 untuk permintaan berdistribusi Poisson.")
+            with col_b:
+                sd_lead_time = st.number_input("Std. Deviasi Lead Time (hari)", min_value=0.0, value=2.0, step=0.5)
+            with col_c:
+                n_tahun = st.number_input("Horizon Simulasi (tahun)", min_value=1, max_value=10, value=1)
+
+            with ambil_profiler().fase('compute'):
+                ringkas = memo('eoq_simulasi', (eoq, rop, permintaan_harian, lead_time, safety_stock,
+                                                sd_permintaan, sd_lead_time, n_tahun),
+                               lambda: ringkasan_simulasi(simulasi_persediaan(
+                                   eoq, rop, permintaan_harian, lead_time, safety_stock,
+                                   sd_permintaan=sd_permintaan, sd_lead_time=sd_lead_time,
+                                   n_tahun=n_tahun, n_replikasi=1000)))
+            col1_sim, col2_sim, col3_sim = st.columns(3)
+            with col1_sim:
+                st.metric(label="✅ Fill Rate", value=f"{ringkas['fill_rate']['rata']:.2%}")
+            with col2_sim:
+                st.metric(label="⚠️ Peluang Kehabisan Stok per Hari", value=f"{ringkas['prob_stockout']['rata']:.2%}")
+            with col3_sim:
+                kuantil = ringkas['rata_persediaan']['kuantil']
+                st.metric(label="📦 Rata-rata Persediaan", value=f"{ringkas['rata_persediaan']['rata']:.1f} kg",
+                          help=f"90% replikasi berada di antara {kuantil[0.05]:.1f} dan {kuantil[0.95]:.1f} kg")
+            st.caption(f"Hasil dari 1.000 replikasi selama {n_tahun} tahun dengan kebijakan Q = {eoq:.0f} kg dan ROP = {rop:.1f} kg.")
+            tampilkan_grafik('eoq_jejak', (eoq, rop, permintaan_harian, lead_time, safety_stock, sd_permintaan,
+                                           sd_lead_time, n_tahun), grafik_jejak_persediaan, klien_jejak_persediaan)
+
+        # Ini code untuk jadwal pesanan bulanan dengan permintaan musiman dan diskon kuantitas
+        st.markdown("#### Permintaan Musiman & Diskon Kuantitas")
+        if st.toggle("Rencanakan pesanan bulanan dengan permintaan musiman", value=False, key="eoq_musiman"):
+            col_a, col_b = st.columns(2)
+            with col_a:
+                puncak = st.slider("Kenaikan Permintaan saat Ramadan & Akhir Tahun (%)", 0, 200, 60, 10) / 100
+            with col_b:
+                harga = st.number_input("Harga Beli per kg (Rp)", min_value=1, value=150000, step=5000)
+            permintaan = permintaan_musiman(D, puncak)
+
+            with ambil_profiler().fase('compute'):
+                lot = wagner_whitin(permintaan, S, H / 12)
+            biaya_tiap_bulan = S * sum(1 for p in permintaan if p > 0)
+            col1_l, col2_l, col3_l = st.columns(3)
+            with col1_l:
+                st.metric(label="💰 Total Biaya Pesan + Simpan", value=f"Rp {float(lot.total_biaya):,.0f}")
+            with col2_l:
+                st.metric(label="🚚 Jumlah Pesanan per Tahun", value=f"{int(lot.jumlah_pesanan)} kali")
+            with col3_l:
+                st.metric(label="📉 Hemat vs Pesan Tiap Bulan", value=f"Rp {biaya_tiap_bulan - float(lot.total_biaya):,.0f}")
+            tampilkan_grafik('eoq_ukuran_lot', (permintaan, S, H / 12, BULAN), grafik_ukuran_lot)
+            st.caption("Jadwal Wagner-Whitin: setiap pesanan menutup permintaan beberapa bulan berikutnya "
+                       "sehingga total biaya pesan dan simpan minimum, tanpa kehabisan stok.")
+
+            st.markdown("**Diskon Kuantitas dari Pemasok**")
+            col_a, col_b = st.columns(2)
+            with col_a:
+                batas_1 = st.number_input("Diskon 1 berlaku mulai (kg)", min_value=1, value=300, step=50)
+                diskon_1 = st.slider("Diskon 1 (%)", 0, 30, 3)
+            with col_b:
+                batas_2 = st.number_input("Diskon 2 berlaku mulai (kg)", min_value=batas_1 + 1, value=max(600, batas_1 + 1), step=50)
+                diskon_2 = st.slider("Diskon 2 (%)", 0, 30, 5)
+            batas = (0, batas_1, batas_2)
+            tarif = (harga, harga * (1 - diskon_1 / 100), harga * (1 - diskon_2 / 100))
+            with ambil_profiler().fase('compute'):
+                # Biaya simpan dinyatakan sebagai persentase harga: i = H / harga
+                hasil_diskon = {jenis: eoq_diskon(D, S, H / harga, batas, tarif, jenis)
+                                for jenis in ('seluruh_unit', 'inkremental')}
+            for kolom, (jenis, judul) in zip(st.columns(2), (('seluruh_unit', 'Diskon Seluruh Unit'),
+                                                            ('inkremental', 'Diskon Inkremental'))):
+                d = hasil_diskon[jenis]
+                with kolom:
+                    st.metric(label=f"🏷️ {judul}: Kuantitas Pesanan", value=f"{float(d.Q):,.0f} kg",
+                              help=f"Harga rata-rata Rp {float(d.harga_rata):,.0f} per kg")
+                    st.metric(label="💰 Total Biaya Tahunan (termasuk pembelian)", value=f"Rp {float(d.total_biaya):,.0f}")
+
+        # Ini code untuk EOQ banyak SKU dengan kendala gudang dan anggaran bersama
+        st.markdown("#### Multi-Item dengan Kendala Gudang & Anggaran")
+        if st.toggle("Hitung EOQ untuk banyak SKU sekaligus", value=False, key="eoq_multi"):
+            berkas = st.file_uploader("Data SKU (CSV dengan kolom D, S, H, ruang, harga)", type="csv")
+            if berkas is not None:
+                data = np.genfromtxt(berkas, delimiter=',', names=True, dtype=float, encoding='utf-8')
+                sku = {k: np.atleast_1d(data[k]) for k in ('D', 'S', 'H', 'ruang', 'harga')}
+            else:
+                sku = contoh_sku(500)
+                st.caption("Menggunakan 500 SKU contoh; unggah CSV untuk data sendiri.")
+            bebas = hitung_eoq(sku['D'], sku['S'], sku['H'], lead_time, safety_stock)
+            ruang_bebas = float(sku['ruang'] @ bebas.eoq)
+            anggaran_bebas = float(sku['harga'] @ bebas.eoq)
+            col_a, col_b = st.columns(2)
+            with col_a:
+                kapasitas = st.number_input("Kapasitas Gudang (m³)", min_value=1.0, value=float(round(0.6 * ruang_bebas)),
+                                            help=f"Tanpa kendala, EOQ memakai {ruang_bebas:,.0f} m³.")
+            with col_b:
+                anggaran = st.number_input("Anggaran Pembelian per Pesanan (Rp)", min_value=1.0,
+                                           value=float(round(0.8 * anggaran_bebas)),
+                                           help=f"Tanpa kendala, EOQ membutuhkan Rp {anggaran_bebas:,.0f}.")
+
+            with ambil_profiler().fase('compute'):
+                multi = eoq_terkendala(sku['D'], sku['S'], sku['H'], sku['ruang'], kapasitas, sku['harga'], anggaran,
+                                       lead_time=lead_time, safety_stock=safety_stock)
+            total_multi, total_bebas = multi.total_biaya.sum(), bebas.total_biaya.sum()
+            col1_m, col2_m, col3_m = st.columns(3)
+            with col1_m:
+                st.metric(label="💰 Total Biaya Tahunan", value=f"Rp {total_multi:,.0f}",
+                          delta=f"Rp {total_multi - total_bebas:,.0f} vs tanpa kendala", delta_color="inverse")
+            with col2_m:
+                st.metric(label="📦 Harga Bayangan Ruang", value=f"Rp {multi.harga_bayangan_ruang:,.0f} /m³",
+                          help="Penghematan biaya tahunan jika kapasitas gudang ditambah 1 m³.")
+            with col3_m:
+                st.metric(label="🏦 Harga Bayangan Anggaran", value=f"Rp {multi.harga_bayangan_anggaran:,.3f} /Rp",
+                          help="Penghematan biaya tahunan per tambahan Rp 1 anggaran pembelian.")
+            st.caption(f"Ruang terpakai {multi.pemakaian_ruang:,.0f} dari {kapasitas:,.0f} m³; "
+                       f"anggaran terpakai Rp {multi.pemakaian_anggaran:,.0f} dari Rp {anggaran:,.0f}.")
+            tabel = {'Q': multi.Q, 'EOQ tanpa kendala': multi.Q_bebas, 'ROP': multi.rop, 'Total biaya': multi.total_biaya}
+            st.dataframe(tabel, height=250)
+            st.download_button("Unduh hasil (CSV)", data=tabel_csv(tabel), file_name="eoq_multi_item.csv", mime="text/csv")
+
 # --- TAB 3: MODEL ANTRIAN ---
+@st.fragment
+@diprofilkan('antrian')
+@grafik_menyusul
 def model_antrian():
     st.header("⏳ Analisis Sistem Antrian")
     st.subheader("Studi Kasus: Drive-Thru 'Ayam Goreng Juara' saat Jam Sibuk")
     
     col1, col2 = st.columns([1.5, 2])
+    # Bagian jam sibuk dan jadwal petugas selalu tampil di bawah kedua kolom, juga saat kondisi tunak tidak stabil
+    bagian_harian = st.container()
     
     with col1:
         st.markdown("""
@@ -352,10 +652,13 @@ def model_antrian():
         
         with st.container(border=True):
             st.subheader("📈 Parameter Sistem")
-            lmbda = st.slider("Tingkat Kedatangan (λ - mobil/jam)", 1, 100, 30)
-            mu = st.slider("Tingkat Pelayanan (μ - mobil/jam)", 1, 100, 35)
+            lmbda = st.slider("Tingkat Kedatangan (λ - mobil/jam)", 1, 100, 30, key="antrian_lmbda")
+            mu = st.slider("Tingkat Pelayanan (μ - mobil/jam)", 1, 100, 35, key="antrian_mu")
+            c = st.slider("Jumlah Jalur Layanan (c - server)", 1, 10, 1, help="Lebih dari satu jalur menggunakan model M/M/c (Erlang C).", key="antrian_c")
             
-        with st.expander("Penjelasan Rumus Model: Antrian M/M/1"):
+        panel_skenario('antrian', ('antrian_lmbda', 'antrian_mu', 'antrian_c'))
+
+        with st.expander("Penjelasan Rumus Model: Antrian M/M/1 dan M/M/c"):
             st.markdown("""
             Model antrian M/M/1 digunakan untuk menganalisis sistem dengan satu server (pelayan). Model ini membantu kita memahami metrik kinerja utama:
             - **Utilisasi (ρ):** Seberapa sibuk server? Nilai mendekati 100% berarti sangat sibuk dan berisiko antrian panjang.
@@ -367,19 +670,34 @@ def model_antrian():
             # Rumus yang digunakan
             st.markdown("**Variabel:** $\lambda$ (Tingkat Kedatangan), $\mu$ (Tingkat Pelayanan)")
             st.latex(r''' \rho = \frac{\lambda}{\mu} \quad | \quad L = \frac{\rho}{1 - \rho} \quad | \quad W = \frac{L}{\lambda} ''')
+            st.markdown("Untuk $c$ jalur layanan paralel (M/M/c), peluang pelanggan harus menunggu dihitung dengan rumus **Erlang C**:")
+            st.latex(r''' \rho = \frac{\lambda}{c\mu} \quad | \quad L_q = C(c, \tfrac{\lambda}{\mu}) \frac{\rho}{1 - \rho} \quad | \quad W_q = \frac{L_q}{\lambda} ''')
             
-        if mu <= lmbda:
-            st.error("Tingkat pelayanan (μ) harus lebih besar dari tingkat kedatangan (λ) agar antrian stabil.")
+        if mu * c <= lmbda:
+            st.error("Kapasitas pelayanan (c × μ) harus lebih besar dari tingkat kedatangan (λ) agar antrian stabil. "
+                     "Kelebihan beban yang hanya sementara dapat dianalisis di bagian Analisis Jam Sibuk.")
+            with bagian_harian:
+                tampilkan_jam_sibuk(lmbda, mu, c)
+                tampilkan_jadwal_staf(lmbda, mu)
             return
         
-        rho = lmbda / mu; L = rho / (1 - rho); Lq = (rho**2) / (1 - rho); W = L / lmbda; Wq = Lq / lmbda
+        with ambil_profiler().fase('compute'):
+            hasil = hitung_mmc(lmbda, mu, c)
+            rho, L, Lq, W, Wq = (float(v) for v in (hasil.rho, hasil.L, hasil.Lq, hasil.W, hasil.Wq))
         
         with st.expander("Lihat Proses Perhitungan"):
-            st.latex(fr"\rho = \frac{{{lmbda}}}{{{mu}}} = {rho:.2f} \quad (Utilisasi)")
-            st.latex(fr"L = \frac{{{rho:.2f}}}{{1 - {rho:.2f}}} = {L:.2f} \text{{ mobil di sistem}}")
-            st.latex(fr"L_q = \frac{{{rho:.2f}^2}}{{1 - {rho:.2f}}} = {Lq:.2f} \text{{ mobil di antrian}}")
-            st.latex(fr"W = \frac{{{L:.2f}}}{{{lmbda}}} = {W:.3f} \text{{ jam, atau }} {W*60:.2f} \text{{ menit}}")
-            st.latex(fr"W_q = \frac{{{Lq:.2f}}}{{{lmbda}}} = {Wq:.3f} \text{{ jam, atau }} {Wq*60:.2f} \text{{ menit}}")
+            if c > 1:
+                st.latex(fr"\rho = \frac{{{lmbda}}}{{{c} \times {mu}}} = {rho:.2f} \quad (Utilisasi)")
+                st.latex(fr"C({c}, {lmbda/mu:.2f}) = {float(hasil.prob_tunggu):.4f} \quad (Peluang menunggu)")
+                st.latex(fr"L_q = {float(hasil.prob_tunggu):.4f} \times \frac{{{rho:.2f}}}{{1 - {rho:.2f}}} = {Lq:.2f} \text{{ mobil di antrian}}")
+                st.latex(fr"W_q = \frac{{{Lq:.2f}}}{{{lmbda}}} = {Wq:.3f} \text{{ jam, atau }} {Wq*60:.2f} \text{{ menit}}")
+                st.latex(fr"W = W_q + \frac{{1}}{{{mu}}} = {W:.3f} \text{{ jam}} \quad | \quad L = \lambda W = {L:.2f} \text{{ mobil di sistem}}")
+            else:
+                st.latex(fr"\rho = \frac{{{lmbda}}}{{{mu}}} = {rho:.2f} \quad (Utilisasi)")
+                st.latex(fr"L = \frac{{{rho:.2f}}}{{1 - {rho:.2f}}} = {L:.2f} \text{{ mobil di sistem}}")
+                st.latex(fr"L_q = \frac{{{rho:.2f}^2}}{{1 - {rho:.2f}}} = {Lq:.2f} \text{{ mobil di antrian}}")
+                st.latex(fr"W = \frac{{{L:.2f}}}{{{lmbda}}} = {W:.3f} \text{{ jam, atau }} {W*60:.2f} \text{{ menit}}")
+                st.latex(fr"W_q = \frac{{{Lq:.2f}}}{{{lmbda}}} = {Wq:.3f} \text{{ jam, atau }} {Wq*60:.2f} \text{{ menit}}")
 
     with col2:
         st.subheader("💡 Hasil dan Wawasan Bisnis")
@@ -406,36 +724,11 @@ def model_antrian():
         # Ini code untuk membuat grafik visualisasi kinerja antrian    
         st.markdown("#### Visualisasi Kinerja Antrian")
         
-        fig1, ax1 = plt.subplots(figsize=(8, 4))
-        waktu_pelayanan_menit = (1/mu) * 60
-        waktu_tunggu_menit = Wq * 60
-        labels = ['Waktu Menunggu di Antrian', 'Waktu Dilayani']
-        sizes = [waktu_tunggu_menit, waktu_pelayanan_menit]
-        colors = ['#ff6347','#90ee90']
-        explode = (0.1, 0)
-        
-        ax1.pie(sizes, explode=explode, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
-        ax1.axis('equal')
-        ax1.set_title("Bagaimana Pelanggan Menghabiskan Waktunya?")
-        st.pyplot(fig1)
+        tampilkan_grafik('antrian_waktu', (lmbda, mu, c), grafik_waktu_antrian)
 
         # Ini code untuk membuat grafik visualisasi probabilitas panjang antrian
         st.markdown("#### Probabilitas Panjang Antrian")
-        n_values = np.arange(0, 15)
-        p_n_values = [(1 - rho) * (rho ** n) for n in n_values]
-        
-        fig2, ax2 = plt.subplots(figsize=(10, 4))
-        ax2.bar(n_values, p_n_values, color='skyblue')
-        for i, v in enumerate(p_n_values):
-            ax2.text(i, v, f"{v:.1%}", ha='center', va='bottom', fontsize=9)
-
-        ax2.set_xlabel('Jumlah Mobil dalam Sistem (n)')
-        ax2.set_ylabel('Probabilitas P(n)')
-        ax2.set_title('Seberapa Mungkin Antrian Menjadi Panjang?')
-        ax2.set_xticks(n_values)
-        ax2.grid(True, axis='y', linestyle='--')
-        ax2.set_yticklabels([])
-        st.pyplot(fig2)
+        tampilkan_grafik('antrian_pn', (lmbda, mu, c), grafik_pn_antrian, klien_pn_antrian)
 
         with st.container(border=True):
             st.markdown("**🔍 Penjelasan Grafik:**")
@@ -443,8 +736,170 @@ def model_antrian():
             - **Grafik Pie:** Membagi total waktu pelanggan menjadi dua bagian: waktu yang dihabiskan untuk benar-benar dilayani (hijau) dan waktu yang terbuang untuk menunggu dalam antrian (merah). Persentase waktu tunggu yang besar menandakan pengalaman pelanggan yang buruk.
             - **Grafik Batang:** Menunjukkan probabilitas (kemungkinan) ada sejumlah mobil di dalam sistem. Jika bar di sebelah kanan (misalnya, 5 mobil atau lebih) memiliki nilai yang signifikan, itu berarti antrian panjang sering terjadi.
             """)
+
+        # Ini code untuk analisis sensitivitas waktu tunggu terhadap parameter
+        tampilkan_sensitivitas('antrian', {'lmbda': lmbda, 'mu': mu, 'c': c},
+                               {'lmbda': 'Tingkat Kedatangan λ (mobil/jam)', 'mu': 'Tingkat Pelayanan μ (mobil/jam)',
+                                'c': 'Jumlah Jalur Layanan c'},
+                               'Wq', 'Waktu Tunggu di Antrian Wq (jam)', ('lmbda', 'mu'), batas={'c': (1, 10)})
+
+        # Ini code untuk validasi dengan simulasi kejadian diskrit
+        st.markdown("#### Simulasi Kejadian Diskrit")
+        if st.toggle("Bandingkan dengan simulasi (waktu layanan tidak harus eksponensial)", value=False):
+            cv_layanan = st.number_input("Koefisien Variasi Waktu Layanan", min_value=0.0, value=1.0, step=0.1,
+                                         help="1 = eksponensial (sesuai M/M/c), 0 = waktu layanan konstan.")
+            layanan = distribusi_layanan(mu, cv_layanan)
+            with ambil_profiler().fase('compute'):
+                sim = memo('antrian_simulasi', (lmbda, mu, c, cv_layanan),
+                           lambda: replikasi_antrian(n_replikasi=5, laju_kedatangan=lmbda, layanan=layanan, c=c,
+                                                     n_pelanggan=20_000))
+            col1_sim, col2_sim = st.columns(2)
+            with col1_sim:
+                bawah, atas = sim['Wq']['ci95']
+                st.metric(label="⏳ Waktu Tunggu Simulasi (Wq)", value=f"{sim['Wq']['rata']*60:.2f} menit",
+                          help=f"Interval kepercayaan 95%: {bawah*60:.2f} – {atas*60:.2f} menit")
+            with col2_sim:
+                st.metric(label="⏳ Persentil ke-95 Waktu Tunggu", value=f"{sim['Wq_kuantil']['rata']*60:.2f} menit")
+            st.caption(f"Hasil 5 replikasi × 20.000 pelanggan. Nilai analitik M/M/{c}: Wq = {Wq*60:.2f} menit.")
+            tampilkan_grafik('antrian_jejak', (lmbda, mu, c, cv_layanan, 20_000), grafik_jejak_antrian, klien_jejak_antrian)
+
+    with bagian_harian:
+        tampilkan_jam_sibuk(lmbda, mu, c)
+        tampilkan_jadwal_staf(lmbda, mu)
             
+# Ini code untuk analisis jam sibuk: λ(t) dan c(t) berubah, antrian boleh melebihi kapasitas sementara
+def tampilkan_jam_sibuk(lmbda, mu, c):
+    st.markdown("#### Analisis Jam Sibuk (Transien)")
+    if not st.toggle("Hitung antrian sepanjang hari dengan kedatangan dan jumlah jalur yang berubah", value=False,
+                     key="antrian_transien"):
+        return
+    # Profil awal: sepi di malam hari, puncak makan siang melebihi kapasitas, lalu puncak makan malam
+    puncak = max(lmbda, round(1.25 * c * mu))
+    profil = st.data_editor({
+        'Jam Mulai': [0.0, 6.0, 11.0, 12.0, 12.5, 14.0, 18.0, 21.0],
+        'λ (mobil/jam)': [round(f * lmbda, 1) for f in (0.1, 0.5, 1.0)] + [float(puncak)]
+                         + [round(f * lmbda, 1) for f in (1.0, 0.6, 1.1, 0.3)],
+        'Jalur (c)': [c] * 8,
+    }, num_rows="dynamic", hide_index=True, key="antrian_profil",
+        column_config={'Jam Mulai': st.column_config.NumberColumn(min_value=0.0, max_value=23.99, step=0.25),
+                       'λ (mobil/jam)': st.column_config.NumberColumn(min_value=0.0),
+                       'Jalur (c)': st.column_config.NumberColumn(min_value=1, max_value=20, step=1)})
+    baris = sorted((float(j), float(l), int(k)) for j, l, k in zip(*profil.values())
+                   if j is not None and l is not None and k is not None)
+    if not baris or baris[0][0] > 0:
+        st.error("Profil harus memiliki baris yang dimulai pada jam 0.")
+        return
+    jam, profil_lambda, profil_c = (tuple(v) for v in zip(*baris))
+
+    with ambil_profiler().fase('compute'):
+        dt = 1 / 60
+        hasil = memo('antrian_transien', (jam, profil_lambda, profil_c, mu),
+                     lambda: antrian_transien(profil_sepotong(jam, profil_lambda, dt, 24),
+                                              profil_sepotong(jam, profil_c, dt, 24), mu, dt))
+        per_menit = profil_sepotong(jam, profil_lambda, dt, 24) > profil_sepotong(jam, profil_c, dt, 24) * mu
+    terpanjang = int(np.argmax(hasil.Lq))
+    terlama = int(np.argmax(hasil.Wq))
+    format_jam = lambda t: f"{int(t):02d}:{round(t % 1 * 60):02d}"
+    col1_t, col2_t, col3_t = st.columns(3)
+    with col1_t:
+        st.metric(label="🚗 Antrian Terpanjang (rata-rata)", value=f"{hasil.Lq[terpanjang]:.1f} mobil",
+                  help=f"Terjadi sekitar pukul {format_jam(hasil.t[terpanjang])}.")
+    with col2_t:
+        st.metric(label="⏳ Waktu Tunggu Terlama", value=f"{hasil.Wq[terlama] * 60:.1f} menit",
+                  help=f"Bagi mobil yang tiba sekitar pukul {format_jam(hasil.t[terlama])}.")
+    with col3_t:
+        st.metric(label="⏳ Rata-rata Waktu Tunggu Harian", value=f"{hasil.Wq_rata * 60:.1f} menit",
+                  help="Dirata-ratakan atas seluruh mobil yang datang dalam sehari.")
+    st.caption(f"Kedatangan melebihi kapasitas (λ > c·μ) selama {int(per_menit.sum())} menit. "
+               f"Distribusi jumlah mobil dihitung per menit dengan uniformisasi rantai lahir-mati "
+               f"(dipotong pada {hasil.K} mobil; peluang terpotong maksimum {hasil.massa_batas:.1e}).")
+    tampilkan_grafik('antrian_transien', (jam, profil_lambda, profil_c, mu), grafik_antrian_transien,
+                     klien_antrian_transien)
+
+# Ini code untuk jumlah petugas minimum per jam dan penyusunan shift dari prakiraan mingguan
+def tampilkan_jadwal_staf(lmbda, mu):
+    st.markdown("#### Penjadwalan Petugas Mingguan")
+    if not st.toggle("Susun jadwal shift dari prakiraan kedatangan 168 jam", value=False, key="antrian_staf"):
+        return
+    col_a, col_b, col_c, col_d = st.columns(4)
+    with col_a:
+        batas_menit = st.number_input("Batas Waktu Tunggu (menit)", min_value=0.0, value=3.0, step=0.5)
+    with col_b:
+        batas_peluang = st.slider("Maks. Mobil Menunggu Lebih Lama (%)", 1, 50, 10) / 100
+    with col_c:
+        panjang_shift = st.selectbox("Panjang Shift", ((8,), (4,), (4, 8)),
+                                     format_func=lambda p: ' atau '.join(map(str, p)) + ' jam')
+    with col_d:
+        n_toko = st.number_input("Jumlah Toko", min_value=1, max_value=300, value=1,
+                                 help="Toko lain memakai pola yang sama dengan skala kedatangan berbeda.")
+
+    with ambil_profiler().fase('compute'):
+        prakiraan = prakiraan_mingguan(lmbda, n_toko)
+        kebutuhan = kebutuhan_server(prakiraan, mu, batas_menit / 60, batas_peluang)
+        jadwal = jadwal_shift(kebutuhan.server, panjang_shift)
+    col1_s, col2_s, col3_s = st.columns(3)
+    with col1_s:
+        st.metric(label="👷 Total Jam Petugas per Minggu", value=f"{int(jadwal.jam_kerja.sum()):,} jam",
+                  help=f"Untuk {n_toko} toko; toko pertama {int(jadwal.jam_kerja[0]):,} jam.")
+    with col2_s:
+        st.metric(label="📈 Kelebihan Cakupan", value=f"{jadwal.kelebihan.sum() / max(kebutuhan.server.sum(), 1):.1%}",
+                  help="Jam petugas di atas kebutuhan minimum karena shift harus berurutan.")
+    with col3_s:
+        st.metric(label="🚗 Jalur Maksimum Toko Pertama", value=f"{int(kebutuhan.server[0].max())} jalur")
+    st.caption(f"Kebutuhan dihitung per jam dengan M/M/c agar paling banyak {batas_peluang:.0%} mobil menunggu "
+               f"lebih dari {batas_menit:g} menit; shift disusun dengan model covering bilangan bulat "
+               f"yang meminimalkan total jam kerja.")
+    tampilkan_grafik('antrian_staf', (tuple(kebutuhan.server[0].tolist()), tuple(jadwal.cakupan[0].tolist()), HARI),
+                     grafik_jadwal_staf)
+    toko, shift = np.nonzero(jadwal.jumlah)
+    tabel = {'toko': toko + 1, 'hari': jadwal.shift_mulai[shift] // 24 + 1, 'jam_mulai': jadwal.shift_mulai[shift] % 24,
+             'panjang': jadwal.shift_panjang[shift], 'petugas': jadwal.jumlah[toko, shift]}
+    st.download_button("Unduh jadwal shift (CSV)", data=tabel_csv(tabel), file_name="jadwal_shift.csv", mime="text/csv")
+
+# Ini code untuk alokasi mesin redundan paralel dengan anggaran modal
+def tampilkan_redundansi(reliabilities):
+    st.markdown("#### Alokasi Mesin Redundan")
+    if not st.toggle("Optimalkan penambahan mesin cadangan paralel dengan anggaran modal", value=False,
+                     key="keandalan_redundansi"):
+        return
+    biaya = st.data_editor({
+        'Mesin': list(reliabilities),
+        'Biaya Unit (Rp juta)': [BIAYA_UNIT_MESIN.get(nama, 100.0) for nama in reliabilities],
+    }, hide_index=True, disabled=['Mesin'], key="keandalan_biaya_unit",
+        column_config={'Biaya Unit (Rp juta)': st.column_config.NumberColumn(min_value=0.0, step=10.0)})
+    anggaran = st.number_input("Anggaran Modal (Rp juta)", min_value=0.0, value=300.0, step=50.0,
+                               key="keandalan_anggaran")
+    biaya_unit = tuple(float(b or 0.0) for b in biaya['Biaya Unit (Rp juta)'])
+    keandalan_mesin = tuple(reliabilities.values())
+    # Frontier dihitung sampai dua kali anggaran agar terlihat manfaat tambahan anggaran
+    anggaran_maks = max(2 * anggaran, max(biaya_unit, default=0.0), 1.0)
+
+    with ambil_profiler().fase('compute'):
+        hasil = memo('keandalan_redundansi', (keandalan_mesin, biaya_unit, anggaran_maks),
+                     lambda: alokasi_redundansi(keandalan_mesin, biaya_unit, anggaran_maks))
+        terpilih = int(np.searchsorted(hasil.frontier_biaya, anggaran, side='right')) - 1
+        unit = hasil.frontier_unit[terpilih]
+        awal = float(hasil.frontier_keandalan[0])
+        akhir = float(hasil.frontier_keandalan[terpilih])
+    col1_r, col2_r = st.columns(2)
+    with col1_r:
+        st.metric(label="📈 Keandalan Setelah Redundansi", value=f"{akhir:.2%}", delta=f"{akhir - awal:+.2%}")
+    with col2_r:
+        st.metric(label="💰 Anggaran Terpakai", value=f"Rp {hasil.frontier_biaya[terpilih]:,.0f} juta",
+                  help=f"Dari anggaran Rp {anggaran:,.0f} juta.")
+    st.dataframe({'Mesin': list(reliabilities), 'Unit Paralel': unit,
+                  'Keandalan Tahap': 1 - (1 - np.array(keandalan_mesin)) ** unit},
+                 hide_index=True, column_config={'Keandalan Tahap': st.column_config.NumberColumn(format="%.4f")})
+    st.caption(f"Alokasi optimal dihitung dengan program dinamis atas tahap mesin; satu kali perhitungan "
+               f"memberi {hasil.frontier_biaya.size} titik frontier Pareto untuk setiap anggaran "
+               f"sampai Rp {anggaran_maks:,.0f} juta.")
+    tampilkan_grafik('keandalan_redundansi', (keandalan_mesin, biaya_unit, anggaran, anggaran_maks),
+                     grafik_frontier_redundansi)
+
 # --- TAB 4: KEANDALAN LINI PRODUKSI ---
+@st.fragment
+@diprofilkan('keandalan')
+@grafik_menyusul
 def model_keandalan_produksi():
     st.header("🔗 Analisis Keandalan Lini Produksi")
     st.subheader("Studi Kasus: Lini Perakitan Otomotif 'Nusantara Motor'")
@@ -459,11 +914,13 @@ def model_keandalan_produksi():
         
         with st.container(border=True):
             st.subheader("🔧 Keandalan per Mesin")
-            r1 = st.slider("Stamping (R1)", 0.80, 1.00, 0.98, 0.01)
-            r2 = st.slider("Welding (R2)", 0.80, 1.00, 0.99, 0.01)
-            r3 = st.slider("Painting (R3)", 0.80, 1.00, 0.96, 0.01)
-            r4 = st.slider("Assembly (R4)", 0.80, 1.00, 0.97, 0.01)
+            r1 = st.slider("Stamping (R1)", 0.80, 1.00, 0.98, 0.01, key="keandalan_r1")
+            r2 = st.slider("Welding (R2)", 0.80, 1.00, 0.99, 0.01, key="keandalan_r2")
+            r3 = st.slider("Painting (R3)", 0.80, 1.00, 0.96, 0.01, key="keandalan_r3")
+            r4 = st.slider("Assembly (R4)", 0.80, 1.00, 0.97, 0.01, key="keandalan_r4")
         
+        panel_skenario('keandalan', ('keandalan_r1', 'keandalan_r2', 'keandalan_r3', 'keandalan_r4'))
+
         with st.expander("Penjelasan Rumus Model: Keandalan Sistem Seri"):
             st.markdown("""
             Keandalan sistem seri dihitung dengan mengalikan keandalan dari setiap komponennya.
@@ -475,14 +932,20 @@ def model_keandalan_produksi():
             st.latex(r''' R_s = R_1 \times R_2 \times \dots \times R_n = \prod_{i=1}^{n} R_i ''')
 
         reliabilities = {'Stamping': r1, 'Welding': r2, 'Painting': r3, 'Assembly': r4}
-        keandalan_sistem = np.prod(list(reliabilities.values()))
-        weakest_link_name = min(reliabilities, key=reliabilities.get)
-        weakest_link_value = reliabilities[weakest_link_name]
+        with ambil_profiler().fase('compute'):
+            hasil = keandalan_struktur(seri(*reliabilities), reliabilities)
+            keandalan_sistem = float(hasil.keandalan)
+            # Mata rantai terlemah = mesin dengan kepentingan Birnbaum terbesar (dR_s/dR_i)
+            weakest_link_name = max(hasil.birnbaum, key=lambda nama: float(hasil.birnbaum[nama]))
+            weakest_link_value = reliabilities[weakest_link_name]
         
         with st.expander("Lihat Proses Perhitungan"):
             st.latex(fr"R_s = R_{{Stamping}} \times R_{{Welding}} \times R_{{Painting}} \times R_{{Assembly}}")
             st.latex(fr"R_s = {r1} \times {r2} \times {r3} \times {r4} = {keandalan_sistem:.4f}")
             st.markdown(f"**Keandalan Sistem ($R_s$)** adalah **{keandalan_sistem:.2%}**.")
+            st.markdown("**Kepentingan Birnbaum** $I_B(i) = \\partial R_s / \\partial R_i$, yaitu kenaikan keandalan lini per kenaikan keandalan mesin:")
+            for nama, nilai in hasil.birnbaum.items():
+                st.markdown(f"- {nama}: {float(nilai):.4f}")
 
     with col2:
         st.subheader("💡 Hasil dan Wawasan Bisnis")
@@ -507,53 +970,90 @@ def model_keandalan_produksi():
         # Ini code untuk membuat grafik visualisasi dampak keandalan komponen
         st.markdown("#### Visualisasi Dampak Keandalan Komponen")
         
-        labels = list(reliabilities.keys())
-        values = list(reliabilities.values())
-        labels.append("SISTEM TOTAL")
-        values.append(keandalan_sistem)
-        
-        fig, ax = plt.subplots(figsize=(10, 5))
-        
-        bar_colors = ['#87CEEB'] * len(reliabilities)
-        weakest_idx = list(reliabilities.keys()).index(weakest_link_name)
-        bar_colors[weakest_idx] = '#FF6347'
-        bar_colors.append('#9370DB')
-
-        bars = ax.bar(labels, values, color=bar_colors)
-        
-        ax.set_ylabel('Tingkat Keandalan (Reliability)')
-        ax.set_title('Perbandingan Keandalan Komponen dan Sistem', fontsize=16)
-        ax.set_ylim(min(0.75, min(values) * 0.95 if values else 0.75), 1.01)
-
-        for bar in bars:
-            yval = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2.0, yval, f'{yval:.2%}', ha='center', va='bottom', fontsize=10, color='black')
-            
-        st.pyplot(fig)
+        tampilkan_grafik('keandalan', (tuple(reliabilities), tuple(reliabilities.values())), grafik_keandalan)
         
         with st.container(border=True):
             st.markdown("**🔍 Penjelasan Grafik:**")
             st.markdown("""
             Grafik ini menunjukkan bagaimana keandalan setiap mesin mempengaruhi keandalan seluruh lini produksi.
-            - **Bar Biru & Merah:** Menunjukkan keandalan setiap mesin. Bar **merah** adalah mesin dengan keandalan terendah, yang menjadi **mata rantai terlemah**.
+            - **Bar Biru & Merah:** Menunjukkan keandalan setiap mesin. Bar **merah** adalah mesin dengan kepentingan Birnbaum terbesar, yang menjadi **mata rantai terlemah**.
             - **Bar Ungu:** Menunjukkan keandalan total sistem. Perhatikan bagaimana nilainya selalu **lebih rendah** dari komponen terlemah sekalipun.
             
             **Kesimpulan:** Dalam sistem seri, keandalan keseluruhan sangat dipengaruhi oleh komponen yang paling tidak andal. Meningkatkan keandalan 'mata rantai terlemah' akan memberikan dampak terbesar pada peningkatan keandalan seluruh lini produksi.
             """)
 
+        # Ini code untuk analisis sensitivitas keandalan sistem terhadap keandalan mesin
+        tampilkan_sensitivitas('keandalan', reliabilities, {nama: f'Keandalan {nama}' for nama in reliabilities},
+                               'keandalan', 'Keandalan Sistem', ('Stamping', 'Painting'),
+                               batas={nama: (0.0, 1.0) for nama in reliabilities})
+
+        tampilkan_redundansi(reliabilities)
+
 # --- KONTROL TAB UTAMA ---
 st.header("Pilih Model Matematika", divider='rainbow')
-tab1, tab2, tab3, tab4 = st.tabs([
+# Secara default hanya tab yang sedang dibuka yang dihitung dan dirender.
+# Setiap model adalah fragment, sehingga perubahan widget hanya menjalankan
+# ulang model tersebut. MODE_TAB=semua mengembalikan perilaku lama.
+tab_lazy = os.environ.get("MODE_TAB", "lazy") != "semua"
+tabs = st.tabs([
     "📊 Optimasi Produksi", 
     "📦 Model Persediaan", 
     "⏳ Model Antrian", 
     "🔗 Keandalan Lini Produksi"
-])
+], key="tab_model", on_change="rerun" if tab_lazy else "ignore")
+
+for tab, jalankan_model in zip(tabs, [optimasi_produksi, model_persediaan, model_antrian, model_keandalan_produksi]):
+    with tab:
+        if not tab_lazy or tab.open:
+            jalankan_model()
+
+# --- PANEL ADMIN: PROFIL KINERJA ---
+# Diletakkan setelah tab agar memuat durasi rerun ini; rerun fragment saja tidak memperbarui panel
+if ambil_profiler().aktif:
+    with st.sidebar:
+        with st.expander("🛠️ Panel Admin: Profil Kinerja", expanded=False):
+            profiler = ambil_profiler()
+            ringkasan = profiler.ringkasan()
+            if ringkasan:
+                st.dataframe([{'Tab': r['tab'], 'Fase': r['fase'], 'n': r['n'], 'p50 (ms)': round(r['p50_ms'], 2),
+                               'p90 (ms)': round(r['p90_ms'], 2), 'p99 (ms)': round(r['p99_ms'], 2)}
+                              for r in ringkasan], hide_index=True)
+            else:
+                st.caption("Belum ada data. Buka salah satu tab untuk mulai mengukur.")
+            st.caption("compute = perhitungan model, plot = menunggu grafik dari kolam render, "
+                       "emit = pemanggilan elemen Streamlit (metric, latex, image).")
+            kolam = ambil_kolam_render().statistik()
+            st.caption(f"Kolam render: {kolam['pekerja']} pekerja, antrean {kolam['kedalaman_antrean']}; "
+                       f"{kolam['dikirim']} dikirim, {kolam['digabung']} digabung, {kolam['langsung']} dirender langsung.")
+            tujuan = [p for p in (profiler.path_jsonl, profiler.path_prometheus) if p]
+            if tujuan:
+                st.caption(f"Ekspor setiap {profiler.interval_ekspor:.0f} detik ke: {', '.join(tujuan)}")
+                if st.button("Ekspor sekarang", key="profil_ekspor"):
+                    profiler.ekspor()
 
-with tab1: optimasi_produksi()
-with tab2: model_persediaan()
-with tab3: model_antrian()
-with tab4: model_keandalan_produksi()
+# --- GUDANG SKENARIO: STATISTIK, IMPOR & EKSPOR ---
+if ambil_gudang() is not None:
+    with st.sidebar:
+        with st.expander("💾 Gudang Skenario", expanded=False):
+            gudang = ambil_gudang()
+            stat = gudang.statistik()
+            st.caption(f"{stat['skenario']} skenario, {stat['jumlah']} hasil "
+                       f"({stat['ukuran_byte'] / 1024**2:.1f} / {stat['batas_byte'] / 1024**2:.0f} MB), versi {stat['versi']}. "
+                       f"Rasio hit {stat['rasio_hit']:.0%} ({stat['hit']} hit, {stat['miss']} miss, {stat['eviksi']} dibuang).")
+            if st.button("Siapkan berkas ekspor", key="gudang_ekspor"):
+                berkas = io.StringIO()
+                gudang.ekspor(berkas)
+                st.download_button("Unduh skenario.jsonl", berkas.getvalue(), file_name="skenario.jsonl",
+                                   mime="application/jsonl", key="gudang_unduh")
+            unggahan = st.file_uploader("Impor skenario (.jsonl)", type=["jsonl"], key="gudang_impor")
+            if unggahan is not None and st.button("Impor", key="gudang_impor_tombol"):
+                try:
+                    n = gudang.impor(io.TextIOWrapper(unggahan, encoding="utf-8"))
+                    st.success(f"{n} baris diimpor.")
+                except (ValueError, KeyError) as e:
+                    st.error(f"Berkas tidak valid: {e}")
+            if st.button("Hapus hasil versi lama", key="gudang_bersihkan"):
+                gudang.bersihkan(hanya_versi_lama=True)
 
 # --- FOOTER ---
 st.divider()
@@ -0,0 +1,235 @@
+"""Benchmark mikro dan makro untuk setiap model dan jalur grafik.
+
+Setiap benchmark diukur pada beberapa ukuran masukan. Hasil disimpan
+sebagai JSON; ketika dibandingkan dengan baseline, benchmark yang melambat
+melebihi ambang (bawaan 20%) membuat proses keluar dengan kode 1.
+
+Contoh::
+
+    python benchmark/kinerja.py --simpan-baseline benchmark/baseline.json
+    python benchmark/kinerja.py --bandingkan benchmark/baseline.json --ambang 0.2
+    python benchmark/kinerja.py --filter antrian --ulang 10
+
+Ambang per benchmark dapat ditulis di baseline sebagai
+``"ambang": {"nama_benchmark": 0.5}``.
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+
+AKAR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, AKAR)
+
+import numpy as np  # noqa: E402
+
+from model_matematika import (  # noqa: E402
+    optimasi_lp_2d, LPInkremental, hitung_eoq, kurva_biaya, siklus_persediaan, wagner_whitin, eoq_diskon,
+    hitung_mmc, distribusi_pn_mmc, profil_sepotong, antrian_transien,
+    kebutuhan_server, jadwal_shift, keandalan_struktur, seri, alokasi_redundansi,
+)
+from tampilan import encode_figure  # noqa: E402
+from tampilan.grafik import (  # noqa: E402
+    grafik_lp, grafik_biaya_eoq, grafik_siklus_persediaan,
+    grafik_waktu_antrian, grafik_pn_antrian, grafik_keandalan,
+)
+
+AMBANG_DEFAULT = 0.2
+WAKTU_MIN_SAMPEL = 0.05
+
+
+def _acak(n, rendah, tinggi, seed):
+    return np.random.default_rng(seed).uniform(rendah, tinggi, n)
+
+
+def daftar_benchmark():
+    """Kembalikan dict nama -> fungsi tanpa argumen yang diukur."""
+    bench = {}
+
+    # --- Optimasi produksi: penyelesaian titik sudut LP ---
+    for n in (1, 1_000, 100_000):
+        p = dict(profit_meja=_acak(n, 1e5, 1e6, 1), profit_kursi=_acak(n, 1e5, 5e5, 2),
+                 jam_meja=_acak(n, 1, 10, 3), jam_kursi=_acak(n, 1, 5, 4),
+                 kayu_meja=_acak(n, 1, 6, 5), kayu_kursi=_acak(n, 1, 3, 6),
+                 total_jam=_acak(n, 100, 400, 7), total_kayu=_acak(n, 50, 200, 8))
+        bench[f'lp.titik_sudut[n={n}]'] = lambda p=p: optimasi_lp_2d(**p)
+    # Perubahan satu ruas kanan / koefisien tujuan di dalam rentang optimalitas (tanpa pivot)
+    rng = np.random.default_rng(11)
+    A = rng.uniform(0, 1, (200, 200)) * (rng.random((200, 200)) < 0.05)
+    lp = LPInkremental(_acak(200, 1, 5, 12), A, _acak(200, 50, 100, 13), ub=100.0)
+    bench['lp.inkremental_b[m=200]'] = lambda lp=lp: lp.ubah_b(7, lp.b[7])
+    bench['lp.inkremental_c[n=200]'] = lambda lp=lp: lp.ubah_c(7, lp.c[7])
+    bench['lp.grafik'] = lambda: encode_figure(grafik_lp(6.0, 2.0, 4.0, 1.5, 240, 120, 20, 40))
+
+    # --- Persediaan: kurva biaya EOQ dan siklus persediaan ---
+    for n_titik in (100, 10_000):
+        bench[f'eoq.kurva_biaya[titik={n_titik}]'] = (
+            lambda n_titik=n_titik: kurva_biaya(1200, 500000, 25000, 219.09, n_titik=n_titik))
+    for n_siklus in (2, 200):
+        bench[f'eoq.siklus[siklus={n_siklus}]'] = (
+            lambda n_siklus=n_siklus: siklus_persediaan(219.09, 10, 3.33, 65.7, n_siklus=n_siklus))
+    for n in (1, 100_000):
+        D, H = _acak(n, 100, 20000, 9), _acak(n, 1000, 30000, 10)
+        bench[f'eoq.hitung[n={n}]'] = lambda D=D, H=H: hitung_eoq(D, 500000, H, 14, 10)
+    for n_sku, periode in ((1, 365), (1_000, 365), (100, 3_650)):
+        d = np.random.default_rng(13).poisson(20, (n_sku, periode)).astype(float)
+        bench[f'eoq.wagner_whitin[sku={n_sku},periode={periode}]'] = lambda d=d: wagner_whitin(d, 800.0, 0.5)
+    for jenis in ('seluruh_unit', 'inkremental'):
+        D = _acak(100_000, 100, 20000, 14)
+        bench[f'eoq.diskon[{jenis},n=100000]'] = lambda D=D, jenis=jenis: eoq_diskon(
+            D, 500000, 0.2, (0, 300, 600, 1200), (150000, 145500, 142500, 139500), jenis)
+    bench['eoq.grafik_biaya'] = lambda: encode_figure(grafik_biaya_eoq(1200, 500000, 25000))
+    bench['eoq.grafik_siklus'] = lambda: encode_figure(grafik_siklus_persediaan(1200, 500000, 25000, 14, 10))
+
+    # --- Antrian: metrik dan distribusi p_n ---
+    for n in (1, 100_000):
+        lmbda = _acak(n, 1, 30, 11)
+        bench[f'antrian.mmc[n={n}]'] = lambda lmbda=lmbda: hitung_mmc(lmbda, 35.0, 2)
+    for n_max in (14, 1_000):
+        bench[f'antrian.pn[n_max={n_max}]'] = lambda n_max=n_max: distribusi_pn_mmc(30.0, 35.0, 1, n_max=n_max)
+    # Satu hari per menit dengan puncak makan siang di atas kapasitas
+    jam = (0, 6, 11, 12, 12.5, 14, 18, 21)
+    for nama, beban in (('normal', (3, 15, 30, 45, 30, 18, 33, 8)), ('kewalahan', (8, 40, 80, 80, 80, 48, 88, 24))):
+        profil_lambda = profil_sepotong(jam, beban, 1 / 60, 24)
+        bench[f'antrian.transien[{nama},langkah=1440]'] = (
+            lambda profil_lambda=profil_lambda: antrian_transien(profil_lambda, 1, 35.0, 1 / 60))
+    # Satu minggu (168 jam) untuk seluruh jaringan toko: kebutuhan server lalu jadwal shift
+    pola = np.interp(np.arange(168) % 24, (0, 6, 11, 12, 13, 14, 18, 20, 22, 24),
+                     (0.1, 0.5, 1.0, 1.6, 1.3, 0.7, 1.2, 0.9, 0.2, 0.1))
+    prakiraan = 30 * pola * _acak(300, 0.5, 1.5, 15)[:, None]
+    bench['antrian.kebutuhan_server[toko=300,jam=168]'] = (
+        lambda prakiraan=prakiraan: kebutuhan_server(prakiraan, 35.0, 3 / 60, 0.1))
+    server = kebutuhan_server(prakiraan, 35.0, 3 / 60, 0.1).server
+    for panjang in ((8,), (4, 8)):
+        bench[f'antrian.jadwal_shift[toko=300,shift={panjang}]'] = (
+            lambda panjang=panjang: jadwal_shift(server, panjang))
+    bench['antrian.grafik_waktu'] = lambda: encode_figure(grafik_waktu_antrian(30, 35, 1))
+    bench['antrian.grafik_pn'] = lambda: encode_figure(grafik_pn_antrian(30, 35, 1))
+
+    # --- Keandalan: produk seri dan grafik batang ---
+    for n in (4, 100, 1_000):
+        nama = [f'M{i}' for i in range(n)]
+        R = dict(zip(nama, _acak(n, 0.9, 1.0, 12)))
+        bench[f'keandalan.seri[mesin={n}]'] = lambda nama=nama, R=R: keandalan_struktur(seri(*nama), R)
+    # Alokasi redundansi: DP (frontier penuh) untuk lini kecil, greedy untuk ratusan tahap
+    r_lini, biaya_lini = _acak(500, 0.9, 0.999, 16), np.round(_acak(500, 10, 200, 17))
+    for n, metode in ((4, 'dp'), (50, 'dp'), (500, 'greedy')):
+        bench[f'keandalan.redundansi_{metode}[mesin={n}]'] = (
+            lambda n=n, metode=metode: alokasi_redundansi(r_lini[:n], biaya_lini[:n], 40.0 * n, metode=metode))
+    bench['keandalan.grafik'] = lambda: encode_figure(
+        grafik_keandalan(('Stamping', 'Welding', 'Painting', 'Assembly'), (0.98, 0.99, 0.96, 0.97)))
+
+    # --- Makro: rerun skrip penuh lewat AppTest (grafik sudah di-cache setelah run pertama) ---
+    bench['app.rerun_penuh[tab=semua]'] = _rerun_app('semua')
+    bench['app.rerun_penuh[tab=lazy]'] = _rerun_app('lazy')
+    return bench
+
+
+def _rerun_app(mode_tab):
+    state = {}
+
+    def jalankan():
+        if 'at' not in state:
+            from streamlit.testing.v1 import AppTest
+            os.environ['MODE_TAB'] = mode_tab
+            state['at'] = AppTest.from_file(os.path.join(AKAR, 'app.py'), default_timeout=300)
+            state['at'].run()
+        os.environ['MODE_TAB'] = mode_tab
+        at = state['at']
+        at.run()
+        if at.exception:
+            raise RuntimeError([e.value for e in at.exception])
+    # Pemanasan dilakukan oleh pengukur sebelum sampel pertama
+    return jalankan
+
+
+def ukur(fungsi, ulang):
+    """Waktu per panggilan: jumlah panggilan per sampel dikalibrasi >= WAKTU_MIN_SAMPEL."""
+    fungsi()  # pemanasan (impor malas, cache, JIT numpy)
+    jumlah = 1
+    while True:
+        awal = time.perf_counter()
+        for _ in range(jumlah):
+            fungsi()
+        durasi = time.perf_counter() - awal
+        if durasi >= WAKTU_MIN_SAMPEL or jumlah >= 1_000_000:
+            break
+        jumlah *= 2 if durasi == 0 else max(2, int(WAKTU_MIN_SAMPEL / durasi * 1.2))
+    sampel = [durasi / jumlah]
+    for _ in range(ulang - 1):
+        awal = time.perf_counter()
+        for _ in range(jumlah):
+            fungsi()
+        sampel.append((time.perf_counter() - awal) / jumlah)
+    return {'min_detik': min(sampel), 'median_detik': statistics.median(sampel),
+            'panggilan_per_sampel': jumlah, 'sampel_detik': sampel}
+
+
+def bandingkan(hasil, baseline, ambang):
+    """Daftar (nama, lama, baru, rasio, ambang) untuk benchmark yang melambat melewati ambang."""
+    ambang_khusus = baseline.get('ambang', {})
+    regresi = []
+    for nama, baru in hasil.items():
+        lama = baseline['hasil'].get(nama)
+        if lama is None:
+            continue
+        batas = ambang_khusus.get(nama, ambang)
+        rasio = baru['min_detik'] / lama['min_detik']
+        if rasio > 1 + batas:
+            regresi.append((nama, lama['min_detik'], baru['min_detik'], rasio, batas))
+    return regresi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ulang', type=int, default=5, help='jumlah sampel per benchmark')
+    parser.add_argument('--filter', help='regex nama benchmark yang dijalankan')
+    parser.add_argument('--keluaran', help='tulis hasil JSON ke berkas ini')
+    parser.add_argument('--simpan-baseline', help='tulis hasil sebagai baseline baru')
+    parser.add_argument('--bandingkan', help='baseline JSON pembanding')
+    parser.add_argument('--ambang', type=float, default=AMBANG_DEFAULT,
+                        help='perlambatan relatif maksimum sebelum gagal (bawaan: 0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    bench = daftar_benchmark()
+    if args.filter:
+        bench = {k: v for k, v in bench.items() if re.search(args.filter, k)}
+
+    hasil = {}
+    for nama, fungsi in bench.items():
+        hasil[nama] = ukur(fungsi, args.ulang)
+        print(f"{nama:40s} {hasil[nama]['min_detik'] * 1e3:10.3f} ms", file=sys.stderr)
+
+    laporan = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'ulang': args.ulang,
+        'hasil': hasil,
+    }
+    for path in (args.keluaran, args.simpan_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(laporan, f, indent=2)
+                f.write('\n')
+
+    if args.bandingkan:
+        with open(args.bandingkan, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regresi = bandingkan(hasil, baseline, args.ambang)
+        if regresi:
+            print("\nREGRESI KINERJA:", file=sys.stderr)
+            for nama, lama, baru, rasio, batas in regresi:
+                print(f"  {nama}: {lama * 1e3:.3f} ms -> {baru * 1e3:.3f} ms "
+                      f"(+{(rasio - 1):.0%}, ambang {batas:.0%})", file=sys.stderr)
+            return 1
+        print(f"\nTidak ada regresi melebihi ambang ({len(hasil)} benchmark).", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
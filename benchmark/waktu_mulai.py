@@ -0,0 +1,121 @@
+"""Benchmark waktu mulai dashboard: waktu impor dan waktu render pertama.
+
+Setiap pengukuran dijalankan di proses Python baru agar mencerminkan biaya
+yang dibayar oleh setiap proses server atau replika baru. Hasil ditulis
+sebagai JSON sehingga dapat dibandingkan antar rilis.
+
+Contoh::
+
+    python benchmark/waktu_mulai.py --ulang 5 --keluaran hasil_mulai.json
+    python benchmark/waktu_mulai.py --cache-font-dingin
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+AKAR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Setiap potongan kode mencetak durasi (detik) bagian yang diukur
+PENGUKURAN = {
+    'impor_mesin': """
+import time; t = time.perf_counter()
+import model_matematika
+print(time.perf_counter() - t)
+""",
+    'impor_app': """
+import time; t = time.perf_counter()
+import streamlit, model_matematika, tampilan, tampilan.grafik
+print(time.perf_counter() - t)
+""",
+    'impor_matplotlib': """
+from tampilan.backend import muat_matplotlib
+import time; t = time.perf_counter()
+muat_matplotlib()
+print(time.perf_counter() - t)
+""",
+    'grafik_pertama': """
+from tampilan import encode_figure
+from tampilan.grafik import grafik_lp
+import time; t = time.perf_counter()
+encode_figure(grafik_lp(6.0, 2.0, 4.0, 1.5, 240, 120, 20, 40))
+print(time.perf_counter() - t)
+""",
+    'render_pertama': """
+import time; t = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=300)
+at.run()
+assert not at.exception, [e.value for e in at.exception]
+print(time.perf_counter() - t)
+""",
+}
+
+
+def ukur(nama, env):
+    kode = PENGUKURAN[nama].format(app=os.path.join(AKAR, 'app.py'))
+    awal = time.perf_counter()
+    keluaran = subprocess.run([sys.executable, '-c', kode], cwd=AKAR, env=env, check=True,
+                              capture_output=True, text=True).stdout
+    total = time.perf_counter() - awal
+    return float(keluaran.strip().splitlines()[-1]), total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ulang', type=int, default=5, help='jumlah proses baru per pengukuran')
+    parser.add_argument('--keluaran', help='tulis hasil JSON ke berkas ini (bawaan: stdout)')
+    parser.add_argument('--cache-font-dingin', action='store_true',
+                        help='gunakan MPLCONFIGDIR kosong untuk setiap proses (mengukur pembuatan cache font)')
+    parser.add_argument('--pengukuran', nargs='+', choices=sorted(PENGUKURAN), default=list(PENGUKURAN))
+    args = parser.parse_args(argv)
+
+    hasil = {}
+    for nama in args.pengukuran:
+        sampel, sampel_proses = [], []
+        for _ in range(args.ulang):
+            env = dict(os.environ, PYTHONPATH=AKAR, PYTHONDONTWRITEBYTECODE='1')
+            with tempfile.TemporaryDirectory() as tmp:
+                if args.cache_font_dingin:
+                    env['MPLCONFIGDIR'] = tmp
+                durasi, total = ukur(nama, env)
+            sampel.append(durasi)
+            sampel_proses.append(total)
+        hasil[nama] = {
+            'median_detik': statistics.median(sampel),
+            'min_detik': min(sampel),
+            'median_proses_detik': statistics.median(sampel_proses),
+            'sampel_detik': sampel,
+        }
+        print(f"{nama:16s} median {hasil[nama]['median_detik'] * 1000:8.1f} ms "
+              f"(proses {hasil[nama]['median_proses_detik'] * 1000:8.1f} ms)", file=sys.stderr)
+
+    versi = {}
+    for modul in ('numpy', 'matplotlib', 'streamlit'):
+        try:
+            versi[modul] = __import__(modul).__version__
+        except ImportError:
+            versi[modul] = None
+    laporan = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'versi': versi,
+        'ulang': args.ulang,
+        'cache_font_dingin': args.cache_font_dingin,
+        'hasil': hasil,
+    }
+    teks = json.dumps(laporan, indent=2)
+    if args.keluaran:
+        with open(args.keluaran, 'w', encoding='utf-8') as f:
+            f.write(teks + '\n')
+    else:
+        print(teks)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Mesin komputasi model matematika industri tanpa ketergantungan Streamlit.
+
+Setiap fungsi menerima array parameter dan mengembalikan array hasil,
+sehingga dashboard hanya menjadi tampilan di atas modul ini.
+"""
+# Naikkan setiap kali hasil perhitungan berubah: kunci gudang skenario bergantung padanya
+__version__ = "1.0.0"
+
+from .produksi import HasilLP, optimasi_lp_2d, garis_kendala, optimasi_bauran_produksi
+from .simpleks import HasilSimpleks, HasilBnB, HasilSensitivitasLP, LPInkremental, selesaikan_lp, selesaikan_ilp
+from .persediaan import HasilEOQ, hitung_eoq, kurva_biaya, siklus_persediaan
+from .persediaan_multi import HasilEOQTerkendala, eoq_terkendala
+from .ukuran_lot import HasilUkuranLot, HasilEOQDiskon, wagner_whitin, eoq_diskon
+from .simulasi_persediaan import HasilSimulasiPersediaan, simulasi_persediaan, ringkasan_simulasi
+from .antrian import (
+    HasilAntrian, HasilAntrianMultiServer, hitung_mm1, distribusi_pn,
+    erlang_b, erlang_c, hitung_mmc, hitung_mmck, hitung_mg1, prob_tunggu_lebih, distribusi_pn_mmc,
+)
+from .antrian_transien import HasilAntrianTransien, profil_sepotong, antrian_transien
+from .penjadwalan import HasilKebutuhanServer, HasilJadwalShift, kebutuhan_server, daftar_shift, jadwal_shift
+from .simulasi_antrian import (
+    Distribusi, Welford, KuantilP2, HasilSimulasiAntrian, simulasi_antrian, replikasi_antrian,
+)
+from .keandalan import (
+    HasilKeandalan, keandalan_seri,
+    HasilStruktur, StrukturTerlaluBesar, seri, paralel, k_dari_n, jaringan, komponen_struktur, keandalan_struktur,
+)
+from .redundansi import HasilRedundansi, alokasi_redundansi
+from .gudang_skenario import GudangSkenario, kunci_skenario
+from .sensitivitas import HasilSapuan, HasilTornado, sapuan, analisis_tornado, bersihkan_cache_sapuan
+
+__all__ = [
+    "HasilLP", "optimasi_lp_2d", "garis_kendala", "optimasi_bauran_produksi",
+    "HasilSimpleks", "HasilBnB", "HasilSensitivitasLP", "LPInkremental", "selesaikan_lp", "selesaikan_ilp",
+    "HasilEOQ", "hitung_eoq", "kurva_biaya", "siklus_persediaan",
+    "HasilEOQTerkendala", "eoq_terkendala",
+    "HasilUkuranLot", "HasilEOQDiskon", "wagner_whitin", "eoq_diskon",
+    "HasilSimulasiPersediaan", "simulasi_persediaan", "ringkasan_simulasi",
+    "HasilAntrian", "HasilAntrianMultiServer", "hitung_mm1", "distribusi_pn",
+    "erlang_b", "erlang_c", "hitung_mmc", "hitung_mmck", "hitung_mg1", "prob_tunggu_lebih", "distribusi_pn_mmc",
+    "HasilAntrianTransien", "profil_sepotong", "antrian_transien",
+    "HasilKebutuhanServer", "HasilJadwalShift", "kebutuhan_server", "daftar_shift", "jadwal_shift",
+    "Distribusi", "Welford", "KuantilP2", "HasilSimulasiAntrian", "simulasi_antrian", "replikasi_antrian",
+    "HasilKeandalan", "keandalan_seri",
+    "HasilStruktur", "StrukturTerlaluBesar", "seri", "paralel", "k_dari_n", "jaringan", "komponen_struktur",
+    "keandalan_struktur",
+    "HasilRedundansi", "alokasi_redundansi",
+    "GudangSkenario", "kunci_skenario",
+    "HasilSapuan", "HasilTornado", "sapuan", "analisis_tornado", "bersihkan_cache_sapuan",
+]
@@ -0,0 +1,6 @@
+"""Titik masuk ``python -m model_matematika`` untuk evaluasi batch."""
+import sys
+
+from .batch import main
+
+sys.exit(main())
@@ -0,0 +1,189 @@
+"""Model antrian M/M/1, M/M/c, M/M/c/K, dan M/G/1.
+
+Semua fungsi menerima skalar atau array NumPy yang dapat di-broadcast.
+Skenario yang tidak stabil (lambda >= c * mu) menghasilkan NaN.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+
+class HasilAntrian(NamedTuple):
+    stabil: np.ndarray
+    rho: np.ndarray   # utilisasi
+    L: np.ndarray     # rata-rata pelanggan di sistem
+    Lq: np.ndarray    # rata-rata pelanggan di antrian
+    W: np.ndarray     # rata-rata waktu di sistem (satuan waktu lambda)
+    Wq: np.ndarray    # rata-rata waktu tunggu di antrian
+
+
+def hitung_mm1(lmbda, mu):
+    """Hitung rho, L, Lq, W, dan Wq untuk setiap pasangan (lambda, mu)."""
+    lmbda, mu = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float))
+    stabil = (mu > lmbda) & (lmbda > 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho = lmbda / mu
+        L = np.where(stabil, rho / (1 - rho), np.nan)
+        Lq = np.where(stabil, rho ** 2 / (1 - rho), np.nan)
+        W = L / lmbda
+        Wq = Lq / lmbda
+    return HasilAntrian(stabil=stabil, rho=rho, L=L, Lq=Lq, W=W, Wq=Wq)
+
+
+def distribusi_pn(rho, n_max=14):
+    """Probabilitas P(n) = (1 - rho) rho^n untuk n = 0..n_max, dihitung per skenario.
+
+    Hasil berbentuk (..., n_max + 1).
+    """
+    rho = np.asarray(rho, dtype=float)[..., None]
+    n_values = np.arange(n_max + 1)
+    return (1 - rho) * rho ** n_values
+
+
+class HasilAntrianMultiServer(NamedTuple):
+    stabil: np.ndarray
+    rho: np.ndarray          # utilisasi per server
+    prob_tunggu: np.ndarray  # peluang pelanggan harus menunggu (M/M/c: Erlang C)
+    prob_blokir: np.ndarray  # peluang pelanggan ditolak karena sistem penuh (M/M/c/K)
+    lambda_efektif: np.ndarray
+    L: np.ndarray
+    Lq: np.ndarray
+    W: np.ndarray
+    Wq: np.ndarray
+
+
+def _log_faktorial(n_maks):
+    """Tabel log(n!) untuk n = 0..n_maks."""
+    return np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, n_maks + 1)))])
+
+
+def erlang_b(a, c):
+    """Peluang blokir Erlang B untuk beban a = lambda/mu dan c server.
+
+    Menggunakan rekursi B(k) = a B(k-1) / (k + a B(k-1)) yang stabil secara
+    numerik (tidak ada a^c atau c!), dengan biaya O(c) per titik grid.
+    """
+    a, c = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(c))
+    B = np.ones(a.shape)
+    c_maks = int(c.max(initial=0))
+    seragam = np.all(c == c_maks)
+    for k in range(1, c_maks + 1):
+        baru = a * B / (k + a * B)
+        B = baru if seragam else np.where(k <= c, baru, B)
+    return B
+
+
+def erlang_c(a, c):
+    """Peluang menunggu Erlang C; bernilai 1 bila sistem tidak stabil (a >= c)."""
+    a, c = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(c))
+    B = erlang_b(a, c)
+    rho = a / c
+    with np.errstate(divide='ignore', invalid='ignore'):
+        C = B / (1 - rho * (1 - B))
+    return np.where(rho < 1, C, 1.0)
+
+
+def hitung_mmc(lmbda, mu, c):
+    """Metrik antrian M/M/c untuk grid (lambda, mu, c) dalam satu panggilan."""
+    lmbda, mu, c = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float),
+                                       np.asarray(c, dtype=np.int64))
+    a = lmbda / mu
+    rho = a / c
+    stabil = (rho < 1) & (lmbda > 0)
+    C = erlang_c(a, c)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Wq = np.where(stabil, C / (c * mu - lmbda), np.nan)
+        Lq = lmbda * Wq
+        W = Wq + 1 / mu
+        L = lmbda * W
+    return HasilAntrianMultiServer(stabil=stabil, rho=rho, prob_tunggu=C, prob_blokir=np.zeros_like(rho),
+                                   lambda_efektif=lmbda, L=L, Lq=Lq, W=W, Wq=Wq)
+
+
+def prob_tunggu_lebih(lmbda, mu, c, t):
+    """P(Wq > t) untuk M/M/c, t dalam satuan waktu yang sama dengan 1/lambda."""
+    lmbda, mu, c, t = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float),
+                                          np.asarray(c, dtype=np.int64), np.asarray(t, dtype=float))
+    C = erlang_c(lmbda / mu, c)
+    laju = c * mu - lmbda
+    return np.where(laju > 0, C * np.exp(-np.maximum(laju, 0) * t), 1.0)
+
+
+def distribusi_pn_mmc(lmbda, mu, c, n_max=14):
+    """P(n) untuk M/M/c pada n = 0..n_max, bentuk hasil (..., n_max + 1).
+
+    Dihitung di ruang log dari P(c) = C (1 - rho), sehingga aman untuk c besar.
+    Untuk c = 1 hasilnya sama dengan :func:`distribusi_pn`.
+    """
+    lmbda, mu, c = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float),
+                                       np.asarray(c, dtype=np.int64))
+    a = lmbda / mu
+    rho = a / c
+    n = np.arange(n_max + 1)
+    log_fakt = _log_faktorial(max(int(c.max(initial=0)), n_max))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_pc = np.log(erlang_c(a, c) * (1 - rho))
+        cc, aa, rr = c[..., None], a[..., None], rho[..., None]
+        # n < c: P(n) = P(c) c! / (n! a^(c-n));  n >= c: P(n) = P(c) rho^(n-c)
+        log_bawah = log_fakt[cc] - log_fakt[np.minimum(n, cc)] - (cc - n) * np.log(aa)
+        log_atas = (n - cc) * np.log(rr)
+        log_pn = log_pc[..., None] + np.where(n < cc, log_bawah, log_atas)
+    return np.where((rho < 1)[..., None], np.exp(log_pn), np.nan)
+
+
+def hitung_mmck(lmbda, mu, c, K):
+    """Metrik antrian M/M/c/K (kapasitas sistem K >= c) untuk grid parameter.
+
+    Distribusi stasioner dinormalisasi dengan log-sum-exp atas n = 0..K,
+    sehingga berlaku juga untuk rho >= 1 tanpa overflow.
+    """
+    lmbda, mu, c, K = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float),
+                                          np.asarray(c, dtype=np.int64), np.asarray(K, dtype=np.int64))
+    if np.any(K < c):
+        raise ValueError("Kapasitas K harus >= jumlah server c")
+    a = lmbda / mu
+    rho = a / c
+    K_maks = int(K.max(initial=0))
+    n = np.arange(K_maks + 1)
+    log_fakt = _log_faktorial(K_maks)
+    cc, KK, aa, rr = c[..., None], K[..., None], a[..., None], rho[..., None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_c = cc * np.log(aa) - log_fakt[cc]
+        log_w = np.where(n <= cc, n * np.log(aa) - log_fakt[n], log_c + (n - cc) * np.log(rr))
+    log_w = np.where(n <= KK, log_w, -np.inf)
+    log_w = np.where(np.isnan(log_w), -np.inf, log_w)
+    log_w[..., 0] = 0.0
+    maks = log_w.max(axis=-1, keepdims=True)
+    w = np.exp(log_w - maks)
+    pn = w / w.sum(axis=-1, keepdims=True)
+
+    prob_blokir = np.take_along_axis(pn, KK, axis=-1)[..., 0]
+    lambda_efektif = lmbda * (1 - prob_blokir)
+    L = (pn * n).sum(axis=-1)
+    Lq = (pn * np.maximum(n - cc, 0)).sum(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        W = L / lambda_efektif
+        Wq = Lq / lambda_efektif
+    prob_tunggu = (pn * ((n >= cc) & (n < KK))).sum(axis=-1) / np.maximum(1 - prob_blokir, 1e-300)
+    return HasilAntrianMultiServer(stabil=np.ones(rho.shape, dtype=bool), rho=rho, prob_tunggu=prob_tunggu,
+                                   prob_blokir=prob_blokir, lambda_efektif=lambda_efektif,
+                                   L=L, Lq=Lq, W=W, Wq=Wq)
+
+
+def hitung_mg1(lmbda, mu, cv_layanan=1.0):
+    """Metrik antrian M/G/1 dengan rumus Pollaczek-Khinchine.
+
+    ``cv_layanan`` adalah koefisien variasi waktu layanan (simpangan baku
+    dibagi rata-rata); nilai 1 memberikan hasil M/M/1, nilai 0 memberikan M/D/1.
+    """
+    lmbda, mu, cv = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float),
+                                        np.asarray(cv_layanan, dtype=float))
+    stabil = (mu > lmbda) & (lmbda > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho = lmbda / mu
+        Lq = np.where(stabil, rho ** 2 * (1 + cv ** 2) / (2 * (1 - rho)), np.nan)
+        Wq = Lq / lmbda
+        W = Wq + 1 / mu
+        L = lmbda * W
+    return HasilAntrian(stabil=stabil, rho=rho, L=L, Lq=Lq, W=W, Wq=Wq)
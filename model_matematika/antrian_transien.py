@@ -0,0 +1,154 @@
+"""Antrian M/M/c(t) transien dengan laju kedatangan lambda(t) yang berubah sepanjang hari.
+
+Jumlah pelanggan di sistem dimodelkan sebagai rantai lahir-mati yang
+dipotong pada kapasitas K. Selama satu langkah waktu dt, laju kedatangan dan
+jumlah server dianggap tetap, sehingga distribusi berpindah lewat matriks
+transisi ``exp(Q dt)``. Perpindahan ini dihitung dengan uniformisasi langsung
+pada vektor distribusi memakai perkalian tridiagonal, sehingga biayanya
+O(K x jumlah suku) per langkah tanpa membentuk matriks padat. Bobot Poisson
+hanya dihitung sekali untuk setiap pasangan (lambda, c) yang berbeda, jadi
+profil per menit sama murahnya dengan profil per jam.
+
+Tidak ada syarat stabilitas: lambda boleh melebihi c * mu selama periode
+sibuk, antrian hanya tumbuh lalu terurai kembali.
+"""
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+# Uniformisasi dipecah bila lambda_uniform * dt melebihi nilai ini agar bobot Poisson tidak underflow
+MAKS_LAJU_LANGKAH = 20.0
+
+
+class HasilAntrianTransien(NamedTuple):
+    t: np.ndarray              # (T + 1,) waktu sejak awal profil (satuan waktu lambda)
+    p: np.ndarray              # (T + 1, K + 1) distribusi jumlah pelanggan di sistem
+    L: np.ndarray              # rata-rata pelanggan di sistem
+    Lq: np.ndarray             # rata-rata pelanggan di antrian
+    prob_tunggu: np.ndarray    # peluang pelanggan yang tiba harus menunggu (PASTA)
+    Wq: np.ndarray             # perkiraan waktu tunggu pelanggan yang tiba pada t
+    Wq_rata: float             # rata-rata Wq tertimbang jumlah kedatangan
+    massa_batas: float         # peluang terbesar berada di state K (galat pemotongan)
+    K: int
+
+
+def profil_sepotong(jam_mulai, nilai, dt, durasi):
+    """Nilai per langkah dari profil tangga: ``nilai[i]`` berlaku mulai ``jam_mulai[i]``."""
+    jam_mulai = np.asarray(jam_mulai, dtype=float)
+    n_langkah = int(round(durasi / dt))
+    awal_langkah = np.arange(n_langkah) * dt
+    idx = np.searchsorted(jam_mulai, awal_langkah + 1e-9 * dt, side='right') - 1
+    return np.asarray(nilai, dtype=float)[np.clip(idx, 0, len(jam_mulai) - 1)]
+
+
+def _kali_tridiagonal(v, bawah, tengah, atas):
+    """Hitung v @ P untuk P tridiagonal (bawah[j] = P[j+1, j], atas[j] = P[j, j+1])."""
+    hasil = v * tengah
+    hasil[..., :-1] += v[..., 1:] * bawah
+    hasil[..., 1:] += v[..., :-1] * atas
+    return hasil
+
+
+def _uniformisasi(lmbda, c, mu, dt, K):
+    """Diagonal P = I + Q / laju dan bobot Poisson untuk satu langkah dt dengan (lambda, c) tetap."""
+    n = np.arange(K + 1)
+    lahir = np.where(n < K, lmbda, 0.0)
+    mati = np.minimum(n, c) * mu
+    laju = lmbda + c * mu
+    if laju <= 0:
+        return None
+    n_bagi = max(1, math.ceil(laju * dt / MAKS_LAJU_LANGKAH))
+    a = laju * dt / n_bagi
+
+    tengah = 1.0 - (lahir + mati) / laju
+    atas = lahir[:-1] / laju
+    bawah = mati[1:] / laju
+
+    bobot = [math.exp(-a)]
+    kumulatif = bobot[0]
+    while kumulatif < 1.0 - 1e-13 and len(bobot) < 10 * a + 51:
+        bobot.append(bobot[-1] * a / len(bobot))
+        kumulatif += bobot[-1]
+    return bawah, tengah, atas, bobot, n_bagi
+
+
+def _langkah(p, transisi):
+    """p @ exp(Q dt) lewat deret uniformisasi langsung pada vektor: O(K x suku) tanpa matriks padat."""
+    if transisi is None:
+        return p.copy()
+    bawah, tengah, atas, bobot, n_bagi = transisi
+    for _ in range(n_bagi):
+        suku = p
+        hasil = bobot[0] * suku
+        for w in bobot[1:]:
+            suku = _kali_tridiagonal(suku, bawah, tengah, atas)
+            hasil += w * suku
+        p = hasil
+    return p
+
+
+def _kapasitas_awal(lmbda, c, mu, dt, n_awal):
+    """Perkiraan K dari model fluida: antrian tumbuh sebesar (lambda - c mu) dt per langkah."""
+    s = n_awal + np.cumsum((lmbda - c * mu) * dt)
+    fluida = s - np.minimum(0.0, np.minimum.accumulate(s))
+    puncak = max(float(fluida.max(initial=0.0)), n_awal)
+    beban = float(np.max(lmbda / mu, initial=0.0))
+    return int(puncak + 10 * math.sqrt(puncak + beban + 1) + float(c.max(initial=1)) + 20)
+
+
+def antrian_transien(lmbda, c, mu, dt, n_awal=0, K=None, toleransi=1e-6, K_maks=4000):
+    """Distribusi jumlah pelanggan M/M/c(t) pada setiap akhir langkah waktu.
+
+    ``lmbda`` dan ``c`` berupa array per langkah (lihat :func:`profil_sepotong`);
+    ``mu`` adalah laju layanan per server. Bila ``K`` tidak diberikan, kapasitas
+    pemotongan diperkirakan lalu digandakan sampai peluang berada di state K
+    tidak melebihi ``toleransi`` (atau mencapai ``K_maks``).
+
+    ``Wq`` dihitung dengan anggapan jumlah server saat pelanggan tiba tetap
+    berlaku sampai ia dilayani: pelanggan yang melihat n >= c menunggu
+    (n - c + 1) penyelesaian layanan berlaju c * mu.
+    """
+    lmbda = np.asarray(lmbda, dtype=float).ravel()
+    c = np.broadcast_to(np.asarray(c, dtype=np.int64), lmbda.shape)
+    if np.any(c < 1):
+        raise ValueError("Jumlah server harus minimal 1 di setiap langkah")
+    otomatis = K is None
+    K = max(_kapasitas_awal(lmbda, c, mu, dt, n_awal), n_awal + 1) if otomatis else int(K)
+
+    while True:
+        hasil = _jalankan(lmbda, c, mu, dt, n_awal, K)
+        if not otomatis or hasil.massa_batas <= toleransi or K >= K_maks:
+            return hasil
+        K = min(2 * K, K_maks)
+
+
+def _jalankan(lmbda, c, mu, dt, n_awal, K):
+    T = lmbda.size
+    pasangan, indeks = np.unique(np.stack([lmbda, c.astype(float)], axis=1), axis=0, return_inverse=True)
+    transisi = [_uniformisasi(l, int(s), mu, dt, K) for l, s in pasangan]
+
+    p = np.empty((T + 1, K + 1))
+    p[0] = 0.0
+    p[0, n_awal] = 1.0
+    for k, i in enumerate(indeks.ravel()):
+        p[k + 1] = _langkah(p[k], transisi[i])
+
+    n = np.arange(K + 1)
+    # Server pada titik waktu k mengikuti langkah yang dimulai di titik itu (langkah terakhir untuk titik akhir)
+    c_titik = np.append(c, c[-1])[:, None] if T else np.ones((1, 1), dtype=np.int64)
+    lmbda_titik = np.append(lmbda, lmbda[-1]) if T else np.zeros(1)
+    antre = np.maximum(n - c_titik, 0)
+    L = p @ n
+    Lq = np.sum(p * antre, axis=1)
+    prob_tunggu = np.sum(p * (n >= c_titik), axis=1)
+    Wq = np.sum(p * np.where(n >= c_titik, n - c_titik + 1, 0), axis=1) / (c_titik[:, 0] * mu)
+
+    # Kedatangan selama langkah k dihampiri dengan rata-rata Wq di kedua ujung langkah
+    kedatangan = lmbda * dt
+    total = kedatangan.sum()
+    Wq_rata = float(kedatangan @ (0.5 * (Wq[:-1] + Wq[1:])) / total) if total > 0 else 0.0
+    return HasilAntrianTransien(
+        t=np.arange(T + 1) * dt, p=p, L=L, Lq=Lq, prob_tunggu=prob_tunggu, Wq=Wq, Wq_rata=Wq_rata,
+        massa_batas=float(p[:, K].max()), K=K,
+    )
@@ -0,0 +1,233 @@
+"""Evaluasi batch skenario dari berkas CSV/JSON-lines tanpa Streamlit.
+
+Berkas dibaca per chunk, setiap chunk dievaluasi sekaligus secara
+tervektorisasi, lalu hasilnya langsung ditulis sehingga memori tetap
+terbatas berapa pun ukuran berkasnya. Kolom yang bukan parameter model
+(misalnya kode SKU) disalin apa adanya ke keluaran.
+
+Contoh::
+
+    python -m model_matematika eoq skenario.csv -o hasil.csv
+    python -m model_matematika antrian toko.jsonl -o hasil.jsonl --proses 4
+"""
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .sensitivitas import MODEL
+
+UKURAN_CHUNK = 50_000
+
+# Nilai bawaan untuk parameter yang boleh tidak ada di berkas masukan
+NILAI_BAWAAN = {
+    'eoq': {'lead_time': 0.0, 'safety_stock': 0.0},
+    'antrian': {'c': 1.0},
+}
+
+PARAMETER = {
+    'lp': ('profit_meja', 'profit_kursi', 'jam_meja', 'jam_kursi', 'kayu_meja', 'kayu_kursi', 'total_jam', 'total_kayu'),
+    'eoq': ('D', 'S', 'H', 'lead_time', 'safety_stock'),
+    'antrian': ('lmbda', 'mu', 'c'),
+}
+
+
+def _format_berkas(path, format):
+    if format:
+        return format
+    return 'jsonl' if str(path).endswith(('.jsonl', '.ndjson', '.json')) else 'csv'
+
+
+def _ke_array(nilai, nama):
+    try:
+        return np.array([np.nan if v in ('', None) else v for v in nilai], dtype=float)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Kolom '{nama}' berisi nilai non-numerik: {e}") from None
+
+
+def parameter_model(model, kolom, komponen=None):
+    """Nama parameter model yang diambil dari kolom masukan."""
+    if model == 'keandalan':
+        # Setiap kolom tanpa awalan _ diperlakukan sebagai keandalan satu mesin seri
+        return tuple(komponen) if komponen else tuple(nama for nama in kolom if not nama.startswith('_'))
+    return PARAMETER[model]
+
+
+def evaluasi_chunk(model, chunk, komponen=None):
+    """Evaluasi satu chunk (dict kolom -> list nilai); kembalikan dict keluaran -> array."""
+    if model not in MODEL:
+        raise ValueError(f"Model tidak dikenal: {model}")
+    n = len(next(iter(chunk.values()))) if chunk else 0
+    bawaan = NILAI_BAWAAN.get(model, {})
+    parameter = {}
+    for nama in parameter_model(model, chunk, komponen):
+        if nama in chunk:
+            arr = _ke_array(chunk[nama], nama)
+            # Sel kosong (atau kunci JSON yang tidak ada) memakai nilai bawaan per baris
+            parameter[nama] = np.where(np.isnan(arr), bawaan[nama], arr) if nama in bawaan else arr
+        elif nama in bawaan:
+            parameter[nama] = np.full(n, bawaan[nama])
+        else:
+            raise KeyError(f"Kolom parameter '{nama}' tidak ada di berkas masukan")
+
+    # Baris dengan parameter wajib kosong tidak dievaluasi; seluruh keluarannya NaN
+    lengkap = np.ones(n, dtype=bool)
+    for arr in parameter.values():
+        lengkap &= ~np.isnan(arr)
+    if lengkap.all():
+        hasil = MODEL[model](**parameter)
+        return {k: np.broadcast_to(np.asarray(v, dtype=float), (n,)) for k, v in hasil.items()}
+    hasil = MODEL[model](**{nama: arr[lengkap] for nama, arr in parameter.items()})
+    keluaran = {}
+    for k, v in hasil.items():
+        keluaran[k] = np.full(n, np.nan)
+        keluaran[k][lengkap] = np.broadcast_to(np.asarray(v, dtype=float), (int(lengkap.sum()),))
+    return keluaran
+
+
+def _urai(baris, format_masukan, header):
+    if format_masukan == 'csv':
+        data = list(csv.reader(baris))
+        return {nama: list(nilai) for nama, nilai in zip(header, zip(*data))} if data else {}
+    rekaman = [json.loads(b) for b in baris if b.strip()]
+    kolom = dict.fromkeys(k for r in rekaman for k in r)
+    return {nama: [r.get(nama) for r in rekaman] for nama in kolom}
+
+
+def proses_blok(model, baris, header=None, format_masukan='csv', format_keluaran='csv',
+                komponen=None, presisi=10, dengan_header=False):
+    """Urai, evaluasi, dan format satu blok baris mentah menjadi teks keluaran.
+
+    Seluruh pekerjaan per blok terjadi di sini sehingga dapat dijalankan di
+    proses pekerja; proses utama hanya membaca baris dan menulis teks.
+    """
+    chunk = _urai(baris, format_masukan, header)
+    if not chunk:
+        return '', 0
+    hasil = evaluasi_chunk(model, chunk, komponen)
+    dipakai = set(parameter_model(model, chunk, komponen))
+    salinan = {k: v for k, v in chunk.items() if k not in dipakai}
+    n = len(next(iter(chunk.values())))
+
+    kolom = list(salinan) + [k for k in hasil if k not in salinan]
+    if format_keluaran == 'csv':
+        fmt = f'{{:.{presisi}g}}'.format
+        # Kolom angka tidak pernah perlu dikutip; kolom salinan dikutip bila perlu
+        nilai = [_kutip_csv(v) for v in salinan.values()]
+        nilai += [list(map(fmt, hasil[k].tolist())) for k in hasil if k not in salinan]
+        teks = '\n'.join(map(','.join, zip(*nilai))) + '\n'
+        if dengan_header:
+            teks = ','.join(_kutip_csv(kolom)) + '\n' + teks
+        return teks, n
+
+    buf = io.StringIO()
+    nilai = list(salinan.values()) + [hasil[k].tolist() for k in hasil if k not in salinan]
+    for baris_hasil in zip(*nilai):
+        # NaN bukan JSON yang valid; tulis sebagai null
+        rekaman = {k: (None if isinstance(v, float) and v != v else v) for k, v in zip(kolom, baris_hasil)}
+        buf.write(json.dumps(rekaman, ensure_ascii=False) + '\n')
+    return buf.getvalue(), n
+
+
+def _kutip_csv(nilai):
+    nilai = ['' if v is None else str(v) for v in nilai]
+    gabung = ''.join(nilai)
+    if any(c in gabung for c in ',"\r\n'):
+        return ['"' + v.replace('"', '""') + '"' if any(c in v for c in ',"\r\n') else v for v in nilai]
+    return nilai
+
+
+def _tugas(args):
+    return proses_blok(*args)
+
+
+def jalankan_batch(model, masukan, keluaran, format_masukan='csv', format_keluaran='csv',
+                   ukuran_chunk=UKURAN_CHUNK, n_proses=1, komponen=None, presisi=10):
+    """Alirkan ``masukan`` melalui ``model`` dan tulis hasilnya ke ``keluaran``.
+
+    Masukan dibaca per ``ukuran_chunk`` baris (satu rekaman per baris, jadi
+    sel CSV tidak boleh berisi baris baru). Dengan ``n_proses`` > 1, blok
+    diproses di beberapa proses; paling banyak ``2 * n_proses`` blok berada
+    di memori dan urutan baris keluaran sama dengan masukan. Mengembalikan
+    jumlah baris yang diproses.
+    """
+    header = None
+    if format_masukan == 'csv':
+        header = next(csv.reader([masukan.readline()]), None)
+        if header is None:
+            return 0
+
+    def blok():
+        for i, baris in enumerate(iter(lambda: list(itertools.islice(masukan, ukuran_chunk)), [])):
+            yield (model, baris, header, format_masukan, format_keluaran, komponen, presisi, i == 0)
+
+    n_baris = 0
+    if n_proses <= 1:
+        for tugas in blok():
+            teks, n = _tugas(tugas)
+            keluaran.write(teks)
+            n_baris += n
+        keluaran.flush()
+        return n_baris
+
+    with ProcessPoolExecutor(max_workers=n_proses) as pool:
+        antre = deque()
+        for tugas in blok():
+            antre.append(pool.submit(_tugas, tugas))
+            while len(antre) >= 2 * n_proses:
+                teks, n = antre.popleft().result()
+                keluaran.write(teks)
+                n_baris += n
+        while antre:
+            teks, n = antre.popleft().result()
+            keluaran.write(teks)
+            n_baris += n
+    keluaran.flush()
+    return n_baris
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m model_matematika',
+        description='Evaluasi model matematika industri untuk berkas skenario CSV/JSON-lines.',
+    )
+    parser.add_argument('model', choices=sorted(MODEL), help='model yang dijalankan')
+    parser.add_argument('masukan', help="berkas masukan, atau '-' untuk stdin")
+    parser.add_argument('-o', '--keluaran', default='-', help="berkas keluaran (bawaan: stdout)")
+    parser.add_argument('--format-masukan', choices=('csv', 'jsonl'), help='bawaan: menurut ekstensi berkas')
+    parser.add_argument('--format-keluaran', choices=('csv', 'jsonl'), help='bawaan: menurut ekstensi berkas')
+    parser.add_argument('--ukuran-chunk', type=int, default=UKURAN_CHUNK, help='jumlah baris per chunk')
+    parser.add_argument('--proses', type=int, default=1, help='jumlah proses paralel (bawaan: 1)')
+    parser.add_argument('--presisi', type=int, default=10, help='digit signifikan angka pada keluaran CSV (bawaan: 10)')
+    parser.add_argument('--komponen', nargs='+',
+                        help='kolom keandalan mesin untuk model keandalan (bawaan: semua kolom tanpa awalan _)')
+    args = parser.parse_args(argv)
+
+    format_masukan = _format_berkas(args.masukan, args.format_masukan)
+    format_keluaran = _format_berkas(args.keluaran, args.format_keluaran)
+    masukan = (io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='') if args.masukan == '-'
+               else open(args.masukan, encoding='utf-8', newline=''))
+    keluaran = (io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='', write_through=True)
+                if args.keluaran == '-' else open(args.keluaran, 'w', encoding='utf-8', newline=''))
+    try:
+        n = jalankan_batch(args.model, masukan, keluaran, format_masukan, format_keluaran,
+                           args.ukuran_chunk, args.proses, args.komponen, args.presisi)
+    except (KeyError, ValueError) as e:
+        parser.exit(2, f"error: {e.args[0] if e.args else e}\n")
+    except BrokenPipeError:
+        # Keluaran dipotong (mis. lewat `| head`); berhenti tanpa traceback
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        masukan.close()
+        if args.keluaran != '-':
+            keluaran.close()
+    print(f"{n} baris diproses", file=sys.stderr)
+    return 0
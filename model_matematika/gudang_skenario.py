@@ -0,0 +1,314 @@
+"""Gudang skenario dan hasil perhitungan yang persisten (SQLite).
+
+Setiap hasil disimpan dengan kunci SHA-256 dari representasi kanonik
+(nama model, parameter, versi mesin), sehingga skenario yang sama dari sesi
+mana pun, termasuk setelah server dimulai ulang, cukup dibaca dari disk
+lewat satu pencarian kunci primer. Menaikkan ``__version__`` paket otomatis
+membuat hasil lama tidak terpakai lagi; hasil tersebut lalu tersingkir oleh
+eviksi LRU berbasis ukuran.
+
+Hasil diserialisasi sebagai JSON: array numpy ditulis sebagai byte base64
+dan NamedTuple dari paket ini dibangun ulang menurut namanya. Tidak ada
+pickle, jadi berkas impor dari pihak lain tidak dapat menjalankan kode.
+"""
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+BATAS_DEFAULT_BYTE = 256 * 1024 * 1024
+# Total ukuran dicatat berjalan; dihitung ulang dari tabel setiap sekian penyimpanan
+# agar tulisan dari proses lain tetap terhitung
+HITUNG_ULANG_SETIAP = 256
+
+_SKEMA = """
+CREATE TABLE IF NOT EXISTS hasil (
+    kunci TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    versi TEXT NOT NULL,
+    data TEXT NOT NULL,
+    ukuran INTEGER NOT NULL,
+    dibuat REAL NOT NULL,
+    diakses REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS hasil_diakses ON hasil (diakses);
+CREATE TABLE IF NOT EXISTS skenario (
+    nama TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    parameter TEXT NOT NULL,
+    dibuat REAL NOT NULL
+);
+"""
+
+
+def _kanonik(nilai):
+    """Bentuk JSON yang sama untuk nilai yang setara (mis. 14, 14.0, dan np.float64(14))."""
+    if isinstance(nilai, dict):
+        return {str(k): _kanonik(v) for k, v in sorted(nilai.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(nilai, (bool, np.bool_)) or nilai is None or isinstance(nilai, str):
+        return bool(nilai) if isinstance(nilai, np.bool_) else nilai
+    if isinstance(nilai, (int, float, np.number)):
+        return repr(float(nilai))
+    if isinstance(nilai, np.ndarray) and nilai.size > 64:
+        # Array besar diwakili oleh hash isinya agar kunci tetap pendek
+        isi = np.ascontiguousarray(nilai, dtype=float)
+        return {'__array__': hashlib.sha256(isi.tobytes()).hexdigest(), 'bentuk': list(isi.shape)}
+    if isinstance(nilai, (list, tuple, np.ndarray)):
+        return [_kanonik(v) for v in nilai]
+    raise TypeError(f"Parameter bertipe {type(nilai).__name__} tidak dapat dijadikan kunci")
+
+
+def kunci_skenario(model, parameter, versi):
+    """Hash SHA-256 heksadesimal dari (model, parameter, versi) dalam bentuk kanonik."""
+    teks = json.dumps([model, versi, _kanonik(parameter)], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(teks.encode('utf-8')).hexdigest()
+
+
+def _kode(nilai):
+    if isinstance(nilai, np.ndarray):
+        isi = np.asarray(nilai, order='C')
+        if isi.dtype.hasobject:
+            raise TypeError("Array objek tidak dapat disimpan")
+        return {'__ndarray__': base64.b64encode(isi.tobytes()).decode('ascii'),
+                'dtype': isi.dtype.str, 'bentuk': list(isi.shape)}
+    if isinstance(nilai, tuple) and hasattr(nilai, '_fields'):
+        return {'__jenis__': type(nilai).__name__, 'isi': {k: _kode(v) for k, v in zip(nilai._fields, nilai)}}
+    if isinstance(nilai, dict):
+        return {'__dict__': [[_kode(k), _kode(v)] for k, v in nilai.items()]}
+    if isinstance(nilai, tuple):
+        return {'__tuple__': [_kode(v) for v in nilai]}
+    if isinstance(nilai, list):
+        return [_kode(v) for v in nilai]
+    if isinstance(nilai, np.generic):
+        return nilai.item()
+    if nilai is None or isinstance(nilai, (bool, int, float, str)):
+        return nilai
+    raise TypeError(f"Hasil bertipe {type(nilai).__name__} tidak dapat disimpan")
+
+
+def _dekode(nilai):
+    if isinstance(nilai, list):
+        return [_dekode(v) for v in nilai]
+    if not isinstance(nilai, dict):
+        return nilai
+    if '__ndarray__' in nilai:
+        isi = np.frombuffer(base64.b64decode(nilai['__ndarray__']), dtype=np.dtype(nilai['dtype']))
+        return isi.reshape(nilai['bentuk']).copy()
+    if '__jenis__' in nilai:
+        import model_matematika
+        kelas = getattr(model_matematika, nilai['__jenis__'], None)
+        isi = {k: _dekode(v) for k, v in nilai['isi'].items()}
+        if not (isinstance(kelas, type) and issubclass(kelas, tuple) and hasattr(kelas, '_fields')):
+            return isi
+        return kelas(**{k: v for k, v in isi.items() if k in kelas._fields})
+    if '__dict__' in nilai:
+        return {_kunci_dict(_dekode(k)): _dekode(v) for k, v in nilai['__dict__']}
+    if '__tuple__' in nilai:
+        return tuple(_dekode(v) for v in nilai['__tuple__'])
+    return nilai
+
+
+def _kunci_dict(k):
+    return tuple(k) if isinstance(k, list) else k
+
+
+class GudangSkenario:
+    """Penyimpanan hasil ber-alamat-konten dan skenario bernama di satu berkas SQLite.
+
+    Aman dipakai dari banyak thread (satu koneksi per thread) dan banyak
+    proses (mode WAL). ``batas_byte`` membatasi total ukuran hasil; bila
+    terlampaui, hasil yang paling lama tidak diakses dibuang lebih dulu.
+    """
+
+    def __init__(self, path, batas_byte=BATAS_DEFAULT_BYTE, versi=None):
+        if versi is None:
+            from . import __version__ as versi
+        self.path = os.fspath(path)
+        self.batas_byte = int(batas_byte)
+        self.versi = versi
+        self._lokal = threading.local()
+        self._lock = threading.Lock()
+        self.hit = 0
+        self.miss = 0
+        self.eviksi = 0
+        self._total = None
+        self._sejak_hitung = 0
+        kon = self._koneksi()
+        kon.executescript(_SKEMA)
+
+    def _koneksi(self):
+        kon = getattr(self._lokal, 'kon', None)
+        if kon is None:
+            kon = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            kon.execute('PRAGMA journal_mode=WAL')
+            kon.execute('PRAGMA synchronous=NORMAL')
+            self._lokal.kon = kon
+        return kon
+
+    def kunci(self, model, parameter):
+        return kunci_skenario(model, parameter, self.versi)
+
+    # --- Hasil perhitungan ---
+
+    def ambil(self, model, parameter, bawaan=None):
+        """Hasil tersimpan untuk (model, parameter), atau ``bawaan`` bila belum ada."""
+        kunci = self.kunci(model, parameter)
+        kon = self._koneksi()
+        baris = kon.execute('SELECT data FROM hasil WHERE kunci = ?', (kunci,)).fetchone()
+        if baris is not None:
+            kon.execute('UPDATE hasil SET diakses = ? WHERE kunci = ?', (time.time(), kunci))
+        with self._lock:
+            if baris is None:
+                self.miss += 1
+            else:
+                self.hit += 1
+        return bawaan if baris is None else _dekode(json.loads(baris[0]))
+
+    def simpan(self, model, parameter, nilai):
+        data = json.dumps(_kode(nilai), separators=(',', ':'))
+        sekarang = time.time()
+        kon = self._koneksi()
+        kon.execute('INSERT OR REPLACE INTO hasil VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (self.kunci(model, parameter), model, self.versi, data, len(data), sekarang, sekarang))
+        self._evik(kon, len(data))
+
+    def hitung(self, model, parameter, fungsi):
+        """Memoisasi: kembalikan hasil tersimpan, atau ``fungsi()`` yang lalu disimpan."""
+        tidak_ada = object()
+        nilai = self.ambil(model, parameter, tidak_ada)
+        if nilai is tidak_ada:
+            nilai = fungsi()
+            self.simpan(model, parameter, nilai)
+        return nilai
+
+    def _total_byte(self, kon):
+        return kon.execute('SELECT COALESCE(SUM(ukuran), 0) FROM hasil').fetchone()[0]
+
+    def _evik(self, kon, tambahan=None):
+        """Buang hasil terlama bila total melebihi batas; ``tambahan`` adalah ukuran yang baru disimpan."""
+        with self._lock:
+            if tambahan is None or self._total is None or self._sejak_hitung >= HITUNG_ULANG_SETIAP:
+                self._total, self._sejak_hitung = None, 0
+            else:
+                # Perkiraan bisa berlebih bila baris lama tertimpa; cukup untuk memutuskan perlu dihitung ulang
+                self._total += tambahan
+                self._sejak_hitung += 1
+                if self._total <= self.batas_byte:
+                    return
+        total = self._total_byte(kon)
+        with self._lock:
+            self._total = total
+        if total <= self.batas_byte:
+            return
+        # Buang sampai 90% batas agar eviksi tidak terjadi di setiap penyimpanan
+        target = total - int(self.batas_byte * 0.9)
+        dibuang = []
+        for kunci, ukuran in kon.execute('SELECT kunci, ukuran FROM hasil ORDER BY diakses'):
+            if target <= 0:
+                break
+            dibuang.append((kunci,))
+            target -= ukuran
+        kon.execute('BEGIN')
+        kon.executemany('DELETE FROM hasil WHERE kunci = ?', dibuang)
+        kon.execute('COMMIT')
+        with self._lock:
+            self.eviksi += len(dibuang)
+            # target kini 0.9 * batas dikurangi total baru (positif bila semua baris terbuang)
+            self._total = int(self.batas_byte * 0.9) + target if target <= 0 else 0
+
+    def bersihkan(self, hanya_versi_lama=False):
+        kon = self._koneksi()
+        if hanya_versi_lama:
+            kon.execute('DELETE FROM hasil WHERE versi != ?', (self.versi,))
+        else:
+            kon.execute('DELETE FROM hasil')
+        with self._lock:
+            self._total = None
+
+    # --- Skenario bernama ---
+
+    def simpan_skenario(self, nama, model, parameter):
+        kon = self._koneksi()
+        kon.execute('INSERT OR REPLACE INTO skenario VALUES (?, ?, ?, ?)',
+                    (nama, model, json.dumps(_kode(parameter)), time.time()))
+
+    def ambil_skenario(self, nama):
+        """Pasangan (model, parameter) skenario bernama, atau ``None``."""
+        kon = self._koneksi()
+        baris = kon.execute('SELECT model, parameter FROM skenario WHERE nama = ?', (nama,)).fetchone()
+        return None if baris is None else (baris[0], _dekode(json.loads(baris[1])))
+
+    def daftar_skenario(self, model=None):
+        kon = self._koneksi()
+        if model is None:
+            baris = kon.execute('SELECT nama FROM skenario ORDER BY nama').fetchall()
+        else:
+            baris = kon.execute('SELECT nama FROM skenario WHERE model = ? ORDER BY nama', (model,)).fetchall()
+        return [b[0] for b in baris]
+
+    def hapus_skenario(self, nama):
+        kon = self._koneksi()
+        kon.execute('DELETE FROM skenario WHERE nama = ?', (nama,))
+
+    # --- Impor / ekspor ---
+
+    def ekspor(self, berkas, dengan_hasil=True):
+        """Tulis semua skenario (dan hasil) ke berkas teks JSON-lines; kembalikan jumlah baris."""
+        n = 0
+        kon = self._koneksi()
+        for nama, model, parameter, dibuat in kon.execute('SELECT * FROM skenario ORDER BY nama'):
+            berkas.write(json.dumps({'jenis': 'skenario', 'nama': nama, 'model': model,
+                                     'parameter': json.loads(parameter), 'dibuat': dibuat}) + '\n')
+            n += 1
+        if dengan_hasil:
+            for kunci, model, versi, data, _, dibuat, _ in kon.execute('SELECT * FROM hasil ORDER BY kunci'):
+                berkas.write(json.dumps({'jenis': 'hasil', 'kunci': kunci, 'model': model, 'versi': versi,
+                                         'data': json.loads(data), 'dibuat': dibuat}) + '\n')
+                n += 1
+        return n
+
+    def impor(self, berkas, timpa=False):
+        """Baca berkas dari :meth:`ekspor`; kembalikan jumlah baris yang ditambahkan."""
+        perintah = 'INSERT OR REPLACE' if timpa else 'INSERT OR IGNORE'
+        n = 0
+        sekarang = time.time()
+        kon = self._koneksi()
+        kon.execute('BEGIN')
+        try:
+            for baris in berkas:
+                if not baris.strip():
+                    continue
+                r = json.loads(baris)
+                if r['jenis'] == 'skenario':
+                    cur = kon.execute(f'{perintah} INTO skenario VALUES (?, ?, ?, ?)',
+                                      (r['nama'], r['model'], json.dumps(r['parameter']), r['dibuat']))
+                elif r['jenis'] == 'hasil':
+                    data = json.dumps(r['data'], separators=(',', ':'))
+                    cur = kon.execute(f'{perintah} INTO hasil VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                      (r['kunci'], r['model'], r['versi'], data, len(data), r['dibuat'], sekarang))
+                else:
+                    raise ValueError(f"Jenis baris tidak dikenal: {r['jenis']}")
+                n += cur.rowcount
+            kon.execute('COMMIT')
+        except BaseException:
+            kon.execute('ROLLBACK')
+            raise
+        self._evik(kon)
+        return n
+
+    def statistik(self):
+        kon = self._koneksi()
+        jumlah, ukuran = kon.execute('SELECT COUNT(*), COALESCE(SUM(ukuran), 0) FROM hasil').fetchone()
+        n_skenario = kon.execute('SELECT COUNT(*) FROM skenario').fetchone()[0]
+        with self._lock:
+            total = self.hit + self.miss
+            return {'hit': self.hit, 'miss': self.miss, 'eviksi': self.eviksi,
+                    'rasio_hit': self.hit / total if total else 0.0,
+                    'jumlah': jumlah, 'ukuran_byte': ukuran, 'batas_byte': self.batas_byte,
+                    'skenario': n_skenario, 'versi': self.versi}
+
@@ -0,0 +1,460 @@
+"""Keandalan sistem seri, paralel, k-dari-n, dan jaringan umum.
+
+Keandalan komponen disusun pada sumbu terakhir array, sehingga banyak lini
+produksi dapat dihitung sekaligus dengan bentuk (n_skenario, n_mesin).
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+UKURAN_BLOK_MC = 20_000
+
+
+class HasilKeandalan(NamedTuple):
+    keandalan_sistem: np.ndarray
+    idx_terlemah: np.ndarray
+    r_terlemah: np.ndarray
+
+
+def keandalan_seri(R):
+    """R_s = prod(R_i) dan mesin terlemah untuk setiap lini."""
+    R = np.asarray(R, dtype=float)
+    idx = np.argmin(R, axis=-1)
+    return HasilKeandalan(
+        keandalan_sistem=np.prod(R, axis=-1),
+        idx_terlemah=idx,
+        r_terlemah=np.take_along_axis(R, idx[..., None], axis=-1)[..., 0],
+    )
+
+
+# --- Struktur umum: seri, paralel, k-dari-n, dan jaringan dua terminal ---
+#
+# Struktur ditulis sebagai tuple bersarang. Daun berupa nama komponen (str):
+#   ('seri', [anak, ...])
+#   ('paralel', [anak, ...])
+#   ('k_dari_n', k, [anak, ...])
+#   ('jaringan', sumber, tujuan, [(simpul_u, simpul_v, nama_komponen), ...])
+# Nama komponen yang sama boleh muncul di beberapa tempat (komponen bersama).
+
+class HasilStruktur(NamedTuple):
+    keandalan: np.ndarray
+    birnbaum: dict           # nama komponen -> kepentingan Birnbaum dR/dR_i
+    metode: str              # 'eksak' atau 'monte_carlo'
+    galat_baku: np.ndarray   # nol untuk metode eksak
+
+
+class StrukturTerlaluBesar(Exception):
+    """Ruang faktorisasi melebihi batas; gunakan Monte Carlo."""
+
+
+def seri(*anak):
+    return ('seri', list(anak))
+
+
+def paralel(*anak):
+    return ('paralel', list(anak))
+
+
+def k_dari_n(k, *anak):
+    return ('k_dari_n', int(k), list(anak))
+
+
+def jaringan(sumber, tujuan, tepi):
+    return ('jaringan', sumber, tujuan, [tuple(e) for e in tepi])
+
+
+def komponen_struktur(spec):
+    """Daftar nama komponen unik dalam urutan kemunculan pertama."""
+    hasil = {}
+
+    def kunjungi(node):
+        if isinstance(node, str):
+            hasil.setdefault(node, None)
+        elif node[0] == 'jaringan':
+            for _, _, nama in node[3]:
+                hasil.setdefault(nama, None)
+        else:
+            for anak in node[-1]:
+                kunjungi(anak)
+    kunjungi(spec)
+    return list(hasil)
+
+
+def _hitung_kemunculan(spec):
+    hitung = {}
+
+    def kunjungi(node):
+        if isinstance(node, str):
+            hitung[node] = hitung.get(node, 0) + 1
+        elif node[0] == 'jaringan':
+            for _, _, nama in node[3]:
+                hitung[nama] = hitung.get(nama, 0) + 1
+        else:
+            for anak in node[-1]:
+                kunjungi(anak)
+    kunjungi(spec)
+    return hitung
+
+
+def _tambah_grad(tujuan, sumber, faktor):
+    for nama, g in sumber.items():
+        if nama in tujuan:
+            tujuan[nama] = tujuan[nama] + faktor * g
+        else:
+            tujuan[nama] = faktor * g
+
+
+class _Evaluator:
+    """Evaluasi eksak R dan gradiennya dengan memoisasi sub-masalah."""
+
+    def __init__(self, R, bersama, maks_state):
+        self.R = R
+        self.bersama = bersama
+        self.maks_state = maks_state
+        self.memo = {}
+        self.daun_bersama = {}
+
+    def _bersama_di(self, node):
+        kunci = id(node)
+        if kunci not in self.daun_bersama:
+            self.daun_bersama[kunci] = frozenset(n for n in komponen_struktur(node) if n in self.bersama)
+        return self.daun_bersama[kunci]
+
+    def nilai(self, node, kondisi):
+        if isinstance(node, str):
+            if node in kondisi:
+                return np.float64(kondisi[node]), {}
+            return self.R[node], {node: np.float64(1.0)}
+
+        relevan = self._bersama_di(node)
+        kunci = (id(node), frozenset((n, v) for n, v in kondisi.items() if n in relevan))
+        if kunci in self.memo:
+            return self.memo[kunci]
+
+        jenis = node[0]
+        if jenis == 'jaringan':
+            hasil = self._jaringan(node, kondisi)
+        else:
+            anak = [self.nilai(a, kondisi) for a in node[-1]]
+            if jenis == 'seri':
+                hasil = self._seri([r for r, _ in anak], [g for _, g in anak])
+            elif jenis == 'paralel':
+                q, gq = self._seri([1 - r for r, _ in anak], [{n: -v for n, v in g.items()} for _, g in anak])
+                hasil = (1 - q, {n: -v for n, v in gq.items()})
+            elif jenis == 'k_dari_n':
+                hasil = self._k_dari_n(node[1], [r for r, _ in anak], [g for _, g in anak])
+            else:
+                raise ValueError(f"Jenis struktur tidak dikenal: {jenis}")
+        self.memo[kunci] = hasil
+        return hasil
+
+    @staticmethod
+    def _seri(nilai, grads):
+        # Produk prefiks/sufiks agar turunan tidak memerlukan pembagian
+        n = len(nilai)
+        prefiks = [np.float64(1.0)] * (n + 1)
+        for i, r in enumerate(nilai):
+            prefiks[i + 1] = prefiks[i] * r
+        sufiks = np.float64(1.0)
+        grad = {}
+        for i in range(n - 1, -1, -1):
+            _tambah_grad(grad, grads[i], prefiks[i] * sufiks)
+            sufiks = sufiks * nilai[i]
+        return prefiks[n], grad
+
+    @staticmethod
+    def _k_dari_n(k, nilai, grads):
+        n = len(nilai)
+        # prefiks[i][m] = P(tepat m bekerja di antara anak 0..i-1)
+        prefiks = [[np.float64(1.0)]]
+        for r in nilai:
+            lama = prefiks[-1]
+            baru = [lama[0] * (1 - r)]
+            for m in range(1, len(lama)):
+                baru.append(lama[m] * (1 - r) + lama[m - 1] * r)
+            baru.append(lama[-1] * r)
+            prefiks.append(baru)
+        R = sum(prefiks[n][k:], np.float64(0.0))
+        # Turunan terhadap anak j = P(tepat k-1 bekerja di antara anak lainnya)
+        grad = {}
+        sufiks = [np.float64(1.0)]
+        for j in range(n - 1, -1, -1):
+            pre = prefiks[j]
+            tepat = np.float64(0.0)
+            for m in range(len(pre)):
+                s = k - 1 - m
+                if 0 <= s < len(sufiks):
+                    tepat = tepat + pre[m] * sufiks[s]
+            _tambah_grad(grad, grads[j], tepat)
+            r = nilai[j]
+            baru = [sufiks[0] * (1 - r)]
+            for m in range(1, len(sufiks)):
+                baru.append(sufiks[m] * (1 - r) + sufiks[m - 1] * r)
+            baru.append(sufiks[-1] * r)
+            sufiks = baru
+        return R, grad
+
+    def _jaringan(self, node, kondisi):
+        _, sumber, tujuan, tepi = node
+        # Komponen yang pasti bekerja dikontraksi, yang pasti gagal dibuang
+        induk = {}
+
+        def akar(x):
+            while induk.get(x, x) != x:
+                x = induk[x]
+            return x
+        for u, v, nama in tepi:
+            if kondisi.get(nama) == 1.0:
+                induk[akar(v)] = akar(u)
+        tepi_acak = [(akar(u), akar(v), nama) for u, v, nama in tepi if nama not in kondisi]
+        tepi_acak = [(u, v, nama) for u, v, nama in tepi_acak if u != v]
+        sumber, tujuan = akar(sumber), akar(tujuan)
+        if sumber == tujuan:
+            return np.float64(1.0), {}
+        tepi_acak = _pangkas(tepi_acak, sumber)
+        return self._bdd(_urutkan_tepi(tepi_acak, sumber), sumber, tujuan)
+
+    def _bdd(self, tepi, s, t):
+        """Diagram keputusan biner berbasis frontier untuk keandalan dua terminal.
+
+        Tepi diproses berurutan; state tiap level adalah partisi simpul
+        frontier ke dalam blok terhubung. Nilai mundur b memberi R, bobot
+        maju f memberi turunan: dR/dp_e = sum f * (b_hidup - b_mati).
+        """
+        n = len(tepi)
+        terakhir = {s: n, t: n}
+        for i, (u, v, _) in enumerate(tepi):
+            terakhir[u] = max(terakhir.get(u, i), i) if u not in (s, t) else n
+            terakhir[v] = max(terakhir.get(v, i), i) if v not in (s, t) else n
+        frontier = [(s, t)]
+        for i, (u, v, _) in enumerate(tepi):
+            aktif = [x for x in frontier[-1] if terakhir[x] > i]
+            for x in (u, v):
+                if terakhir[x] > i and x not in aktif:
+                    aktif.append(x)
+            frontier.append(tuple(aktif))
+
+        SATU, NOL = -1, -2
+        state = [{(0, 1): 0}]
+        transisi = []
+        total = 1
+        for i, (u, v, _) in enumerate(tepi):
+            fr, fr_baru = frontier[i], frontier[i + 1]
+            level_baru = {}
+            trans = []
+            for label in state[i]:
+                blok = dict(zip(fr, label))
+                berikut = max(label) + 1
+                for x in (u, v):
+                    if x not in blok:
+                        blok[x] = berikut
+                        berikut += 1
+                hasil = []
+                for hidup in (True, False):
+                    b = blok
+                    if hidup and blok[u] != blok[v]:
+                        lama, ke = blok[v], blok[u]
+                        b = {x: (ke if k == lama else k) for x, k in blok.items()}
+                    if b[s] == b[t]:
+                        hasil.append(SATU)
+                        continue
+                    kanon, lab = {}, []
+                    for x in fr_baru:
+                        lab.append(kanon.setdefault(b[x], len(kanon)))
+                    lab = tuple(lab)
+                    if lab not in level_baru:
+                        level_baru[lab] = len(level_baru)
+                    hasil.append(level_baru[lab])
+                trans.append(hasil)
+            total += len(level_baru)
+            if total > self.maks_state:
+                raise StrukturTerlaluBesar()
+            state.append(level_baru)
+            transisi.append(trans)
+
+        # Nilai mundur: peluang s-t terhubung dari setiap state
+        nilai_akhir = [np.float64(0.0)] * len(state[n])
+        mundur = [None] * (n + 1)
+        mundur[n] = nilai_akhir
+        for i in range(n - 1, -1, -1):
+            p = self.R[tepi[i][2]]
+            bb = mundur[i + 1]
+            ambil = lambda j: np.float64(1.0) if j == SATU else (np.float64(0.0) if j == NOL else bb[j])
+            mundur[i] = [p * ambil(h) + (1 - p) * ambil(m) for h, m in transisi[i]]
+
+        # Bobot maju dan turunan per komponen
+        grad = {}
+        maju = [np.float64(1.0)]
+        for i in range(n):
+            p = self.R[tepi[i][2]]
+            bb = mundur[i + 1]
+            ambil = lambda j: np.float64(1.0) if j == SATU else (np.float64(0.0) if j == NOL else bb[j])
+            maju_baru = [np.float64(0.0)] * len(state[i + 1])
+            turunan = np.float64(0.0)
+            for f, (h, m) in zip(maju, transisi[i]):
+                turunan = turunan + f * (ambil(h) - ambil(m))
+                if h >= 0:
+                    maju_baru[h] = maju_baru[h] + f * p
+                if m >= 0:
+                    maju_baru[m] = maju_baru[m] + f * (1 - p)
+            nama = tepi[i][2]
+            grad[nama] = grad.get(nama, 0.0) + turunan
+            maju = maju_baru
+        return mundur[0][0], grad
+
+
+def _pangkas(tepi, s):
+    """Buang tepi di luar komponen terhubung yang memuat s."""
+    tetangga = {}
+    for a, b, _ in tepi:
+        tetangga.setdefault(a, []).append(b)
+        tetangga.setdefault(b, []).append(a)
+    dikunjungi = {s}
+    tumpukan = [s]
+    while tumpukan:
+        x = tumpukan.pop()
+        for y in tetangga.get(x, ()):
+            if y not in dikunjungi:
+                dikunjungi.add(y)
+                tumpukan.append(y)
+    return [e for e in tepi if e[0] in dikunjungi]
+
+
+def _urutkan_tepi(tepi, s):
+    """Urutan tepi menurut BFS dari sumber agar frontier tetap sempit."""
+    tetangga = {}
+    for i, (a, b, _) in enumerate(tepi):
+        tetangga.setdefault(a, []).append(i)
+        tetangga.setdefault(b, []).append(i)
+    urutan, dipakai, dikunjungi, antre = [], set(), {s}, [s]
+    for x in antre:
+        for i in tetangga.get(x, ()):
+            if i not in dipakai:
+                dipakai.add(i)
+                urutan.append(tepi[i])
+                a, b, _ = tepi[i]
+                y = b if a == x else a
+                if y not in dikunjungi:
+                    dikunjungi.add(y)
+                    antre.append(y)
+    return urutan
+
+
+def _phi(node, X, indeks):
+    """Fungsi struktur boolean yang divektorisasi atas sampel (baris X)."""
+    if isinstance(node, str):
+        return X[:, indeks[node]]
+    jenis = node[0]
+    if jenis == 'seri':
+        return np.logical_and.reduce([_phi(a, X, indeks) for a in node[1]])
+    if jenis == 'paralel':
+        return np.logical_or.reduce([_phi(a, X, indeks) for a in node[1]])
+    if jenis == 'k_dari_n':
+        return np.sum([_phi(a, X, indeks) for a in node[2]], axis=0) >= node[1]
+    _, sumber, tujuan, tepi = node
+    nomor = {}
+    for x in [sumber, tujuan] + [x for u, v, _ in tepi for x in (u, v)]:
+        nomor.setdefault(x, len(nomor))
+    U = np.array([nomor[u] for u, _, _ in tepi] + [nomor[v] for _, v, _ in tepi], dtype=np.intp)
+    V = np.array([nomor[v] for _, v, _ in tepi] + [nomor[u] for u, _, _ in tepi], dtype=np.intp)
+    urut = np.argsort(V, kind='stable')
+    U, V = U[urut], V[urut]
+    awal_grup = np.flatnonzero(np.r_[True, V[1:] != V[:-1]])
+    # Sampel dikemas 64 per word sehingga AND/OR berjalan untuk 64 sampel sekaligus
+    n = X.shape[0]
+    kolom = np.array([indeks[n_] for _, _, n_ in tepi] * 2)[urut]
+    aktif = _kemas(X[:, kolom].T)
+    capai = np.zeros((len(nomor), aktif.shape[1]), dtype=np.uint64)
+    capai[nomor[sumber]] = _kemas(np.ones((1, n), dtype=bool))[0]
+    # Propagasi keterjangkauan lewat semua tepi sekaligus sampai konvergen
+    for _ in range(len(nomor)):
+        masuk = np.bitwise_or.reduceat(capai[U] & aktif, awal_grup, axis=0)
+        baru = capai[V[awal_grup]] | masuk
+        if np.array_equal(baru, capai[V[awal_grup]]):
+            break
+        capai[V[awal_grup]] = baru
+    return np.unpackbits(capai[nomor[tujuan]].view(np.uint8), bitorder='little')[:n].astype(bool)
+
+
+def _kemas(B):
+    """Kemas array boolean (baris, n) menjadi (baris, ceil(n/64)) uint64."""
+    n = B.shape[1]
+    pad = -n % 64
+    if pad:
+        B = np.concatenate([B, np.zeros((B.shape[0], pad), dtype=bool)], axis=1)
+    return np.packbits(B, axis=1, bitorder='little').view(np.uint64)
+
+
+def keandalan_struktur(spec, R, metode='otomatis', n_sampel=200_000, seed=0,
+                       maks_kondisi=16, maks_state=50_000):
+    """Keandalan sistem dan kepentingan Birnbaum setiap komponen.
+
+    ``R`` memetakan nama komponen ke keandalannya (skalar atau array untuk
+    banyak skenario sekaligus pada metode eksak). Metode eksak mengondisikan
+    komponen bersama (faktorisasi) dan memfaktorkan jaringan tepi demi tepi
+    dengan memoisasi; turunan dR/dR_i dihitung dalam lintasan yang sama.
+    Bila ruang faktorisasi terlalu besar, ``metode='otomatis'`` beralih ke
+    Monte Carlo tervektorisasi dengan estimator Birnbaum berbasis kovarians.
+    """
+    if metode not in ('otomatis', 'eksak', 'monte_carlo'):
+        raise ValueError(f"Metode tidak dikenal: {metode}")
+    R = {n: np.asarray(v, dtype=float) for n, v in R.items()}
+    nama = komponen_struktur(spec)
+    hilang = [n for n in nama if n not in R]
+    if hilang:
+        raise KeyError(f"Keandalan komponen tidak diberikan: {hilang}")
+
+    if metode in ('otomatis', 'eksak'):
+        bersama = [n for n, k in _hitung_kemunculan(spec).items() if k > 1]
+        try:
+            if len(bersama) > maks_kondisi:
+                raise StrukturTerlaluBesar()
+            return _eksak(spec, R, nama, bersama, maks_state)
+        except StrukturTerlaluBesar:
+            if metode == 'eksak':
+                raise
+    return _monte_carlo(spec, R, nama, n_sampel, seed)
+
+
+def _eksak(spec, R, nama, bersama, maks_state):
+    ev = _Evaluator(R, set(bersama), maks_state)
+
+    def kondisikan(i, kondisi):
+        if i == len(bersama):
+            return ev.nilai(spec, kondisi)
+        n = bersama[i]
+        r1, g1 = kondisikan(i + 1, {**kondisi, n: 1.0})
+        r0, g0 = kondisikan(i + 1, {**kondisi, n: 0.0})
+        p = R[n]
+        grad = {}
+        _tambah_grad(grad, g1, p)
+        _tambah_grad(grad, g0, 1 - p)
+        grad[n] = r1 - r0
+        return p * r1 + (1 - p) * r0, grad
+
+    Rs, grad = kondisikan(0, {})
+    bentuk = np.broadcast_shapes(*(np.shape(R[n]) for n in nama)) if nama else ()
+    birnbaum = {n: np.broadcast_to(np.asarray(grad.get(n, 0.0), dtype=float), bentuk).copy() for n in nama}
+    Rs = np.broadcast_to(np.asarray(Rs, dtype=float), bentuk).copy()
+    return HasilStruktur(keandalan=Rs, birnbaum=birnbaum, metode='eksak', galat_baku=np.zeros(bentuk))
+
+
+def _monte_carlo(spec, R, nama, n_sampel, seed):
+    p = np.array([float(R[n]) for n in nama])
+    rng = np.random.default_rng(seed)
+    indeks = {n: i for i, n in enumerate(nama)}
+    jumlah_phi = 0.0
+    jumlah_phi_x = np.zeros(p.size)
+    # Sampel diproses per blok agar memori tetap kecil untuk ratusan komponen
+    for awal in range(0, n_sampel, UKURAN_BLOK_MC):
+        X = rng.random((min(UKURAN_BLOK_MC, n_sampel - awal), p.size)) < p
+        phi = _phi(spec, X, indeks)
+        jumlah_phi += phi.sum()
+        jumlah_phi_x += phi.astype(float) @ X
+    Rs = jumlah_phi / n_sampel
+    # Birnbaum = Cov(phi, X_i) / Var(X_i) untuk komponen yang saling bebas
+    kov = jumlah_phi_x / n_sampel - Rs * p
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ib = np.where((p > 0) & (p < 1), kov / (p * (1 - p)), 0.0)
+    return HasilStruktur(keandalan=np.asarray(Rs), birnbaum=dict(zip(nama, ib)), metode='monte_carlo',
+                         galat_baku=np.asarray(np.sqrt(Rs * (1 - Rs) / n_sampel)))
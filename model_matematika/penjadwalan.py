@@ -0,0 +1,168 @@
+"""Kebutuhan petugas per interval dan penjadwalan shift dari prakiraan kedatangan.
+
+Tahap pertama mencari jumlah server minimum c di setiap interval (mis. 168
+jam x 300 toko sekaligus) agar P(Wq > t) tidak melebihi target pada model
+M/M/c tunak. Rekursi Erlang B dijalankan naik satu server demi satu untuk
+semua interval; interval yang sudah memenuhi target dikeluarkan dari
+pencarian, sehingga biayanya O(c_maks) operasi vektor yang makin kecil.
+
+Tahap kedua menentukan jumlah petugas yang mulai di setiap shift agar
+cakupan setiap interval memenuhi kebutuhan dengan total jam kerja minimum.
+Setiap shift mencakup interval yang berurutan (matriks consecutive-ones yang
+unimodular total), sehingga relaksasi LP model covering sudah bulat. Dengan
+satu panjang shift, greedy "mulai selambat mungkin" sudah optimal dan
+berjalan sekaligus untuk semua toko; dengan beberapa panjang shift setiap
+pola kebutuhan diselesaikan dengan simpleks yang di-warm start dari toko
+sebelumnya; begitu pula bila biaya per shift tidak seragam.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from .simpleks import selesaikan_ilp, selesaikan_lp
+
+C_MAKS_DEFAULT = 1000
+
+
+class HasilKebutuhanServer(NamedTuple):
+    server: np.ndarray         # jumlah server minimum per interval
+    peluang_telat: np.ndarray  # P(Wq > batas_waktu) pada jumlah server tersebut
+    utilisasi: np.ndarray
+
+
+class HasilJadwalShift(NamedTuple):
+    shift_mulai: np.ndarray    # (S,) interval awal setiap shift
+    shift_panjang: np.ndarray  # (S,) panjang setiap shift (interval)
+    jumlah: np.ndarray         # (..., S) petugas yang mulai di setiap shift
+    cakupan: np.ndarray        # (..., T) petugas yang bertugas per interval
+    jam_kerja: np.ndarray      # (...,) total jam petugas
+    kelebihan: np.ndarray      # (...,) jam petugas di atas kebutuhan
+
+
+def kebutuhan_server(lmbda, mu, batas_waktu, batas_peluang, c_min=0, c_maks=C_MAKS_DEFAULT):
+    """Server minimum per interval agar ``P(Wq > batas_waktu) <= batas_peluang``.
+
+    ``lmbda`` dan ``mu`` dapat di-broadcast (mis. ``lmbda`` berbentuk (toko, 168));
+    ``batas_waktu`` memakai satuan waktu yang sama dengan 1/lambda. Interval
+    tanpa kedatangan mendapat ``c_min`` server.
+    """
+    lmbda, mu = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float))
+    bentuk = lmbda.shape
+    lmbda, mu = lmbda.ravel(), mu.ravel()
+    server = np.full(lmbda.size, c_min, dtype=np.int64)
+    peluang = np.zeros(lmbda.size)
+
+    aktif = np.flatnonzero(lmbda > 0)
+    lam, m = lmbda[aktif], mu[aktif]
+    a = lam / m
+    B = np.ones(aktif.size)
+    k = 0
+    while aktif.size:
+        k += 1
+        if k > c_maks:
+            raise ValueError(f"Target layanan tidak tercapai dengan {c_maks} server")
+        B = a * B / (k + a * B)
+        if k < c_min:
+            continue
+        rho = a / k
+        stabil = rho < 1
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            C = B / (1 - rho * (1 - B))
+            p = np.where(stabil, C * np.exp(-(k * m - lam) * batas_waktu), 1.0)
+        ok = stabil & (p <= batas_peluang)
+        if ok.any():
+            server[aktif[ok]] = k
+            peluang[aktif[ok]] = p[ok]
+            sisa = ~ok
+            aktif, lam, m, a, B = aktif[sisa], lam[sisa], m[sisa], a[sisa], B[sisa]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        utilisasi = np.where(server > 0, lmbda / (np.maximum(server, 1) * mu), 0.0)
+    return HasilKebutuhanServer(server=server.reshape(bentuk), peluang_telat=peluang.reshape(bentuk),
+                                utilisasi=utilisasi.reshape(bentuk))
+
+
+def daftar_shift(n_interval, panjang_shift=8, jam_mulai=None):
+    """Pasangan (mulai, panjang) semua shift yang muat di horizon ``n_interval``."""
+    mulai, panjang = [], []
+    for L in np.atleast_1d(panjang_shift):
+        L = int(L)
+        boleh = np.arange(n_interval) if jam_mulai is None else np.unique(np.asarray(jam_mulai, dtype=np.int64))
+        boleh = boleh[(boleh >= 0) & (boleh + L <= n_interval)]
+        mulai.append(boleh)
+        panjang.append(np.full(boleh.size, L))
+    return np.concatenate(mulai), np.concatenate(panjang)
+
+
+def jadwal_shift(kebutuhan, panjang_shift=8, jam_mulai=None, biaya=None):
+    """Jumlah petugas per shift dengan total biaya minimum yang memenuhi kebutuhan per interval.
+
+    ``kebutuhan`` berbentuk (..., T). ``panjang_shift`` boleh satu nilai atau
+    beberapa; ``jam_mulai`` membatasi interval awal shift (default: semua).
+    ``biaya`` per shift defaultnya sama dengan panjangnya (jam kerja).
+    """
+    kebutuhan = np.asarray(kebutuhan)
+    T = kebutuhan.shape[-1]
+    baris = kebutuhan.reshape(-1, T).astype(float)
+    mulai, panjang = daftar_shift(T, panjang_shift, jam_mulai)
+    biaya = panjang.astype(float) if biaya is None else np.asarray(biaya, dtype=float)
+
+    cakupan_shift = (np.arange(T) >= mulai[:, None]) & (np.arange(T) < (mulai + panjang)[:, None])
+    terlewat = np.flatnonzero(~cakupan_shift.any(axis=0) & (baris > 0).any(axis=0))
+    if terlewat.size:
+        raise ValueError(f"Tidak ada shift yang mencakup interval {int(terlewat[0])}")
+
+    # Greedy hanya optimal bila semua shift sama panjang dan sama biaya
+    if np.unique(panjang).size <= 1 and np.unique(biaya).size <= 1:
+        jumlah = _greedy(baris, mulai, panjang, T)
+    else:
+        jumlah = _covering_lp(baris, cakupan_shift.T.astype(float), biaya)
+
+    cakupan = jumlah @ cakupan_shift.astype(np.int64)
+    bentuk = kebutuhan.shape[:-1]
+    return HasilJadwalShift(
+        shift_mulai=mulai, shift_panjang=panjang,
+        jumlah=jumlah.reshape(bentuk + (mulai.size,)), cakupan=cakupan.reshape(bentuk + (T,)),
+        jam_kerja=(jumlah @ panjang).reshape(bentuk),
+        kelebihan=(cakupan - baris).sum(axis=-1).reshape(bentuk),
+    )
+
+
+def _greedy(baris, mulai, panjang, T):
+    """Shift sepanjang sama: kekurangan di interval h ditutup oleh shift terakhir yang masih mencakup h."""
+    L = int(panjang[0]) if panjang.size else 0
+    urut = np.argsort(mulai, kind='stable')
+    mulai_urut = mulai[urut]
+    # Untuk setiap interval, indeks shift dengan awal terbesar yang <= h
+    terakhir = np.searchsorted(mulai_urut, np.arange(T), side='right') - 1
+
+    jumlah = np.zeros((baris.shape[0], mulai.size), dtype=np.int64)
+    berakhir = np.zeros((baris.shape[0], T + L + 1))
+    bertugas = np.zeros(baris.shape[0])
+    for h in range(T):
+        bertugas -= berakhir[:, h]
+        kurang = np.maximum(baris[:, h] - bertugas, 0.0)
+        if not kurang.any():
+            continue
+        j = urut[terakhir[h]]
+        jumlah[:, j] += kurang.astype(np.int64)
+        bertugas += kurang
+        berakhir[:, mulai[j] + L] += kurang
+    return jumlah
+
+
+def _covering_lp(baris, A, biaya):
+    """Covering A x >= b per pola kebutuhan unik dengan warm start dari pola sebelumnya."""
+    unik, kembali = np.unique(baris, axis=0, return_inverse=True)
+    hasil = np.zeros((unik.shape[0], A.shape[1]), dtype=np.int64)
+    basis = None
+    for i, b in enumerate(unik):
+        lp = selesaikan_lp(biaya, -A, -b, maksimasi=False, basis_awal=basis)
+        x = lp.x
+        if lp.status != 'optimal' or np.abs(x - np.round(x)).max() > 1e-6:
+            # Matriks interval memberi LP yang bulat; branch-and-bound hanya untuk jaga-jaga numerik
+            x = selesaikan_ilp(biaya, -A, -b, maksimasi=False).x
+        else:
+            basis = (lp.basis, lp.di_atas)
+        hasil[i] = np.round(x).astype(np.int64)
+    return hasil[kembali.ravel()]
@@ -0,0 +1,63 @@
+"""Model persediaan Economic Order Quantity (EOQ).
+
+Semua fungsi menerima skalar atau array NumPy yang dapat di-broadcast.
+Satu tahun diasumsikan 360 hari kerja, sama seperti pada dashboard.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+HARI_PER_TAHUN = 360
+
+
+class HasilEOQ(NamedTuple):
+    eoq: np.ndarray
+    frekuensi_pesanan: np.ndarray
+    biaya_pemesanan: np.ndarray
+    biaya_penyimpanan: np.ndarray
+    total_biaya: np.ndarray
+    permintaan_harian: np.ndarray
+    rop: np.ndarray
+    siklus_pemesanan: np.ndarray
+
+
+def hitung_eoq(D, S, H, lead_time, safety_stock):
+    """Hitung EOQ, ROP, dan biaya total tahunan untuk setiap skenario.
+
+    Skenario dengan H <= 0 atau D <= 0 menghasilkan nol pada semua metrik.
+    """
+    D, S, H, lead_time, safety_stock = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (D, S, H, lead_time, safety_stock)))
+    valid = (H > 0) & (D > 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        eoq = np.where(valid, np.sqrt(2 * D * S / H), 0.0)
+        ada_pesanan = valid & (eoq > 0)
+        frekuensi_pesanan = np.where(ada_pesanan, D / eoq, 0.0)
+        biaya_pemesanan = frekuensi_pesanan * S
+        biaya_penyimpanan = np.where(valid, eoq / 2 * H, 0.0)
+        permintaan_harian = np.where(valid, D / HARI_PER_TAHUN, 0.0)
+        rop = np.where(valid, permintaan_harian * lead_time + safety_stock, 0.0)
+        siklus_pemesanan = np.where(ada_pesanan, HARI_PER_TAHUN / frekuensi_pesanan, 0.0)
+
+    return HasilEOQ(
+        eoq=eoq, frekuensi_pesanan=frekuensi_pesanan,
+        biaya_pemesanan=biaya_pemesanan, biaya_penyimpanan=biaya_penyimpanan,
+        total_biaya=biaya_pemesanan + biaya_penyimpanan,
+        permintaan_harian=permintaan_harian, rop=rop, siklus_pemesanan=siklus_pemesanan,
+    )
+
+
+def kurva_biaya(D, S, H, eoq, n_titik=100):
+    """Biaya simpan, biaya pesan, dan biaya total di sekitar EOQ (satu skenario)."""
+    q = np.linspace(max(1, eoq * 0.1), eoq * 2 if eoq > 0 else 200, n_titik)
+    holding_costs = (q / 2) * H
+    ordering_costs = (D / q) * S
+    return q, holding_costs, ordering_costs, holding_costs + ordering_costs
+
+
+def siklus_persediaan(eoq, safety_stock, permintaan_harian, siklus_pemesanan, n_siklus=2, n_titik=200):
+    """Tingkat stok deterministik selama beberapa siklus pemesanan (satu skenario)."""
+    t = np.linspace(0, siklus_pemesanan * n_siklus, n_titik)
+    stok = (eoq + safety_stock) - permintaan_harian * (t % siklus_pemesanan)
+    return t, np.maximum(stok, safety_stock)
@@ -0,0 +1,138 @@
+"""EOQ multi-item dengan kendala ruang gudang dan anggaran pembelian bersama.
+
+Setiap SKU memiliki EOQ sendiri, tetapi jumlah ruang sum(f_i * Q_i) dan nilai
+pembelian sum(c_i * Q_i) tidak boleh melebihi kapasitas bersama (asumsi
+konservatif: semua pesanan dapat tiba bersamaan). Relaksasi Lagrange memberi
+
+    Q_i(lambda) = sqrt(2 D_i S_i / (H_i + 2 * sum_j lambda_j a_ji))
+
+dan multiplier lambda dicari dengan metode Newton tervektorisasi atas semua
+SKU. lambda_j adalah harga bayangan: penurunan biaya tahunan per tambahan
+satu satuan kapasitas j.
+"""
+from itertools import combinations
+from typing import NamedTuple
+
+import numpy as np
+
+from .persediaan import HARI_PER_TAHUN
+
+
+class HasilEOQTerkendala(NamedTuple):
+    Q: np.ndarray                    # kuantitas pesanan per SKU yang memenuhi kendala
+    Q_bebas: np.ndarray              # EOQ tanpa kendala, sebagai pembanding
+    rop: np.ndarray
+    biaya_pemesanan: np.ndarray
+    biaya_penyimpanan: np.ndarray
+    total_biaya: np.ndarray
+    harga_bayangan_ruang: float      # Rp/tahun per satuan ruang tambahan
+    harga_bayangan_anggaran: float   # Rp/tahun per Rupiah anggaran tambahan
+    pemakaian_ruang: float
+    pemakaian_anggaran: float
+    iterasi: int
+
+
+def _kuantitas(K, penyebut):
+    """sqrt(K / penyebut), dengan Q = 0 untuk SKU tanpa permintaan (termasuk H = 0)."""
+    return np.sqrt(np.divide(K, penyebut, out=np.zeros_like(K), where=K > 0))
+
+
+def _newton(K, H, A, b, toleransi, maks_iter):
+    """Cari lambda >= 0 sehingga A @ Q(lambda) = b untuk kendala aktif A."""
+    lam = np.zeros(len(b))
+    iterasi = 0
+    Q = _kuantitas(K, H)
+    g = A @ Q - b
+    for iterasi in range(1, maks_iter + 1):
+        if np.all(np.abs(g) <= toleransi * b):
+            break
+        penyebut = H + 2 * (lam @ A)
+        w = np.divide(Q, penyebut, out=np.zeros_like(Q), where=Q > 0)
+        # Jacobian dari A @ Q(lambda): -(A * w) @ A.T, simetris definit negatif
+        J = -(A * w) @ A.T
+        langkah = np.linalg.solve(J, -g)
+        # Redam langkah sampai residu mengecil dan lambda tetap non-negatif
+        t = 1.0
+        norma = np.abs(g / b).max()
+        for _ in range(40):
+            lam_baru = np.maximum(lam + t * langkah, 0.0)
+            Q_baru = _kuantitas(K, H + 2 * (lam_baru @ A))
+            g_baru = A @ Q_baru - b
+            if np.abs(g_baru / b).max() < norma:
+                break
+            t *= 0.5
+        lam, Q, g = lam_baru, Q_baru, g_baru
+    return lam, Q, g, iterasi
+
+
+def eoq_terkendala(D, S, H, ruang=None, kapasitas_ruang=None, biaya_unit=None, anggaran=None,
+                   lead_time=0.0, safety_stock=0.0, toleransi=1e-9, maks_iter=100):
+    """EOQ untuk banyak SKU dengan kendala ruang dan/atau anggaran bersama.
+
+    ``ruang`` dan ``biaya_unit`` adalah kebutuhan per unit tiap SKU;
+    ``kapasitas_ruang`` dan ``anggaran`` adalah batas totalnya. Kendala yang
+    tidak diberikan diabaikan. Himpunan kendala aktif dipilih dengan
+    memeriksa kondisi KKT di antara kendala yang dilanggar EOQ bebas:
+    mula-mula satu kendala, lalu keduanya.
+    """
+    D, S, H = (np.asarray(v, dtype=float) for v in np.broadcast_arrays(D, S, H))
+    K = 2 * np.maximum(D, 0) * np.maximum(S, 0)
+    if np.any((H <= 0) & (K > 0)):
+        raise ValueError("Biaya penyimpanan H harus positif untuk setiap SKU yang dipesan")
+
+    nama, baris, batas = [], [], []
+    for label, koef, kapasitas in (('ruang', ruang, kapasitas_ruang), ('anggaran', biaya_unit, anggaran)):
+        if koef is None or kapasitas is None:
+            continue
+        if kapasitas <= 0:
+            raise ValueError(f"Kapasitas {label} harus positif")
+        koef = np.broadcast_to(np.asarray(koef, dtype=float), D.shape)
+        if np.any(koef < 0):
+            raise ValueError(f"Kebutuhan {label} per unit tidak boleh negatif")
+        nama.append(label)
+        baris.append(koef)
+        batas.append(float(kapasitas))
+    A = np.array(baris).reshape(len(baris), D.size)
+    b = np.array(batas)
+
+    Q_bebas = _kuantitas(K, H)
+    lam = np.zeros(len(b))
+    Q = Q_bebas
+    iterasi = 0
+    dilanggar = np.flatnonzero(A @ Q_bebas > b * (1 + toleransi)) if len(b) else np.zeros(0, dtype=int)
+    if dilanggar.size:
+        # Q(lambda) <= Q_bebas, jadi kendala yang sudah dipenuhi EOQ bebas tidak pernah perlu aktif
+        for ukuran in range(1, dilanggar.size + 1):
+            ketemu = False
+            for aktif in combinations(dilanggar.tolist(), ukuran):
+                aktif = list(aktif)
+                lam_aktif, Q_aktif, g, it = _newton(K, H, A[aktif], b[aktif], toleransi, maks_iter)
+                iterasi += it
+                lainnya = [j for j in range(len(b)) if j not in aktif]
+                memenuhi = np.all(A[lainnya] @ Q_aktif <= b[lainnya] * (1 + toleransi))
+                # KKT: kendala aktif terpenuhi dengan kesamaan dan multiplier positif
+                if memenuhi and np.all(lam_aktif > 0) and np.all(np.abs(g) <= 1e-6 * b[aktif]):
+                    lam[aktif] = lam_aktif
+                    Q = Q_aktif
+                    ketemu = True
+                    break
+            if ketemu:
+                break
+        else:
+            raise ValueError("Multiplier Lagrange tidak konvergen")
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        biaya_pemesanan = np.where(Q > 0, D * S / Q, 0.0)
+    biaya_penyimpanan = Q / 2 * H
+    pemakaian = A @ Q if len(b) else np.zeros(0)
+    indeks = {n: i for i, n in enumerate(nama)}
+    ambil = lambda arr, n: float(arr[indeks[n]]) if n in indeks else 0.0
+    return HasilEOQTerkendala(
+        Q=Q, Q_bebas=Q_bebas,
+        rop=np.maximum(D, 0) / HARI_PER_TAHUN * lead_time + safety_stock,
+        biaya_pemesanan=biaya_pemesanan, biaya_penyimpanan=biaya_penyimpanan,
+        total_biaya=biaya_pemesanan + biaya_penyimpanan,
+        harga_bayangan_ruang=ambil(lam, 'ruang'), harga_bayangan_anggaran=ambil(lam, 'anggaran'),
+        pemakaian_ruang=ambil(pemakaian, 'ruang'), pemakaian_anggaran=ambil(pemakaian, 'anggaran'),
+        iterasi=iterasi,
+    )
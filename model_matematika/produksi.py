@@ -0,0 +1,101 @@
+"""Optimasi produksi dua produk (meja & kursi) dengan metode titik sudut.
+
+Semua fungsi menerima skalar atau array NumPy yang dapat di-broadcast,
+sehingga ribuan skenario dapat dihitung dalam satu panggilan.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from .simpleks import selesaikan_ilp, selesaikan_lp
+
+
+class HasilLP(NamedTuple):
+    titik_x: np.ndarray        # (..., 6) koordinat x kandidat titik sudut
+    titik_y: np.ndarray        # (..., 6) koordinat y kandidat titik sudut
+    layak: np.ndarray          # (..., 6) kandidat yang memenuhi semua kendala
+    profit_titik: np.ndarray   # (..., 6) keuntungan di setiap kandidat
+    x_optimal: np.ndarray      # solusi kontinu
+    y_optimal: np.ndarray
+    x_bulat: np.ndarray        # solusi dibulatkan ke bawah (unit produksi)
+    y_bulat: np.ndarray
+    profit_optimal: np.ndarray
+
+
+def optimasi_lp_2d(profit_meja, profit_kursi, jam_meja, jam_kursi,
+                   kayu_meja, kayu_kursi, total_jam, total_kayu):
+    """Hitung titik sudut dan solusi optimal untuk setiap skenario.
+
+    Kandidat titik sudut (urutan tetap): (0, 0), dua titik potong sumbu-y,
+    dua titik potong sumbu-x, dan perpotongan kedua garis kendala.
+    """
+    p1, p2, a11, a12, a21, a22, b1, b2 = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (profit_meja, profit_kursi, jam_meja, jam_kursi,
+                                               kayu_meja, kayu_kursi, total_jam, total_kayu)))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_intercept1 = np.where(a11 > 0, b1 / a11, np.inf)
+        y_intercept1 = np.where(a12 > 0, b1 / a12, np.inf)
+        x_intercept2 = np.where(a21 > 0, b2 / a21, np.inf)
+        y_intercept2 = np.where(a22 > 0, b2 / a22, np.inf)
+
+        # Perpotongan dua garis kendala dengan aturan Cramer
+        det = a11 * a22 - a12 * a21
+        ix = (b1 * a22 - a12 * b2) / det
+        iy = (a11 * b2 - b1 * a21) / det
+
+    nol = np.zeros_like(b1)
+    titik_x = np.stack([nol, nol, nol, x_intercept1, x_intercept2, ix], axis=-1)
+    titik_y = np.stack([nol, y_intercept1, y_intercept2, nol, nol, iy], axis=-1)
+    layak = np.stack([
+        np.ones_like(b1, dtype=bool),
+        np.isfinite(y_intercept1) & (a22 * y_intercept1 <= b2),
+        np.isfinite(y_intercept2) & (a12 * y_intercept2 <= b1),
+        np.isfinite(x_intercept1) & (a21 * x_intercept1 <= b2),
+        np.isfinite(x_intercept2) & (a11 * x_intercept2 <= b1),
+        (det != 0) & (ix > 0) & (iy > 0),
+    ], axis=-1)
+
+    with np.errstate(invalid='ignore'):
+        profit_titik = p1[..., None] * titik_x + p2[..., None] * titik_y
+    skor = np.where(layak, profit_titik, -np.inf)
+    profit_optimal = skor.max(axis=-1)
+
+    # Jika ada beberapa titik dengan keuntungan sama, pilih x terkecil lalu y terkecil
+    terbaik = layak & (skor == profit_optimal[..., None])
+    x_kandidat = np.where(terbaik, titik_x, np.inf)
+    terbaik &= x_kandidat == x_kandidat.min(axis=-1, keepdims=True)
+    idx = np.argmin(np.where(terbaik, titik_y, np.inf), axis=-1)[..., None]
+
+    x_optimal = np.take_along_axis(titik_x, idx, axis=-1)[..., 0]
+    y_optimal = np.take_along_axis(titik_y, idx, axis=-1)[..., 0]
+    return HasilLP(
+        titik_x=titik_x, titik_y=titik_y, layak=layak, profit_titik=profit_titik,
+        x_optimal=x_optimal, y_optimal=y_optimal,
+        x_bulat=np.floor(x_optimal), y_bulat=np.floor(y_optimal),
+        profit_optimal=profit_optimal,
+    )
+
+
+def garis_kendala(jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu, n_titik=400):
+    """Titik-titik garis kendala untuk grafik daerah layak (satu skenario)."""
+    x_intercept1 = total_jam / jam_meja if jam_meja > 0 else float('inf')
+    x_intercept2 = total_kayu / kayu_meja if kayu_meja > 0 else float('inf')
+    max_x = max(x_intercept1, x_intercept2) if max(x_intercept1, x_intercept2) > 0 else 50
+    x_vals = np.linspace(0, max_x * 1.1, n_titik)
+    y1 = (total_jam - jam_meja * x_vals) / jam_kursi if jam_kursi > 0 else np.full_like(x_vals, float('inf'))
+    y2 = (total_kayu - kayu_meja * x_vals) / kayu_kursi if kayu_kursi > 0 else np.full_like(x_vals, float('inf'))
+    return x_vals, y1, y2, np.minimum(y1, y2)
+
+
+def optimasi_bauran_produksi(profit, kebutuhan, kapasitas, bilangan_bulat=True, batas_atas=None, maks_node=2000):
+    """Optimasi bauran produksi umum dengan N produk dan M sumber daya.
+
+    ``kebutuhan`` berukuran (M, N) dan boleh berupa matriks jarang.
+    Dengan ``bilangan_bulat=True`` digunakan branch-and-bound sehingga
+    jumlah produksi bulat yang dihasilkan benar-benar optimal, bukan
+    sekadar hasil pembulatan ke bawah dari solusi kontinu.
+    """
+    if bilangan_bulat:
+        return selesaikan_ilp(profit, kebutuhan, kapasitas, ub=batas_atas, maks_node=maks_node)
+    return selesaikan_lp(profit, kebutuhan, kapasitas, ub=batas_atas)
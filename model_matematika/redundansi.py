@@ -0,0 +1,163 @@
+"""Alokasi unit redundan paralel pada lini seri dengan anggaran terbatas.
+
+Tahap i memiliki n_i unit identik yang bekerja paralel, sehingga
+R_s = prod(1 - (1 - r_i)^n_i). Setiap unit tambahan di tahap i berbiaya
+b_i dan total biaya tidak boleh melebihi anggaran.
+
+Program dinamis bekerja di ruang log atas grid anggaran: tabel f_i(B)
+menyimpan log R terbaik untuk i tahap pertama dengan anggaran paling banyak
+B, sehingga setiap submasalah (tahap, anggaran) dihitung sekali saja. Tabel
+terakhir langsung memberi keandalan optimal untuk *semua* anggaran, jadi
+frontier Pareto biaya-keandalan diperoleh dari satu kali perhitungan.
+
+Untuk lini dengan ratusan tahap tersedia heuristik greedy yang menambah
+unit dengan kenaikan log R per rupiah terbesar; karena kenaikan tersebut
+menurun untuk setiap unit tambahan, urutan penambahan juga membentuk
+frontier (hampir) optimal dalam satu kali jalan.
+"""
+import heapq
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+# Batas ukuran (tahap x grid anggaran x unit) untuk memilih DP pada metode 'otomatis'
+MAKS_SEL_DP = 20_000_000
+# Unit tambahan berhenti dipertimbangkan bila peluang semua unit gagal di bawah nilai ini
+PELUANG_GAGAL_MIN = 1e-12
+
+
+class HasilRedundansi(NamedTuple):
+    unit: np.ndarray                # (n_tahap,) jumlah unit paralel per tahap pada anggaran penuh
+    biaya: float                    # biaya unit tambahan yang terpakai
+    keandalan: float
+    frontier_biaya: np.ndarray      # (P,) biaya setiap titik Pareto, naik
+    frontier_keandalan: np.ndarray  # (P,) keandalan lini pada titik tersebut
+    frontier_unit: np.ndarray       # (P, n_tahap)
+    metode: str
+
+
+def _keandalan(r, unit):
+    return np.prod(1 - (1 - r) ** unit, axis=-1)
+
+
+def _maks_tambahan(r, batas_biaya, biaya_unit, maks_tambahan):
+    """Unit tambahan terbanyak yang masih berarti dan terjangkau untuk setiap tahap."""
+    q = 1 - r
+    with np.errstate(divide='ignore', invalid='ignore'):
+        jenuh = np.where(q > 0, np.ceil(np.log(PELUANG_GAGAL_MIN) / np.log(np.where(q < 1, q, 0.5))), 0)
+    jenuh = np.where(q >= 1, 0, jenuh)
+    with np.errstate(divide='ignore'):
+        terjangkau = np.where(biaya_unit > 0, np.floor(batas_biaya / np.maximum(biaya_unit, 1e-300)), jenuh)
+    maks = np.minimum(jenuh, terjangkau)
+    if maks_tambahan is not None:
+        maks = np.minimum(maks, maks_tambahan)
+    return np.maximum(maks, 0).astype(np.int64)
+
+
+def alokasi_redundansi(r, biaya_unit, anggaran, metode='otomatis', satuan=None, maks_tambahan=None):
+    """Jumlah unit paralel per tahap yang memaksimalkan keandalan lini seri.
+
+    ``metode`` adalah 'dp' (optimal pada grid anggaran), 'greedy', atau
+    'otomatis'. Pada DP, biaya dibulatkan ke atas ke kelipatan ``satuan``
+    (default: FPB biaya bila semuanya bulat, selain itu anggaran/2000),
+    sehingga alokasi selalu layak untuk biaya sebenarnya.
+    """
+    r = np.asarray(r, dtype=float).ravel()
+    biaya_unit = np.broadcast_to(np.asarray(biaya_unit, dtype=float), r.shape)
+    if np.any((r < 0) | (r > 1)):
+        raise ValueError("Keandalan tahap harus di antara 0 dan 1")
+    if np.any(biaya_unit < 0) or anggaran < 0:
+        raise ValueError("Biaya dan anggaran tidak boleh negatif")
+
+    if satuan is None:
+        bulat = np.all(biaya_unit == np.round(biaya_unit)) and np.any(biaya_unit > 0)
+        satuan = float(np.gcd.reduce(np.round(biaya_unit).astype(np.int64))) if bulat else anggaran / 2000
+        satuan = satuan or 1.0
+    if metode == 'otomatis':
+        G = anggaran / satuan
+        sel = G * _maks_tambahan(r, anggaran, biaya_unit, maks_tambahan).clip(min=1).sum()
+        metode = 'dp' if sel <= MAKS_SEL_DP else 'greedy'
+    if metode == 'dp':
+        return _dp(r, biaya_unit, anggaran, satuan, maks_tambahan)
+    if metode == 'greedy':
+        return _greedy(r, biaya_unit, anggaran, maks_tambahan)
+    raise ValueError(f"Metode tidak dikenal: {metode}")
+
+
+def _dp(r, biaya_unit, anggaran, satuan, maks_tambahan):
+    G = int(math.floor(anggaran / satuan + 1e-9))
+    biaya_grid = np.ceil(biaya_unit / satuan - 1e-9).astype(np.int64)
+    maks = _maks_tambahan(r, G, biaya_grid, maks_tambahan)
+    q = 1 - r
+
+    f = np.zeros(G + 1)
+    pilihan = np.zeros((r.size, G + 1), dtype=np.int64)
+    for i in range(r.size):
+        baru = np.full(G + 1, -np.inf)
+        for y in range(int(maks[i]) + 1):
+            geser = int(biaya_grid[i]) * y
+            if geser > G:
+                break
+            gagal = q[i] ** (1 + y)
+            kandidat = f[:G + 1 - geser] + (math.log1p(-gagal) if gagal < 1 else -np.inf)
+            lebih = np.zeros(G + 1, dtype=bool)
+            lebih[geser:] = kandidat > baru[geser:]
+            baru[lebih] = kandidat[lebih[geser:]]
+            pilihan[i, lebih] = y
+        f = baru
+
+    # Titik Pareto: anggaran tempat keandalan optimal benar-benar naik
+    with np.errstate(invalid='ignore'):
+        naik = np.diff(f, prepend=-np.inf) > 1e-15 * np.maximum(1.0, np.abs(f))
+    naik[0] = True
+    titik = np.flatnonzero(naik & np.isfinite(f)) if np.isfinite(f).any() else np.zeros(1, dtype=np.int64)
+    tambahan = np.zeros((titik.size, r.size), dtype=np.int64)
+    sisa = titik.copy()
+    for i in range(r.size - 1, -1, -1):
+        tambahan[:, i] = pilihan[i, sisa]
+        sisa -= tambahan[:, i] * biaya_grid[i]
+    unit = 1 + tambahan
+    biaya = tambahan @ biaya_unit
+    return HasilRedundansi(
+        unit=unit[-1], biaya=float(biaya[-1]), keandalan=float(_keandalan(r, unit[-1])),
+        frontier_biaya=biaya, frontier_keandalan=_keandalan(r, unit), frontier_unit=unit, metode='dp',
+    )
+
+
+def _greedy(r, biaya_unit, anggaran, maks_tambahan):
+    q = 1 - r
+    maks = _maks_tambahan(r, anggaran, biaya_unit, maks_tambahan)
+    unit = np.ones(r.size, dtype=np.int64)
+
+    def skor(i):
+        # Kenaikan log R_s per rupiah bila tahap i mendapat satu unit lagi
+        naik = math.log1p(-q[i] ** (unit[i] + 1)) - math.log1p(-q[i] ** unit[i]) if q[i] < 1 else 0.0
+        return naik / biaya_unit[i] if biaya_unit[i] > 0 else math.inf
+
+    antrean = [(-skor(i), i) for i in range(r.size) if maks[i] > 0 and q[i] > 0]
+    heapq.heapify(antrean)
+    biaya, sisa = 0.0, float(anggaran)
+    riwayat_biaya, riwayat_unit = [0.0], [unit.copy()]
+    while antrean:
+        neg_skor, i = heapq.heappop(antrean)
+        if neg_skor >= 0 or biaya_unit[i] > sisa + 1e-9:
+            # Tahap ini tidak lagi terjangkau; tahap lain yang lebih murah masih mungkin
+            continue
+        unit[i] += 1
+        sisa -= biaya_unit[i]
+        biaya += biaya_unit[i]
+        riwayat_biaya.append(biaya)
+        riwayat_unit.append(unit.copy())
+        if unit[i] - 1 < maks[i]:
+            heapq.heappush(antrean, (-skor(i), i))
+
+    frontier_unit = np.array(riwayat_unit)
+    frontier_keandalan = _keandalan(r, frontier_unit)
+    # Buang titik yang tidak menaikkan keandalan (mis. presisi floating point sudah jenuh)
+    naik = np.diff(frontier_keandalan, prepend=-np.inf) > 0
+    return HasilRedundansi(
+        unit=unit, biaya=biaya, keandalan=float(_keandalan(r, unit)),
+        frontier_biaya=np.array(riwayat_biaya)[naik], frontier_keandalan=frontier_keandalan[naik],
+        frontier_unit=frontier_unit[naik], metode='greedy',
+    )
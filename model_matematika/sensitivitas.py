@@ -0,0 +1,157 @@
+"""Sapuan parameter (grid 1D/2D) dan analisis sensitivitas tornado.
+
+Setiap model didaftarkan sebagai fungsi tervektorisasi yang menerima
+parameter bernama dan mengembalikan dict keluaran. Grid dibentuk dengan
+broadcasting sehingga satu sapuan adalah satu panggilan batch. Hasil
+di-cache berdasarkan spesifikasi grid (parameter dasar, sumbu, keluaran).
+"""
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from .produksi import optimasi_lp_2d
+from .persediaan import hitung_eoq
+from .antrian import hitung_mmc
+from .keandalan import keandalan_struktur, seri
+
+UKURAN_CACHE = 32
+
+
+def _model_lp(profit_meja, profit_kursi, jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu):
+    hasil = optimasi_lp_2d(profit_meja, profit_kursi, jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu)
+    return {
+        'profit_optimal': hasil.profit_optimal,
+        'x_optimal': hasil.x_optimal,
+        'y_optimal': hasil.y_optimal,
+        'x_bulat': hasil.x_bulat,
+        'y_bulat': hasil.y_bulat,
+    }
+
+
+def _model_eoq(D, S, H, lead_time, safety_stock):
+    hasil = hitung_eoq(D, S, H, lead_time, safety_stock)
+    return {
+        'eoq': hasil.eoq,
+        'total_biaya': hasil.total_biaya,
+        'frekuensi_pesanan': hasil.frekuensi_pesanan,
+        'rop': hasil.rop,
+        'siklus_pemesanan': hasil.siklus_pemesanan,
+    }
+
+
+def _model_antrian(lmbda, mu, c):
+    hasil = hitung_mmc(lmbda, mu, np.rint(c))
+    return {
+        'Wq': hasil.Wq,
+        'W': hasil.W,
+        'Lq': hasil.Lq,
+        'L': hasil.L,
+        'rho': hasil.rho,
+        'prob_tunggu': hasil.prob_tunggu,
+    }
+
+
+def _model_keandalan(**R):
+    # Parameter adalah keandalan per mesin; lini diasumsikan seri
+    hasil = keandalan_struktur(seri(*R), R)
+    return {'keandalan': hasil.keandalan}
+
+
+MODEL = {
+    'lp': _model_lp,
+    'eoq': _model_eoq,
+    'antrian': _model_antrian,
+    'keandalan': _model_keandalan,
+}
+
+
+class HasilSapuan(NamedTuple):
+    sumbu: tuple      # nama parameter per sumbu grid
+    grid: tuple       # nilai grid (1D) per sumbu
+    keluaran: dict    # nama keluaran -> array berbentuk (n_1[, n_2])
+
+
+class HasilTornado(NamedTuple):
+    nilai_dasar: float
+    parameter: tuple     # diurutkan dari ayunan terbesar
+    rendah: np.ndarray   # keluaran saat parameter = dasar * (1 - variasi)
+    tinggi: np.ndarray   # keluaran saat parameter = dasar * (1 + variasi)
+
+
+def _evaluasi(model, parameter):
+    if model not in MODEL:
+        raise ValueError(f"Model tidak dikenal: {model}")
+    return MODEL[model](**parameter)
+
+
+def _beku(hasil):
+    for nilai in hasil.values():
+        nilai.flags.writeable = False
+    return hasil
+
+
+@lru_cache(maxsize=UKURAN_CACHE)
+def _sapuan_tercache(model, dasar, sumbu, keluaran):
+    grid = tuple(np.linspace(awal, akhir, int(n)) for _, (awal, akhir, n) in sumbu)
+    parameter = {nama: np.float64(nilai) for nama, nilai in dasar}
+    # Sumbu pertama menjadi baris, sumbu kedua kolom
+    for i, (nama, _) in enumerate(sumbu):
+        bentuk = [1] * len(sumbu)
+        bentuk[i] = -1
+        parameter[nama] = grid[i].reshape(bentuk)
+    bentuk_grid = tuple(g.size for g in grid)
+    hasil = _evaluasi(model, parameter)
+    if keluaran is not None:
+        hasil = {k: hasil[k] for k in keluaran}
+    hasil = {k: np.broadcast_to(np.asarray(v, dtype=float), bentuk_grid).copy() for k, v in hasil.items()}
+    for g in grid:
+        g.flags.writeable = False
+    return HasilSapuan(sumbu=tuple(nama for nama, _ in sumbu), grid=grid, keluaran=_beku(hasil))
+
+
+def sapuan(model, parameter_dasar, sumbu, keluaran=None):
+    """Evaluasi ``model`` pada grid 1D/2D dalam satu batch tervektorisasi.
+
+    ``sumbu`` memetakan nama parameter ke ``(awal, akhir, n_titik)``, satu
+    atau dua entri. Parameter lain diambil dari ``parameter_dasar``. Hasil
+    di-cache per spesifikasi grid dan dikembalikan sebagai array read-only.
+    """
+    if not 1 <= len(sumbu) <= 2:
+        raise ValueError("Sapuan mendukung satu atau dua sumbu")
+    tidak_dikenal = [nama for nama in sumbu if nama not in parameter_dasar]
+    if tidak_dikenal:
+        raise KeyError(f"Parameter sumbu tidak ada di parameter dasar: {tidak_dikenal}")
+    dasar = tuple((nama, float(nilai)) for nama, nilai in parameter_dasar.items())
+    spesifikasi = tuple((nama, (float(a), float(b), int(n))) for nama, (a, b, n) in sumbu.items())
+    return _sapuan_tercache(model, dasar, spesifikasi, None if keluaran is None else tuple(keluaran))
+
+
+def analisis_tornado(model, parameter_dasar, keluaran, variasi=0.2, parameter=None, batas=None):
+    """Ayunan ``keluaran`` saat tiap parameter digeser ±``variasi`` (relatif).
+
+    Semua 2k evaluasi dijalankan dalam satu batch. ``batas`` opsional
+    memetakan nama parameter ke ``(min, maks)``, misalnya keandalan <= 1.
+    """
+    parameter = tuple(parameter_dasar) if parameter is None else tuple(parameter)
+    batas = batas or {}
+    k = len(parameter)
+    batch = {nama: np.full(2 * k + 1, float(nilai)) for nama, nilai in parameter_dasar.items()}
+    for i, nama in enumerate(parameter):
+        dasar = float(parameter_dasar[nama])
+        rendah, tinggi = dasar * (1 - variasi), dasar * (1 + variasi)
+        if nama in batas:
+            rendah, tinggi = np.clip([rendah, tinggi], *batas[nama])
+        batch[nama][2 * i] = rendah
+        batch[nama][2 * i + 1] = tinggi
+    nilai = np.broadcast_to(np.asarray(_evaluasi(model, batch)[keluaran], dtype=float), (2 * k + 1,))
+    rendah, tinggi, dasar = nilai[0:2 * k:2], nilai[1:2 * k:2], float(nilai[-1])
+    # Keluaran tak terdefinisi (mis. antrian tidak stabil) dianggap ayunan tak hingga
+    ayunan = np.nan_to_num(np.abs(tinggi - rendah), nan=np.inf)
+    urut = np.argsort(-ayunan, kind='stable')
+    return HasilTornado(nilai_dasar=dasar, parameter=tuple(parameter[i] for i in urut),
+                        rendah=rendah[urut], tinggi=tinggi[urut])
+
+
+def bersihkan_cache_sapuan():
+    _sapuan_tercache.cache_clear()
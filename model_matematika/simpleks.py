@@ -0,0 +1,646 @@
+"""Revised simplex berbatas dan branch-and-bound untuk LP/ILP umum.
+
+Bentuk masalah::
+
+    maks/min  c^T x
+    terhadap  A x <= b,   lb <= x <= ub
+
+Matriks kendala disimpan dalam format kolom terkompresi (CSC) sehingga
+pricing dan pengambilan kolom hanya menyentuh elemen tak-nol. Input ``A``
+boleh berupa array padat atau matriks jarang apa pun yang memiliki
+``tocoo()`` (mis. ``scipy.sparse``) tanpa perlu mengimpor SciPy.
+"""
+import heapq
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+TOL = 1e-9
+TOL_PIVOT = 1e-9
+TOL_INTEGER = 1e-6
+REFAKTOR_SETIAP = 64
+
+
+class HasilSimpleks(NamedTuple):
+    status: str             # 'optimal', 'tidak_layak', 'tak_terbatas', 'batas_iterasi'
+    x: np.ndarray           # nilai variabel keputusan
+    nilai: float            # nilai fungsi tujuan
+    dual: np.ndarray        # harga bayangan tiap kendala (dalam arah tujuan asli)
+    reduced_cost: np.ndarray
+    basis: np.ndarray       # indeks kolom basis (struktural 0..n-1, slack n..n+m-1)
+    di_atas: np.ndarray     # variabel non-basis yang berada di batas atas
+    iterasi: int
+
+
+class HasilBnB(NamedTuple):
+    status: str             # 'optimal', 'tidak_layak', 'batas_node'
+    x: np.ndarray
+    nilai: float
+    batas: float            # batas terbaik relaksasi LP yang belum dipangkas
+    gap: float
+    node: int
+
+
+class HasilSensitivitasLP(NamedTuple):
+    dual: np.ndarray        # harga bayangan tiap kendala
+    reduced_cost: np.ndarray
+    slack: np.ndarray       # sisa sumber daya b - A x
+    rentang_b: np.ndarray   # (m, 2) rentang ruas kanan yang mempertahankan basis optimal
+    rentang_c: np.ndarray   # (n, 2) rentang koefisien tujuan yang mempertahankan solusi optimal
+
+
+class _MatriksCSC:
+    """Matriks kolom terkompresi minimal untuk kebutuhan simpleks."""
+
+    def __init__(self, rows, cols, vals, shape):
+        m, n = shape
+        urut = np.argsort(cols, kind='stable')
+        self.rows = np.asarray(rows, dtype=np.intp)[urut]
+        self.cols = np.asarray(cols, dtype=np.intp)[urut]
+        self.vals = np.asarray(vals, dtype=float)[urut]
+        self.indptr = np.searchsorted(self.cols, np.arange(n + 1))
+        self.shape = (m, n)
+        # Untuk matriks yang cukup padat, perkalian padat lebih cepat dari bincount
+        self.padat = None
+        if self.vals.size > 0.1 * m * n:
+            self.padat = np.zeros(shape)
+            self.padat[self.rows, self.cols] = self.vals
+
+    @classmethod
+    def dari(cls, A):
+        if hasattr(A, 'tocoo'):
+            coo = A.tocoo()
+            return cls(coo.row, coo.col, coo.data, coo.shape)
+        A = np.atleast_2d(np.asarray(A, dtype=float))
+        rows, cols = np.nonzero(A)
+        return cls(rows, cols, A[rows, cols], A.shape)
+
+    def kolom(self, j):
+        a, b = self.indptr[j], self.indptr[j + 1]
+        return self.rows[a:b], self.vals[a:b]
+
+    def rmatvec(self, y):
+        """Hitung A^T y."""
+        if self.padat is not None:
+            return self.padat.T @ y
+        return np.bincount(self.cols, weights=self.vals * y[self.rows], minlength=self.shape[1])
+
+    def matvec(self, x):
+        """Hitung A x."""
+        if self.padat is not None:
+            return self.padat @ x
+        return np.bincount(self.rows, weights=self.vals * x[self.cols], minlength=self.shape[0])
+
+    def elemen(self, i, j):
+        r, v = self.kolom(j)
+        k = np.flatnonzero(r == i)
+        return float(v[k[0]]) if k.size else 0.0
+
+    def ubah(self, i, j, nilai):
+        """Ganti elemen A[i, j] di tempat."""
+        a = self.indptr[j]
+        k = np.flatnonzero(self.rows[a:self.indptr[j + 1]] == i)
+        if k.size:
+            self.vals[a + k[0]] = nilai
+        else:
+            padat = self.padat
+            self.__init__(np.append(self.rows, i), np.append(self.cols, j), np.append(self.vals, nilai), self.shape)
+            if padat is not None and self.padat is None:
+                self.padat = padat
+        if self.padat is not None:
+            self.padat[i, j] = nilai
+
+
+def _siapkan(c, A, b, lb, ub):
+    c = np.asarray(c, dtype=float).ravel()
+    n = c.size
+    A = A if isinstance(A, _MatriksCSC) else _MatriksCSC.dari(A)
+    m = A.shape[0]
+    if A.shape[1] != n:
+        raise ValueError(f"A memiliki {A.shape[1]} kolom, sedangkan c memiliki {n} elemen")
+    b = np.asarray(b, dtype=float).ravel()
+    if b.size != m:
+        raise ValueError(f"b harus memiliki {m} elemen")
+    lb = np.zeros(n) if lb is None else np.broadcast_to(np.asarray(lb, dtype=float), (n,)).copy()
+    ub = np.full(n, np.inf) if ub is None else np.broadcast_to(np.asarray(ub, dtype=float), (n,)).copy()
+    if not np.all(np.isfinite(lb)):
+        raise ValueError("Batas bawah variabel harus berhingga")
+    return c, A, b, lb, ub
+
+
+class _Simpleks:
+    """Keadaan revised simplex berbatas atas kolom [A | I | ±I].
+
+    Kolom n..n+m-1 adalah slack, kolom n+m..n+2m-1 adalah variabel buatan
+    untuk fase 1.
+    """
+
+    def __init__(self, A, b, lb, ub):
+        m, n = A.shape
+        self.m, self.n = m, n
+        self.A, self.b = A, b
+        self.lo = np.concatenate([lb, np.zeros(2 * m)])
+        self.hi = np.concatenate([ub, np.full(m, np.inf), np.zeros(m)])
+        self.tanda_buatan = np.ones(m)
+        self.x = self.lo.copy()
+        self.basis = np.arange(n, n + m)
+        self.iterasi = 0
+        self.sejak_refaktor = 0
+
+    # --- Operasi kolom pada matriks lengkap [A | I | diag(tanda)] ---
+    def kolom_padat(self, j):
+        n, m = self.n, self.m
+        col = np.zeros(m)
+        if j < n:
+            r, v = self.A.kolom(j)
+            col[r] = v
+        elif j < n + m:
+            col[j - n] = 1.0
+        else:
+            col[j - n - m] = self.tanda_buatan[j - n - m]
+        return col
+
+    def alpha(self, j):
+        n, m = self.n, self.m
+        if j < n:
+            r, v = self.A.kolom(j)
+            return self.Binv[:, r] @ v
+        if j < n + m:
+            return self.Binv[:, j - n].copy()
+        return self.Binv[:, j - n - m] * self.tanda_buatan[j - n - m]
+
+    def rmatvec_penuh(self, y):
+        return np.concatenate([self.A.rmatvec(y), y, y * self.tanda_buatan])
+
+    def refaktor(self):
+        B = np.column_stack([self.kolom_padat(j) for j in self.basis]) if self.m else np.zeros((0, 0))
+        self.Binv = np.linalg.inv(B)
+        non_basis = np.ones(self.x.size, dtype=bool)
+        non_basis[self.basis] = False
+        xN = np.where(non_basis, self.x, 0.0)
+        sisa = self.b - self.A.matvec(xN[:self.n]) - xN[self.n:self.n + self.m] \
+            - xN[self.n + self.m:] * self.tanda_buatan
+        self.x[self.basis] = self.Binv @ sisa
+
+    def mulai_dingin(self):
+        """Basis awal dari slack; baris yang tidak layak memakai variabel buatan."""
+        n, m = self.n, self.m
+        self.x = self.lo.copy()
+        self.x[n + m:] = 0.0
+        sisa = self.b - self.A.matvec(self.x[:n])
+        buatan = sisa < 0
+        self.tanda_buatan = np.where(buatan, -1.0, 1.0)
+        self.hi[n + m:] = np.where(buatan, np.inf, 0.0)
+        self.basis = np.where(buatan, np.arange(n + m, n + 2 * m), np.arange(n, n + m))
+        self.refaktor()
+        return buatan.any()
+
+    def mulai_hangat(self, basis, di_atas):
+        """Pasang basis dari solusi sebelumnya; kembalikan False jika basis singular."""
+        n, m = self.n, self.m
+        self.hi[n + m:] = 0.0
+        self.basis = np.asarray(basis, dtype=np.intp).copy()
+        if self.basis.size != m:
+            return False
+        self.x = self.lo.copy()
+        atas = np.zeros(self.x.size, dtype=bool)
+        atas[:n + m] = di_atas
+        atas &= np.isfinite(self.hi)
+        self.x[atas] = self.hi[atas]
+        try:
+            self.refaktor()
+        except np.linalg.LinAlgError:
+            return False
+        return True
+
+    def layak_primal(self):
+        xB = self.x[self.basis]
+        return bool(np.all(xB >= self.lo[self.basis] - 1e-7) and np.all(xB <= self.hi[self.basis] + 1e-7))
+
+    def layak_dual(self, biaya):
+        y = self.Binv.T @ biaya[self.basis]
+        d = biaya - self.rmatvec_penuh(y)
+        di_atas = (self.x >= self.hi - TOL) & np.isfinite(self.hi)
+        salah = np.where(di_atas, d > 1e-7, d < -1e-7) & (self.lo != self.hi)
+        salah[self.basis] = False
+        return not salah.any()
+
+    def pivot(self, r, q, alpha):
+        """Tukar kolom basis ke-r dengan kolom q (pembaruan eta invers basis)."""
+        self.basis[r] = q
+        baris_pivot = self.Binv[r] / alpha[r]
+        self.Binv -= np.outer(alpha, baris_pivot)
+        self.Binv[r] = baris_pivot
+        self.sejak_refaktor += 1
+        if self.sejak_refaktor >= REFAKTOR_SETIAP:
+            self.refaktor()
+            self.sejak_refaktor = 0
+
+    def jalankan_dual(self, biaya, max_iter):
+        """Iterasi dual simplex dari basis yang layak dual (dipakai untuk warm start).
+
+        Cocok setelah perubahan batas variabel atau ruas kanan: basis lama
+        tetap optimal secara dual dan biasanya hanya perlu beberapa pivot.
+        """
+        tetap = self.lo == self.hi
+        while True:
+            if self.iterasi >= max_iter:
+                return 'batas_iterasi'
+            xB = self.x[self.basis]
+            loB, hiB = self.lo[self.basis], self.hi[self.basis]
+            pelanggaran = np.maximum(loB - xB, xB - hiB)
+            r = int(np.argmax(pelanggaran)) if self.m else -1
+            if r < 0 or pelanggaran[r] <= 1e-9 * (1 + abs(xB[r])):
+                return 'optimal'
+            naik = xB[r] < loB[r]
+            target = loB[r] if naik else hiB[r]
+
+            y = self.Binv.T @ biaya[self.basis]
+            d = biaya - self.rmatvec_penuh(y)
+            baris = self.rmatvec_penuh(self.Binv[r])
+            di_atas = (self.x >= self.hi - TOL) & np.isfinite(self.hi)
+            # Menaikkan x_j mengubah x_Br sebesar -baris_j per unit
+            if naik:
+                boleh = np.where(di_atas, baris > TOL_PIVOT, baris < -TOL_PIVOT)
+            else:
+                boleh = np.where(di_atas, baris < -TOL_PIVOT, baris > TOL_PIVOT)
+            boleh &= ~tetap
+            boleh[self.basis] = False
+            if not boleh.any():
+                return 'tidak_layak'
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rasio = np.where(boleh, np.abs(d) / np.abs(baris), np.inf)
+            q = int(np.argmin(rasio))
+
+            alpha = self.alpha(q)
+            theta = (xB[r] - target) / alpha[r]
+            self.x[self.basis] = xB - theta * alpha
+            self.x[q] += theta
+            keluar = self.basis[r]
+            self.x[keluar] = target
+            self.iterasi += 1
+            self.pivot(r, q, alpha)
+
+    def jalankan(self, biaya, max_iter):
+        """Iterasi primal simplex (minimasi). Mengembalikan status string."""
+        tetap = self.lo == self.hi
+        degenerasi = 0
+        while True:
+            if self.iterasi >= max_iter:
+                return 'batas_iterasi'
+            y = self.Binv.T @ biaya[self.basis]
+            d = biaya - self.rmatvec_penuh(y)
+            di_atas = (self.x >= self.hi - TOL) & np.isfinite(self.hi)
+            bisa_naik = (d < -TOL) & ~di_atas
+            bisa_turun = (d > TOL) & di_atas
+            kandidat = (bisa_naik | bisa_turun) & ~tetap
+            kandidat[self.basis] = False
+            if not kandidat.any():
+                self.y, self.d = y, d
+                return 'optimal'
+
+            # Aturan Dantzig, beralih ke aturan Bland saat terjadi degenerasi panjang
+            if degenerasi > 50:
+                q = int(np.flatnonzero(kandidat)[0])
+            else:
+                q = int(np.argmax(np.where(kandidat, np.abs(d), -1.0)))
+            arah = 1.0 if bisa_naik[q] else -1.0
+
+            alpha = self.alpha(q)
+            gerak = arah * alpha  # x_B berubah sebesar -t * gerak
+            xB = self.x[self.basis]
+            loB, hiB = self.lo[self.basis], self.hi[self.basis]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                batas_turun = np.where(gerak > TOL_PIVOT, (xB - loB) / gerak, np.inf)
+                batas_naik = np.where(gerak < -TOL_PIVOT, (hiB - xB) / -gerak, np.inf)
+            rasio = np.maximum(np.minimum(batas_turun, batas_naik), 0.0)
+            r = int(np.argmin(rasio)) if self.m else -1
+            t_basis = rasio[r] if self.m else np.inf
+            t_flip = self.hi[q] - self.lo[q]
+
+            if not np.isfinite(t_basis) and not np.isfinite(t_flip):
+                return 'tak_terbatas'
+
+            self.iterasi += 1
+            if t_flip <= t_basis:
+                # Variabel masuk hanya berpindah ke batas lainnya
+                self.x[self.basis] = xB - t_flip * gerak
+                self.x[q] = self.hi[q] if arah > 0 else self.lo[q]
+                degenerasi = 0
+                continue
+
+            t = t_basis
+            degenerasi = degenerasi + 1 if t <= TOL else 0
+            keluar = self.basis[r]
+            self.x[self.basis] = xB - t * gerak
+            self.x[q] += arah * t
+            self.x[keluar] = loB[r] if batas_turun[r] <= batas_naik[r] else hiB[r]
+            self.pivot(r, q, alpha)
+
+
+def selesaikan_lp(c, A, b, lb=None, ub=None, maksimasi=True, basis_awal=None, max_iter=None):
+    """Selesaikan LP ``c^T x`` dengan ``A x <= b`` dan ``lb <= x <= ub``.
+
+    ``basis_awal`` berupa pasangan ``(basis, di_atas)`` dari hasil sebelumnya
+    (warm start). Basis yang masih layak primal langsung diteruskan ke fase 2;
+    basis yang hanya layak dual (mis. setelah batas variabel diubah) diperbaiki
+    dengan dual simplex. Selain itu digunakan start dingin dua fase.
+    """
+    return _selesaikan(c, A, b, lb, ub, maksimasi, basis_awal, max_iter)[0]
+
+
+def _selesaikan(c, A, b, lb, ub, maksimasi, basis_awal, max_iter):
+    """Seperti :func:`selesaikan_lp`, tetapi juga mengembalikan keadaan simpleks akhir."""
+    c, A, b, lb, ub = _siapkan(c, A, b, lb, ub)
+    m, n = A.shape
+    if np.any(lb > ub):
+        return _hasil_gagal('tidak_layak', lb, n, m), None
+    max_iter = max_iter if max_iter is not None else 50 * (n + m) + 1000
+    biaya = np.concatenate([-c if maksimasi else c, np.zeros(2 * m)])
+
+    s = _Simpleks(A, b, lb, ub)
+    hangat = basis_awal is not None and s.mulai_hangat(*basis_awal)
+    if hangat and not s.layak_primal():
+        hangat = s.layak_dual(biaya)
+        if hangat:
+            status = s.jalankan_dual(biaya, max_iter)
+            if status == 'tidak_layak':
+                return _hasil_gagal(status, s.x[:n], n, m, s.iterasi), None
+            hangat = status == 'optimal'
+    if not hangat and s.mulai_dingin():
+        biaya1 = np.concatenate([np.zeros(n + m), np.ones(m)])
+        status = s.jalankan(biaya1, max_iter)
+        if status != 'optimal':
+            return _hasil_gagal(status, s.x[:n], n, m, s.iterasi), None
+        if s.x[n + m:].sum() > 1e-7 * (1 + np.abs(b).max(initial=0.0)):
+            return _hasil_gagal('tidak_layak', s.x[:n], n, m, s.iterasi), None
+        s.hi[n + m:] = 0.0
+        s.x[n + m:] = np.minimum(s.x[n + m:], 0.0)
+
+    status = s.jalankan(biaya, max_iter)
+    if status != 'optimal':
+        return _hasil_gagal(status, s.x[:n], n, m, s.iterasi), None
+    return _hasil_optimal(s, c, maksimasi), s
+
+
+def _hasil_optimal(s, c, maksimasi):
+    n, m = s.n, s.m
+    tanda = -1.0 if maksimasi else 1.0
+    x = s.x[:n].copy()
+    di_atas = (s.x[:n + m] >= s.hi[:n + m] - TOL) & np.isfinite(s.hi[:n + m])
+    di_atas[s.basis[s.basis < n + m]] = False
+    return HasilSimpleks(
+        status='optimal', x=x, nilai=float(c @ x),
+        dual=tanda * s.y, reduced_cost=tanda * s.d[:n],
+        basis=s.basis.copy(), di_atas=di_atas, iterasi=s.iterasi,
+    )
+
+
+def _hasil_gagal(status, x, n, m, iterasi=0):
+    return HasilSimpleks(status=status, x=np.asarray(x, dtype=float).copy(), nilai=math.nan,
+                         dual=np.full(m, np.nan), reduced_cost=np.full(n, np.nan),
+                         basis=np.zeros(0, dtype=np.intp), di_atas=np.zeros(n + m, dtype=bool),
+                         iterasi=iterasi)
+
+
+def selesaikan_ilp(c, A, b, lb=None, ub=None, maksimasi=True, integer=None,
+                   maks_node=2000, gap_relatif=1e-9):
+    """Branch-and-bound best-first di atas :func:`selesaikan_lp`.
+
+    ``integer`` adalah mask boolean variabel bilangan bulat (default: semua).
+    Node dipangkas bila batas relaksasinya tidak lebih baik dari solusi
+    terbaik; pencarian berhenti setelah ``maks_node`` relaksasi diselesaikan.
+    """
+    c, A, b, lb, ub = _siapkan(c, A, b, lb, ub)
+    n = c.size
+    integer = np.ones(n, dtype=bool) if integer is None else np.asarray(integer, dtype=bool)
+    tanda = 1.0 if maksimasi else -1.0
+    # Jika koefisien tujuan untuk variabel bulat juga bulat, batas LP boleh dibulatkan
+    tujuan_bulat = np.all(np.isin(np.flatnonzero(c), np.flatnonzero(integer))) and np.all(c == np.round(c))
+
+    def batas_node(nilai):
+        skor = tanda * nilai
+        return math.floor(skor + 1e-6) if tujuan_bulat else skor
+
+    def layak(x):
+        return (np.all(A.matvec(x) <= b + 1e-7 * (1 + np.abs(b)))
+                and np.all(x >= lb - 1e-9) and np.all(x <= ub + 1e-9))
+
+    terbaik_x, terbaik_skor = None, -math.inf
+    akar = selesaikan_lp(c, A, b, lb, ub, maksimasi)
+    node = 1
+    if akar.status == 'tak_terbatas':
+        raise ValueError("Relaksasi LP tidak terbatas; ILP tidak dapat diselesaikan")
+    if akar.status != 'optimal':
+        return HasilBnB('tidak_layak', akar.x, math.nan, math.nan, math.nan, node)
+
+    # Heuristik pembulatan ke bawah (selalu layak untuk kendala kapasitas nonnegatif)
+    x_bulat = np.where(integer, np.floor(akar.x + TOL_INTEGER), akar.x)
+    if layak(x_bulat):
+        terbaik_x, terbaik_skor = x_bulat, tanda * float(c @ x_bulat)
+
+    antrian = [(-batas_node(akar.nilai), 0, lb, ub, akar)]
+    urutan = 1
+    while antrian and node < maks_node:
+        neg_batas, _, lb_n, ub_n, hasil = heapq.heappop(antrian)
+        if -neg_batas <= terbaik_skor + gap_relatif * abs(terbaik_skor):
+            continue
+        pecahan = np.abs(hasil.x - np.round(hasil.x))
+        pecahan[~integer] = 0.0
+        j = int(np.argmax(pecahan))
+        if pecahan[j] <= TOL_INTEGER:
+            x = np.where(integer, np.round(hasil.x), hasil.x)
+            skor = tanda * float(c @ x)
+            if skor > terbaik_skor:
+                terbaik_x, terbaik_skor = x, skor
+            continue
+
+        v = hasil.x[j]
+        for sisi in (0, 1):
+            lb_c, ub_c = lb_n.copy(), ub_n.copy()
+            if sisi == 0:
+                ub_c[j] = math.floor(v)
+            else:
+                lb_c[j] = math.ceil(v)
+            anak = selesaikan_lp(c, A, b, lb_c, ub_c, maksimasi, basis_awal=(hasil.basis, hasil.di_atas))
+            node += 1
+            if anak.status != 'optimal':
+                continue
+            batas = batas_node(anak.nilai)
+            if batas > terbaik_skor + gap_relatif * abs(terbaik_skor):
+                heapq.heappush(antrian, (-batas, urutan, lb_c, ub_c, anak))
+                urutan += 1
+
+    sisa_batas = max([-a[0] for a in antrian], default=-math.inf)
+    batas_akhir = max(sisa_batas, terbaik_skor)
+    if terbaik_x is None:
+        status = 'batas_node' if antrian else 'tidak_layak'
+        return HasilBnB(status, akar.x, math.nan, tanda * batas_akhir, math.inf, node)
+    gap = (batas_akhir - terbaik_skor) / max(1.0, abs(terbaik_skor))
+    status = 'optimal' if gap <= max(gap_relatif, 1e-12) or not antrian else 'batas_node'
+    return HasilBnB(status, terbaik_x, tanda * terbaik_skor, tanda * batas_akhir, gap, node)
+
+
+class LPInkremental:
+    """LP yang menyimpan basis optimal untuk analisis sensitivitas dan perubahan cepat.
+
+    Invers basis dari penyelesaian terakhir dipertahankan. Perubahan satu
+    ruas kanan atau satu koefisien tujuan yang masih berada di dalam rentang
+    optimalitasnya hanya memperbarui solusi dan nilai dual dengan satu kolom
+    atau baris invers basis (O(m) atau O(nnz)), tanpa pivot. Di luar rentang,
+    atau saat koefisien kendala berubah, LP diselesaikan ulang dengan warm
+    start dari basis tersimpan.
+
+    Rentang dihitung untuk perubahan satu parameter; pada solusi degenerate
+    rentang yang dilaporkan bisa lebih sempit dari rentang sesungguhnya.
+    """
+
+    def __init__(self, c, A, b, lb=None, ub=None, maksimasi=True):
+        c, A, b, lb, ub = _siapkan(c, A, b, lb, ub)
+        self.c, self.A, self.b = c.copy(), A, b.copy()
+        self.lb, self.ub = lb, ub
+        self.maksimasi = maksimasi
+        self.tanda = -1.0 if maksimasi else 1.0
+        self.inkremental = 0
+        self.diselesaikan_ulang = 0
+        self._s = None
+        self._selesaikan()
+
+    def _selesaikan(self):
+        awal = None
+        if self._s is not None:
+            awal = (self.hasil.basis, self.hasil.di_atas)
+        self.hasil, self._s = _selesaikan(self.c, self.A, self.b, self.lb, self.ub, self.maksimasi, awal, None)
+        self.diselesaikan_ulang += 1
+        return self.hasil
+
+    def _perbarui_hasil(self):
+        s = self._s
+        self.hasil = self.hasil._replace(x=s.x[:s.n].copy(), nilai=float(self.c @ s.x[:s.n]),
+                                         dual=self.tanda * s.y, reduced_cost=self.tanda * s.d[:s.n])
+        self.inkremental += 1
+        return self.hasil
+
+    # --- Rentang optimalitas ---
+
+    def rentang_b(self, i):
+        """Rentang (bawah, atas) ruas kanan kendala ke-i dengan basis yang sama."""
+        s = self._s
+        if s is None:
+            return (math.nan, math.nan)
+        arah = s.Binv[:, i]
+        xB, loB, hiB = s.x[s.basis], s.lo[s.basis], s.hi[s.basis]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            naik = np.where(arah > TOL_PIVOT, (hiB - xB) / arah, np.where(arah < -TOL_PIVOT, (loB - xB) / arah, np.inf))
+            turun = np.where(arah > TOL_PIVOT, (loB - xB) / arah, np.where(arah < -TOL_PIVOT, (hiB - xB) / arah, -np.inf))
+        return (self.b[i] + min(turun.max(initial=-np.inf), 0.0), self.b[i] + max(naik.min(initial=np.inf), 0.0))
+
+    def _rentang_biaya(self, j):
+        """Rentang perubahan biaya internal (minimasi) variabel j yang mempertahankan optimalitas."""
+        s = self._s
+        if s.lo[j] == s.hi[j]:
+            return (-np.inf, np.inf)
+        posisi = np.flatnonzero(s.basis == j)
+        if posisi.size == 0:
+            di_atas = s.x[j] >= s.hi[j] - TOL and np.isfinite(s.hi[j])
+            return (-np.inf, -s.d[j]) if di_atas else (-s.d[j], np.inf)
+        baris = s.rmatvec_penuh(s.Binv[posisi[0]])
+        non_basis = (s.lo != s.hi) & (np.abs(baris) > TOL_PIVOT)
+        non_basis[s.basis] = False
+        k = np.flatnonzero(non_basis)
+        rasio = s.d[k] / baris[k]
+        di_atas = (s.x[k] >= s.hi[k] - TOL) & np.isfinite(s.hi[k])
+        # Di batas bawah d_k - delta * baris_k harus tetap >= 0, di batas atas <= 0
+        batas_atas = (baris[k] > 0) != di_atas
+        return (rasio[~batas_atas].max(initial=-np.inf), rasio[batas_atas].min(initial=np.inf))
+
+    def rentang_c(self, j):
+        """Rentang (bawah, atas) koefisien tujuan variabel j dengan solusi yang sama."""
+        if self._s is None:
+            return (math.nan, math.nan)
+        turun, naik = self._rentang_biaya(j)
+        if self.maksimasi:
+            turun, naik = -naik, -turun
+        return (self.c[j] + min(turun, 0.0), self.c[j] + max(naik, 0.0))
+
+    def sensitivitas(self):
+        """Harga bayangan, reduced cost, slack, serta rentang ruas kanan dan koefisien tujuan."""
+        m, n = self.A.shape
+        return HasilSensitivitasLP(
+            dual=self.hasil.dual, reduced_cost=self.hasil.reduced_cost,
+            slack=self.b - self.A.matvec(self.hasil.x),
+            rentang_b=np.array([self.rentang_b(i) for i in range(m)]).reshape(m, 2),
+            rentang_c=np.array([self.rentang_c(j) for j in range(n)]).reshape(n, 2),
+        )
+
+    # --- Perubahan satu parameter ---
+
+    def ubah_b(self, i, nilai):
+        """Ganti ruas kanan kendala ke-i dan kembalikan hasil terbaru."""
+        bawah, atas = self.rentang_b(i)
+        delta = nilai - self.b[i]
+        self.b[i] = nilai
+        if not bawah <= nilai <= atas:
+            return self._selesaikan()
+        s = self._s
+        s.b = self.b
+        s.x[s.basis] += delta * s.Binv[:, i]
+        return self._perbarui_hasil()
+
+    def ubah_c(self, j, nilai):
+        """Ganti koefisien tujuan variabel j dan kembalikan hasil terbaru."""
+        bawah, atas = self.rentang_c(j)
+        delta = nilai - self.c[j]
+        self.c[j] = nilai
+        if not bawah <= nilai <= atas:
+            return self._selesaikan()
+        s = self._s
+        delta_biaya = self.tanda * delta
+        posisi = np.flatnonzero(s.basis == j)
+        if posisi.size:
+            s.y = s.y + delta_biaya * s.Binv[posisi[0]]
+            s.d = s.d - delta_biaya * s.rmatvec_penuh(s.Binv[posisi[0]])
+            s.d[j] = 0.0
+        else:
+            s.d = s.d.copy()
+            s.d[j] += delta_biaya
+        return self._perbarui_hasil()
+
+    def ubah_a(self, i, j, nilai):
+        """Ganti koefisien kendala A[i, j] dan kembalikan hasil terbaru."""
+        self.A.ubah(i, j, nilai)
+        s = self._s
+        if s is None or j in s.basis or s.x[j] != 0.0:
+            return self._selesaikan()
+        # Kolom non-basis di nol: solusi tetap, cukup reduced cost-nya yang berubah
+        s.d = s.d.copy()
+        baris, nilai_kolom = s.A.kolom(j)
+        s.d[j] = self.tanda * self.c[j] - nilai_kolom @ s.y[baris]
+        di_atas = s.x[j] >= s.hi[j] - TOL and np.isfinite(s.hi[j])
+        if (s.d[j] > TOL) if di_atas else (s.d[j] < -TOL):
+            return self._selesaikan()
+        return self._perbarui_hasil()
+
+    def perbarui(self, c=None, A=None, b=None):
+        """Terapkan parameter baru; hanya elemen yang berubah yang diproses satu per satu."""
+        if A is not None:
+            A = np.atleast_2d(np.asarray(A, dtype=float))
+            for i, j in zip(*np.nonzero(A != self._padat())):
+                self.ubah_a(int(i), int(j), float(A[i, j]))
+        if b is not None:
+            b = np.asarray(b, dtype=float)
+            for i in np.flatnonzero(b != self.b):
+                self.ubah_b(int(i), float(b[i]))
+        if c is not None:
+            c = np.asarray(c, dtype=float)
+            for j in np.flatnonzero(c != self.c):
+                self.ubah_c(int(j), float(c[j]))
+        return self.hasil
+
+    def _padat(self):
+        if self.A.padat is not None:
+            return self.A.padat
+        padat = np.zeros(self.A.shape)
+        padat[self.A.rows, self.A.cols] = self.A.vals
+        return padat
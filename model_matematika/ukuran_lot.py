@@ -0,0 +1,199 @@
+"""Penentuan ukuran lot untuk permintaan yang berubah per periode, dan EOQ diskon kuantitas.
+
+Wagner-Whitin diselesaikan dengan teknik Wagelmans-van Hoesel-Kolen:
+biaya optimal hingga periode t adalah minimum dari garis-garis
+
+    F(t+1) = A(t+1) + min_j [ F(j) + S_j - A(j) + Hc(j) Dc(j) - Hc(j) Dc(t+1) ]
+
+dengan Dc permintaan kumulatif, Hc biaya simpan kumulatif per unit, dan
+A = kumulatif Hc * d. Kemiringan -Hc(j) tidak naik dan titik evaluasi Dc(t+1)
+tidak turun, sehingga amplop bawahnya dapat dirawat dengan deque (convex
+hull trick) dan setiap periode diproses dalam waktu amortisasi konstan.
+Semua SKU diproses bersamaan: setiap langkah periode adalah operasi array
+di atas sumbu SKU.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+
+class HasilUkuranLot(NamedTuple):
+    pesanan: np.ndarray              # kuantitas pesanan per periode (0 = tidak memesan)
+    persediaan: np.ndarray           # persediaan akhir setiap periode
+    biaya_pemesanan: np.ndarray
+    biaya_penyimpanan: np.ndarray
+    total_biaya: np.ndarray
+    jumlah_pesanan: np.ndarray
+
+
+class HasilEOQDiskon(NamedTuple):
+    Q: np.ndarray
+    tingkat: np.ndarray              # indeks tingkat harga yang dipilih
+    harga_rata: np.ndarray           # harga rata-rata per unit pada kuantitas Q
+    biaya_pembelian: np.ndarray
+    biaya_pemesanan: np.ndarray
+    biaya_penyimpanan: np.ndarray
+    total_biaya: np.ndarray
+
+
+def wagner_whitin(permintaan, S, h):
+    """Jadwal pesanan optimal (tanpa kekurangan stok) untuk deret permintaan per periode.
+
+    ``permintaan`` berbentuk (T,) atau (n_sku, T). ``S`` (biaya pesan per
+    pesanan) dan ``h`` (biaya simpan per unit per periode, >= 0) di-broadcast
+    terhadap bentuk tersebut, jadi nilai per SKU diberikan sebagai (n_sku, 1)
+    dan nilai per periode sebagai (T,). Persediaan awal dianggap nol dan
+    pesanan tiba di awal periode.
+    """
+    d = np.asarray(permintaan, dtype=float)
+    satu_dimensi = d.ndim == 1
+    d = np.atleast_2d(d)
+    if np.any(d < 0):
+        raise ValueError("Permintaan tidak boleh negatif")
+    n, T = d.shape
+    S = np.broadcast_to(np.asarray(S, dtype=float), (n, T))
+    h = np.broadcast_to(np.asarray(h, dtype=float), (n, T))
+    if np.any(h < 0):
+        raise ValueError("Biaya penyimpanan tidak boleh negatif")
+
+    # Tata letak (periode, SKU) agar irisan per periode bersebelahan di memori
+    dT = np.ascontiguousarray(d.T)
+    nol = np.zeros((1, n))
+    Dc = np.vstack([nol, np.cumsum(dT, axis=0)])
+    Hc = np.vstack([nol, np.cumsum(h.T, axis=0)])
+    A = np.vstack([nol, np.cumsum(Hc[:-1] * dT, axis=0)])
+
+    baris = np.arange(n)
+    F = np.zeros((T + 1, n))
+    asal = np.zeros((T + 1, n), dtype=np.int64)
+    kemiringan = np.ascontiguousarray(-Hc[:T]).ravel()
+    potong = np.empty((T, n))
+    potong_datar = potong.ravel()
+    # Amplop bawah per SKU disimpan sebagai indeks datar j * n + sku
+    deque_ = np.empty((T, n), dtype=np.int64)
+    deque_datar = deque_.ravel()
+    kepala = np.zeros(n, dtype=np.int64)
+    panjang = np.zeros(n, dtype=np.int64)
+
+    def nilai(garis, x):
+        return potong_datar[garis] + kemiringan[garis] * x
+
+    for t in range(T):
+        potong[t] = F[t] + S[:, t] - A[t] + Hc[t] * Dc[t]
+        garis_baru = t * n + baris
+        m3, b3 = kemiringan[garis_baru], potong[t]
+
+        # Buang garis di ekor yang tidak lagi menyentuh amplop bawah
+        i = np.flatnonzero(panjang >= 1)
+        while len(i):
+            g2 = deque_datar[(panjang[i] - 1) * n + i]
+            m2, b2 = kemiringan[g2], potong_datar[g2]
+            sejajar = m2 == m3[i]
+            buang = sejajar & (b3[i] <= b2)
+            dua = ~sejajar & (panjang[i] >= 2)
+            if dua.any():
+                k = i[dua]
+                g1 = deque_datar[(panjang[k] - 2) * n + k]
+                m1, b1 = kemiringan[g1], potong_datar[g1]
+                buang[dua] = (b3[k] - b1) * (m1 - m2[dua]) <= (b2[dua] - b1) * (m1 - m3[k])
+            i = i[buang]
+            panjang[i] -= 1
+            i = i[panjang[i] >= 1]
+
+        # Garis sejajar yang lebih mahal dari ekor tidak pernah optimal
+        tambah = np.ones(n, dtype=bool)
+        i = np.flatnonzero(panjang >= 1)
+        tambah[i] = kemiringan[deque_datar[(panjang[i] - 1) * n + i]] != m3[i]
+        i = baris[tambah]
+        deque_datar[panjang[i] * n + i] = garis_baru[i]
+        panjang += tambah
+        np.minimum(kepala, panjang - 1, out=kepala)
+
+        # Titik evaluasi naik, jadi garis optimal hanya bergeser ke kanan
+        x = Dc[t + 1]
+        i = np.flatnonzero(kepala + 1 < panjang)
+        while len(i):
+            sekarang = deque_datar[kepala[i] * n + i]
+            berikut = deque_datar[(kepala[i] + 1) * n + i]
+            i = i[nilai(berikut, x[i]) <= nilai(sekarang, x[i])]
+            kepala[i] += 1
+            i = i[kepala[i] + 1 < panjang[i]]
+        g = deque_datar[kepala * n + baris]
+        F[t + 1] = A[t + 1] + nilai(g, x)
+        asal[t + 1] = g // n
+        # Periode tanpa permintaan dapat dilewati tanpa pesanan saat persediaan nol
+        lewati = (dT[t] == 0) & (F[t] < F[t + 1])
+        F[t + 1, lewati] = F[t, lewati]
+        asal[t + 1, lewati] = t
+
+    # Telusuri balik: pesanan di periode asal[t] menutup permintaan asal[t]..t-1
+    pesanan = np.zeros((n, T))
+    akhir = np.full(n, T)
+    i = baris
+    while len(i):
+        awal = asal[akhir[i], i]
+        pesanan[i, awal] = Dc[akhir[i], i] - Dc[awal, i]
+        akhir[i] = awal
+        i = i[awal > 0]
+
+    persediaan = np.cumsum(pesanan - d, axis=1)
+    dipesan = pesanan > 0
+    biaya_pemesanan = (S * dipesan).sum(axis=1)
+    biaya_penyimpanan = (h * persediaan).sum(axis=1)
+    hasil = HasilUkuranLot(
+        pesanan=pesanan, persediaan=persediaan,
+        biaya_pemesanan=biaya_pemesanan, biaya_penyimpanan=biaya_penyimpanan,
+        total_biaya=biaya_pemesanan + biaya_penyimpanan, jumlah_pesanan=dipesan.sum(axis=1),
+    )
+    if satu_dimensi:
+        return HasilUkuranLot(*(v[0] for v in hasil))
+    return hasil
+
+
+def eoq_diskon(D, S, i, batas, harga, jenis='seluruh_unit'):
+    """EOQ dengan diskon kuantitas seluruh unit atau inkremental.
+
+    ``batas`` adalah kuantitas awal setiap tingkat harga (naik, dimulai dari
+    0) dan ``harga`` harga per unit pada tingkat tersebut; keduanya berbentuk
+    (m,) atau (n_sku, m). Biaya simpan per tahun adalah ``i`` kali nilai unit.
+    Pada diskon ``'seluruh_unit'`` harga tingkat berlaku untuk semua unit;
+    pada ``'inkremental'`` hanya untuk unit di atas batas tingkat.
+    """
+    if jenis not in ('seluruh_unit', 'inkremental'):
+        raise ValueError(f"Jenis diskon tidak dikenal: {jenis}")
+    D, S, i = (np.asarray(v, dtype=float)[..., None] for v in np.broadcast_arrays(D, S, i))
+    batas = np.asarray(batas, dtype=float)
+    harga = np.asarray(harga, dtype=float)
+    if np.any(batas[..., 0] != 0) or np.any(np.diff(batas, axis=-1) <= 0):
+        raise ValueError("Batas tingkat harus naik dan dimulai dari 0")
+    atas = np.concatenate([batas[..., 1:], np.full(batas.shape[:-1] + (1,), np.inf)], axis=-1)
+
+    if jenis == 'seluruh_unit':
+        tetap = np.zeros_like(harga)
+    else:
+        # Biaya pembelian Q unit pada tingkat k: R_k + p_k (Q - b_k) = tetap_k + p_k Q
+        R = np.concatenate([np.zeros(harga.shape[:-1] + (1,)),
+                            np.cumsum(harga[..., :-1] * np.diff(batas, axis=-1), axis=-1)], axis=-1)
+        tetap = R - harga * batas
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Q_k = np.sqrt(2 * D * (S + tetap) / (i * harga))
+        if jenis == 'seluruh_unit':
+            # Q di atas batas atas tingkat berarti harga tingkat berikutnya yang berlaku
+            Q_k = np.maximum(Q_k, batas)
+            Q_k = np.where(Q_k < atas, Q_k, np.nan)
+        else:
+            Q_k = np.clip(Q_k, np.maximum(batas, np.finfo(float).tiny), atas)
+        pembelian = tetap + harga * Q_k
+        total_k = D * pembelian / Q_k + D * S / Q_k + i * pembelian / 2
+    tingkat = np.argmin(np.where(np.isnan(total_k), np.inf, total_k), axis=-1)
+
+    ambil = lambda arr: np.take_along_axis(np.broadcast_to(arr, total_k.shape), tingkat[..., None], axis=-1)[..., 0]
+    Q, pembelian = ambil(Q_k), ambil(pembelian)
+    D, S, i = D[..., 0], S[..., 0], i[..., 0]
+    harga_rata = pembelian / Q
+    return HasilEOQDiskon(
+        Q=Q, tingkat=tingkat, harga_rata=harga_rata,
+        biaya_pembelian=D * harga_rata, biaya_pemesanan=D * S / Q, biaya_penyimpanan=i * pembelian / 2,
+        total_biaya=D * harga_rata + D * S / Q + i * pembelian / 2,
+    )
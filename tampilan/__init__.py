@@ -0,0 +1,6 @@
+"""Komponen tampilan dashboard: pembuat grafik, cache hasil render, kolam render, dan profiler."""
+from .cache_grafik import CacheGrafik, encode_figure
+from .kolam_render import KolamRender
+from .profil import Profiler, format_prometheus
+
+__all__ = ["CacheGrafik", "encode_figure", "KolamRender", "Profiler", "format_prometheus"]
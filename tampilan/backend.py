@@ -0,0 +1,34 @@
+"""Pembuatan figure matplotlib lewat API berorientasi objek tanpa pyplot.
+
+pyplot menyimpan daftar figure global yang tidak aman dipakai dari banyak
+thread sekaligus, jadi figure dibuat langsung dari ``matplotlib.figure.Figure``
+dengan kanvas Agg. Setiap figure hanya dimiliki oleh thread yang membuatnya
+dan dibebaskan oleh garbage collector; tidak ada ``close`` yang diperlukan.
+
+Modul matplotlib dimuat secara malas saat figure pertama dibuat karena
+impornya (termasuk cache font) memakan waktu ratusan milidetik.
+"""
+import threading
+
+_kelas = None
+_lock = threading.Lock()
+
+
+def muat_matplotlib():
+    """Impor kelas ``Figure`` dan kanvas Agg sekali saja, aman dari banyak thread."""
+    global _kelas
+    if _kelas is None:
+        with _lock:
+            if _kelas is None:
+                from matplotlib.backends.backend_agg import FigureCanvasAgg
+                from matplotlib.figure import Figure
+                _kelas = (Figure, FigureCanvasAgg)
+    return _kelas
+
+
+def subplots(nrows=1, ncols=1, sharex=False, sharey=False, gridspec_kw=None, **kwargs):
+    """Pengganti ``plt.subplots`` yang tidak menyentuh state global pyplot."""
+    Figure, FigureCanvasAgg = muat_matplotlib()
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(nrows, ncols, sharex=sharex, sharey=sharey, gridspec_kw=gridspec_kw)
@@ -0,0 +1,97 @@
+"""Cache LRU berbatas memori untuk grafik yang sudah di-encode.
+
+Kunci cache adalah (nama model, tuple parameter, format). Nilai yang disimpan
+berupa byte PNG/SVG, sehingga membuka kembali parameter yang sama tidak
+memerlukan pekerjaan matplotlib sama sekali.
+"""
+import io
+import threading
+from collections import OrderedDict
+
+BATAS_DEFAULT_BYTE = 64 * 1024 * 1024
+
+# Pengaturan yang sama dengan st.pyplot agar tampilan grafik tidak berubah
+SAVEFIG_DEFAULT = {"bbox_inches": "tight", "dpi": 200}
+
+
+class CacheGrafik:
+    """Peta LRU (model, parameter) -> byte gambar dengan anggaran memori."""
+
+    def __init__(self, batas_byte=BATAS_DEFAULT_BYTE):
+        self.batas_byte = int(batas_byte)
+        self._data = OrderedDict()
+        self._ukuran = 0
+        self._lock = threading.Lock()
+        self.hit = 0
+        self.miss = 0
+        self.eviksi = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, kunci):
+        return kunci in self._data
+
+    def ambil(self, kunci):
+        with self._lock:
+            data = self._data.get(kunci)
+            if data is None:
+                self.miss += 1
+                return None
+            self._data.move_to_end(kunci)
+            self.hit += 1
+            return data
+
+    def simpan(self, kunci, data):
+        with self._lock:
+            if len(data) > self.batas_byte:
+                return
+            lama = self._data.pop(kunci, None)
+            if lama is not None:
+                self._ukuran -= len(lama)
+            self._data[kunci] = data
+            self._ukuran += len(data)
+            while self._ukuran > self.batas_byte:
+                _, dibuang = self._data.popitem(last=False)
+                self._ukuran -= len(dibuang)
+                self.eviksi += 1
+
+    def bersihkan(self):
+        with self._lock:
+            self._data.clear()
+            self._ukuran = 0
+
+    def statistik(self):
+        with self._lock:
+            total = self.hit + self.miss
+            return {
+                "hit": self.hit,
+                "miss": self.miss,
+                "eviksi": self.eviksi,
+                "rasio_hit": self.hit / total if total else 0.0,
+                "jumlah": len(self._data),
+                "ukuran_byte": self._ukuran,
+                "batas_byte": self.batas_byte,
+            }
+
+    def render(self, model, parameter, buat_figure, format="png"):
+        """Ambil grafik dari cache, atau buat dengan ``buat_figure(*parameter)``.
+
+        Aman dipanggil dari beberapa thread sekaligus; dua thread yang
+        meminta kunci yang sama bersamaan dapat sama-sama merender (lihat
+        :class:`~tampilan.kolam_render.KolamRender` untuk penggabungan).
+        """
+        kunci = (model, tuple(parameter), format)
+        data = self.ambil(kunci)
+        if data is not None:
+            return data
+        data = encode_figure(buat_figure(*parameter), format)
+        self.simpan(kunci, data)
+        return data
+
+
+def encode_figure(fig, format="png"):
+    """Encode figure ke byte PNG/SVG."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format=format, **SAVEFIG_DEFAULT)
+    return buf.getvalue()
@@ -0,0 +1,324 @@
+"""Pembuat grafik matplotlib untuk setiap tab dashboard.
+
+Setiap fungsi hanya bergantung pada argumennya, sehingga hasilnya dapat
+di-cache berdasarkan tuple parameter (lihat :mod:`tampilan.cache_grafik`).
+Figure dibuat tanpa pyplot (lihat :mod:`tampilan.backend`) sehingga aman
+dipanggil dari thread pekerja render.
+"""
+import numpy as np
+
+from model_matematika import (
+    garis_kendala,
+    hitung_eoq, kurva_biaya, siklus_persediaan, wagner_whitin,
+    hitung_mmc, distribusi_pn_mmc,
+    keandalan_struktur, seri, alokasi_redundansi,
+    sapuan, analisis_tornado,
+)
+
+from .backend import subplots
+from .grafik_klien import data_antrian_transien, data_jejak_antrian, data_jejak_persediaan
+
+
+# Ini code untuk membuat grafik daerah produksi yang layak
+def grafik_lp(jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu, x_opt, y_opt):
+    fig, ax = subplots(figsize=(10, 5))
+
+    x_vals, y1, y2, y_feasible = garis_kendala(jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu)
+    ax.plot(x_vals, y1, label=f'Batas Jam Kerja')
+    ax.plot(x_vals, y2, label=f'Batas Stok Kayu')
+    ax.fill_between(x_vals, 0, y_feasible, where=(y_feasible>=0), color='green', alpha=0.2, label='Daerah Produksi Layak')
+
+    ax.plot(x_opt, y_opt, 'ro', markersize=12, label=f'Titik Optimal ({x_opt}, {y_opt})')
+
+    ax.set_xlabel('Jumlah Meja (x)')
+    ax.set_ylabel('Jumlah Kursi (y)')
+    ax.set_title('Grafik Optimasi Produksi Mebel', fontsize=16)
+    ax.legend()
+    ax.grid(True)
+    ax.set_xlim(left=0)
+    ax.set_ylim(bottom=0)
+    return fig
+
+
+# Ini code untuk membuat grafik visualisasi analisis biaya
+def grafik_biaya_eoq(D, S, H):
+    hasil = hitung_eoq(D, S, H, 0, 0)
+    eoq, total_biaya = float(hasil.eoq), float(hasil.total_biaya)
+    q, holding_costs, ordering_costs, total_costs = kurva_biaya(D, S, H, eoq)
+
+    fig, ax = subplots(figsize=(10, 5))
+    ax.plot(q, holding_costs, 'b-', label='Biaya Penyimpanan')
+    ax.plot(q, ordering_costs, 'g-', label='Biaya Pemesanan')
+    ax.plot(q, total_costs, 'r-', linewidth=3, label='Total Biaya')
+    if eoq > 0:
+        ax.axvline(x=eoq, color='purple', linestyle='--', label=f'EOQ')
+        ax.annotate(f'Biaya Terendah\nRp {total_biaya:,.0f}', xy=(eoq, total_biaya), xytext=(eoq*1.3, total_biaya*0.6),
+                    arrowprops=dict(facecolor='black', shrink=0.05), fontsize=12)
+
+    ax.set_xlabel('Kuantitas Pemesanan (kg)')
+    ax.set_ylabel('Biaya Tahunan (Rp)')
+    ax.set_title('Analisis Biaya Persediaan (EOQ)', fontsize=16)
+    ax.legend()
+    ax.grid(True)
+    ax.ticklabel_format(style='plain', axis='y')
+    return fig
+
+
+# Ini code untuk membuat grafik visualisasi siklus persediaan
+def grafik_siklus_persediaan(D, S, H, lead_time, safety_stock):
+    hasil = hitung_eoq(D, S, H, lead_time, safety_stock)
+    eoq, rop = float(hasil.eoq), float(hasil.rop)
+    siklus_pemesanan, permintaan_harian = float(hasil.siklus_pemesanan), float(hasil.permintaan_harian)
+
+    fig2, ax2 = subplots(figsize=(10, 5))
+    if siklus_pemesanan > 0 and eoq > 0:
+        t, stok_level = siklus_persediaan(eoq, safety_stock, permintaan_harian, siklus_pemesanan)
+
+        ax2.plot(t, stok_level, label='Tingkat Persediaan')
+        ax2.axhline(y=rop, color='orange', linestyle='--', label=f'ROP ({rop:.1f} kg)')
+        ax2.axhline(y=safety_stock, color='red', linestyle=':', label=f'Stok Pengaman ({safety_stock} kg)')
+
+        t_pesan = siklus_pemesanan - lead_time
+        if t_pesan > 0:
+            ax2.scatter(t_pesan, rop, color='red', s=100, zorder=5)
+            ax2.annotate('Pesan Ulang!', xy=(t_pesan, rop), xytext=(t_pesan, rop + eoq*0.3),
+                         arrowprops=dict(facecolor='red', shrink=0.05))
+
+    ax2.set_xlabel('Waktu (Hari)')
+    ax2.set_ylabel('Jumlah Stok (kg)')
+    ax2.set_title('Simulasi Siklus Persediaan', fontsize=16)
+    ax2.legend()
+    ax2.grid(True)
+    ax2.set_ylim(bottom=0)
+    return fig2
+
+
+# Ini code untuk membuat grafik jadwal pesanan Wagner-Whitin
+def grafik_ukuran_lot(permintaan, S, h, label_periode):
+    hasil = wagner_whitin(np.asarray(permintaan, dtype=float), S, h)
+    x = np.arange(len(permintaan))
+
+    fig, ax = subplots(figsize=(10, 5))
+    ax.bar(x - 0.2, permintaan, width=0.4, color='skyblue', label='Permintaan')
+    ax.bar(x + 0.2, hasil.pesanan, width=0.4, color='darkorange', label='Pesanan')
+    ax.step(x, hasil.persediaan, where='mid', color='green', linewidth=2, label='Persediaan Akhir')
+
+    ax.set_xticks(x)
+    ax.set_xticklabels(label_periode)
+    ax.set_xlabel('Periode')
+    ax.set_ylabel('Jumlah (kg)')
+    ax.set_title('Jadwal Pesanan Optimal (Wagner-Whitin)', fontsize=16)
+    ax.legend()
+    ax.grid(True, axis='y')
+    return fig
+
+
+# Ini code untuk membuat grafik jejak stok hasil simulasi Monte Carlo
+def grafik_jejak_persediaan(Q, rop, permintaan_harian, lead_time, safety_stock, sd_permintaan, sd_lead_time, n_tahun):
+    hari, stok = data_jejak_persediaan(Q, rop, permintaan_harian, lead_time, safety_stock,
+                                       sd_permintaan, sd_lead_time, n_tahun)
+
+    fig, ax = subplots(figsize=(10, 4))
+    ax.step(hari, stok, where='post', label='Stok Akhir Hari')
+    ax.axhline(y=rop, color='orange', linestyle='--', label=f'ROP ({rop:.1f} kg)')
+    ax.axhline(y=0, color='red', linestyle=':', label='Stok Habis')
+
+    ax.set_xlabel('Hari')
+    ax.set_ylabel('Jumlah Stok (kg)')
+    ax.set_title('Jejak Stok Hasil Simulasi (Satu Replikasi)', fontsize=16)
+    ax.legend()
+    ax.grid(True)
+    return fig
+
+
+# Ini code untuk membuat grafik visualisasi kinerja antrian
+def grafik_waktu_antrian(lmbda, mu, c=1):
+    Wq = float(hitung_mmc(lmbda, mu, c).Wq)
+
+    fig1, ax1 = subplots(figsize=(8, 4))
+    waktu_pelayanan_menit = (1/mu) * 60
+    waktu_tunggu_menit = Wq * 60
+    labels = ['Waktu Menunggu di Antrian', 'Waktu Dilayani']
+    sizes = [waktu_tunggu_menit, waktu_pelayanan_menit]
+    colors = ['#ff6347','#90ee90']
+    explode = (0.1, 0)
+
+    ax1.pie(sizes, explode=explode, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
+    ax1.axis('equal')
+    ax1.set_title("Bagaimana Pelanggan Menghabiskan Waktunya?")
+    return fig1
+
+
+# Ini code untuk membuat grafik visualisasi probabilitas panjang antrian
+def grafik_pn_antrian(lmbda, mu, c=1):
+    n_values = np.arange(0, 15)
+    p_n_values = distribusi_pn_mmc(lmbda, mu, c, n_max=n_values[-1])
+
+    fig2, ax2 = subplots(figsize=(10, 4))
+    ax2.bar(n_values, p_n_values, color='skyblue')
+    for i, v in enumerate(p_n_values):
+        ax2.text(i, v, f"{v:.1%}", ha='center', va='bottom', fontsize=9)
+
+    ax2.set_xlabel('Jumlah Mobil dalam Sistem (n)')
+    ax2.set_ylabel('Probabilitas P(n)')
+    ax2.set_title('Seberapa Mungkin Antrian Menjadi Panjang?')
+    ax2.set_xticks(n_values)
+    ax2.grid(True, axis='y', linestyle='--')
+    ax2.set_yticklabels([])
+    return fig2
+
+
+# Ini code untuk membuat grafik jejak panjang antrian hasil simulasi
+def grafik_jejak_antrian(lmbda, mu, c, cv_layanan, n_pelanggan, seed=0):
+    menit, panjang = data_jejak_antrian(lmbda, mu, c, cv_layanan, n_pelanggan, seed)
+
+    fig, ax = subplots(figsize=(10, 4))
+    ax.step(menit, panjang, where='post', color='#ff6347', linewidth=1)
+
+    ax.set_xlabel('Waktu (menit)')
+    ax.set_ylabel('Mobil dalam Antrian')
+    ax.set_title('Jejak Panjang Antrian (Satu Replikasi)', fontsize=16)
+    ax.grid(True)
+    ax.set_ylim(bottom=0)
+    return fig
+
+
+# Ini code untuk membuat grafik antrian jam sibuk dengan lambda(t) dan c(t) berubah
+def grafik_antrian_transien(jam_mulai, lmbda, c, mu):
+    jam, L, Lq, p90, profil_lambda, kapasitas = data_antrian_transien(jam_mulai, lmbda, c, mu)
+
+    fig, (ax1, ax2) = subplots(2, 1, figsize=(10, 6), sharex=True, gridspec_kw={'height_ratios': [2, 1]})
+    ax1.plot(jam, L, color='steelblue', label='Rata-rata di Sistem L(t)')
+    ax1.plot(jam, Lq, color='#ff6347', label='Rata-rata di Antrian Lq(t)')
+    ax1.step(jam, p90, where='post', color='gray', linestyle='--', linewidth=1, label='Persentil ke-90 di Sistem')
+    ax1.set_ylabel('Jumlah Mobil')
+    ax1.set_title('Panjang Antrian Sepanjang Hari', fontsize=16)
+    ax1.legend()
+    ax1.grid(True)
+
+    ax2.step(jam[:-1], profil_lambda, where='post', color='darkorange', label='Kedatangan λ(t)')
+    ax2.step(jam[:-1], kapasitas, where='post', color='green', label='Kapasitas c(t)·μ')
+    ax2.fill_between(jam[:-1], kapasitas, profil_lambda, where=profil_lambda > kapasitas, step='post',
+                     color='red', alpha=0.3, label='Kelebihan Beban')
+    ax2.set_xlabel('Jam')
+    ax2.set_ylabel('Mobil per Jam')
+    ax2.set_xticks(np.arange(0, 25, 2))
+    ax2.legend(loc='upper left', fontsize=8)
+    ax2.grid(True)
+    return fig
+
+
+# Ini code untuk membuat grafik kebutuhan server dan petugas bertugas selama seminggu
+def grafik_jadwal_staf(kebutuhan, cakupan, label_hari):
+    jam = np.arange(len(kebutuhan) + 1)
+
+    fig, ax = subplots(figsize=(12, 4))
+    ax.stairs(cakupan, jam, fill=True, color='lightsteelblue', label='Petugas Bertugas')
+    ax.stairs(kebutuhan, jam, color='#ff6347', linewidth=1.5, label='Kebutuhan Server Minimum')
+    for batas in range(24, len(kebutuhan), 24):
+        ax.axvline(batas, color='gray', linewidth=0.8)
+
+    ax.set_xticks(12 + 24 * np.arange(len(label_hari)))
+    ax.set_xticklabels(label_hari)
+    ax.set_xlim(0, len(kebutuhan))
+    ax.set_ylabel('Jumlah Petugas')
+    ax.set_title('Kebutuhan vs Jadwal Petugas Mingguan', fontsize=16)
+    ax.legend(loc='upper left')
+    ax.grid(True, axis='y', linestyle='--')
+    return fig
+
+
+# Ini code untuk membuat grafik visualisasi dampak keandalan komponen
+def grafik_keandalan(nama_mesin, keandalan_mesin):
+    hasil = keandalan_struktur(seri(*nama_mesin), dict(zip(nama_mesin, keandalan_mesin)))
+    labels = list(nama_mesin) + ["SISTEM TOTAL"]
+    values = list(keandalan_mesin) + [float(hasil.keandalan)]
+    birnbaum = [float(hasil.birnbaum[nama]) for nama in nama_mesin]
+
+    fig, ax = subplots(figsize=(10, 5))
+
+    bar_colors = ['#87CEEB'] * len(nama_mesin)
+    bar_colors[int(np.argmax(birnbaum))] = '#FF6347'
+    bar_colors.append('#9370DB')
+
+    bars = ax.bar(labels, values, color=bar_colors)
+
+    ax.set_ylabel('Tingkat Keandalan (Reliability)')
+    ax.set_title('Perbandingan Keandalan Komponen dan Sistem', fontsize=16)
+    ax.set_ylim(min(0.75, min(values) * 0.95 if values else 0.75), 1.01)
+
+    for bar in bars:
+        yval = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2.0, yval, f'{yval:.2%}', ha='center', va='bottom', fontsize=10, color='black')
+    return fig
+
+
+# Ini code untuk membuat grafik frontier anggaran vs keandalan hasil alokasi redundansi
+def grafik_frontier_redundansi(keandalan_mesin, biaya_unit, anggaran, anggaran_maks):
+    hasil = alokasi_redundansi(keandalan_mesin, biaya_unit, anggaran_maks)
+    terpilih = int(np.searchsorted(hasil.frontier_biaya, anggaran, side='right')) - 1
+
+    fig, ax = subplots(figsize=(10, 5))
+    # Frontier berupa tangga: keandalan tetap sampai anggaran cukup untuk titik berikutnya
+    ax.step(np.append(hasil.frontier_biaya, anggaran_maks), np.append(hasil.frontier_keandalan, hasil.keandalan),
+            where='post', color='#9370DB', label='Frontier Pareto')
+    ax.plot(hasil.frontier_biaya, hasil.frontier_keandalan, 'o', color='#9370DB', markersize=4)
+    ax.axvline(anggaran, color='orange', linestyle='--', label=f'Anggaran Saat Ini ({anggaran:,.0f})')
+    ax.plot(hasil.frontier_biaya[terpilih], hasil.frontier_keandalan[terpilih], '*', color='#FF6347',
+            markersize=15, label=f'Alokasi Terpilih ({hasil.frontier_keandalan[terpilih]:.2%})')
+
+    ax.set_xlabel('Biaya Unit Redundan (Rp juta)')
+    ax.set_ylabel('Keandalan Sistem')
+    ax.set_title('Frontier Anggaran vs Keandalan Lini Produksi', fontsize=16)
+    ax.set_xlim(0, anggaran_maks)
+    ax.legend(loc='lower right')
+    ax.grid(True, linestyle='--')
+    return fig
+
+
+# Ini code untuk membuat peta panas (heatmap) hasil sapuan dua parameter
+def grafik_heatmap(model, dasar, sumbu_x, rentang_x, sumbu_y, rentang_y, keluaran, label_x, label_y, label_keluaran):
+    dasar = dict(dasar)
+    hasil = sapuan(model, dasar, {sumbu_y: rentang_y, sumbu_x: rentang_x}, keluaran=(keluaran,))
+    nilai = np.ma.masked_invalid(hasil.keluaran[keluaran])
+
+    fig, ax = subplots(figsize=(10, 5))
+    mesh = ax.pcolormesh(hasil.grid[1], hasil.grid[0], nilai, shading='auto', cmap='viridis')
+    fig.colorbar(mesh, ax=ax, label=label_keluaran, format='{x:,.4g}')
+    ax.plot(dasar[sumbu_x], dasar[sumbu_y], 'wx', markersize=12, markeredgewidth=3, label='Parameter Saat Ini')
+
+    ax.set_xlabel(label_x)
+    ax.set_ylabel(label_y)
+    ax.set_title(f'Sensitivitas {label_keluaran}', fontsize=16)
+    ax.legend(loc='upper right')
+    ax.ticklabel_format(style='plain', useOffset=False)
+    return fig
+
+
+# Ini code untuk membuat diagram tornado sensitivitas satu parameter
+def grafik_tornado(model, dasar, keluaran, variasi, label_parameter, label_keluaran, batas=()):
+    label_parameter = dict(label_parameter)
+    hasil = analisis_tornado(model, dict(dasar), keluaran, variasi=variasi,
+                             parameter=tuple(label_parameter), batas=dict(batas))
+    dasar_nilai = hasil.nilai_dasar
+    y = np.arange(len(hasil.parameter))[::-1]
+
+    fig, ax = subplots(figsize=(10, 0.6 * len(y) + 1.5))
+    ax.barh(y, hasil.rendah - dasar_nilai, left=dasar_nilai, color='#FF6347', label=f'-{variasi:.0%}')
+    ax.barh(y, hasil.tinggi - dasar_nilai, left=dasar_nilai, color='#87CEEB', label=f'+{variasi:.0%}')
+    ax.axvline(dasar_nilai, color='black', linewidth=1)
+    # Sisi yang tidak terdefinisi (mis. antrian menjadi tidak stabil) ditandai teks
+    for yi, r, t in zip(y, hasil.rendah, hasil.tinggi):
+        for nilai, tanda in ((r, '-'), (t, '+')):
+            if np.isnan(nilai):
+                ax.text(dasar_nilai, yi, f' {tanda}{variasi:.0%}: tidak terdefinisi ', va='center',
+                        ha='left' if tanda == '+' else 'right', fontsize=9, color='gray')
+
+    ax.set_yticks(y)
+    ax.set_yticklabels([label_parameter[nama] for nama in hasil.parameter])
+    ax.set_xlabel(label_keluaran)
+    ax.set_title('Diagram Tornado: Parameter Paling Berpengaruh', fontsize=16)
+    ax.legend()
+    ax.grid(True, axis='x', linestyle='--')
+    ax.ticklabel_format(style='plain', axis='x', useOffset=False)
+    return fig
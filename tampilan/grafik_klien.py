@@ -0,0 +1,178 @@
+"""Grafik sisi klien: data ringkas + spesifikasi Vega-Lite untuk ``st.vega_lite_chart``.
+
+Alih-alih merender PNG di server, setiap fungsi mengembalikan pasangan
+``(data, spec)``. ``data`` berupa kolom array (format panjang: satu baris per
+titik) yang dikirim Streamlit sebagai Arrow, lalu digambar oleh browser.
+Deret panjang diturunkan dengan LTTB sehingga jumlah titik per grafik tidak
+pernah melebihi ``ANGGARAN_TITIK``, berapa pun panjang simulasinya.
+
+Fungsi di-cache berdasarkan argumennya, sama seperti grafik PNG.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from model_matematika import (
+    hitung_eoq, kurva_biaya, siklus_persediaan, distribusi_pn_mmc,
+    Distribusi, simulasi_antrian, simulasi_persediaan, profil_sepotong, antrian_transien,
+)
+
+from .sampel_turun import ANGGARAN_TITIK, turunkan
+
+UKURAN_CACHE = 32
+# Resolusi kurva analitik sebelum diturunkan; cukup rapat agar sudut gigi gergaji tajam
+TITIK_KURVA = 20_000
+
+
+def _deret(seri, n_maks=ANGGARAN_TITIK):
+    """Gabungkan {nama: (x, y)} menjadi kolom format panjang dalam anggaran titik."""
+    per_seri = max(3, n_maks // len(seri))
+    xs, ys, nama = [], [], []
+    for label, (x, y) in seri.items():
+        x, y = turunkan(x, y, per_seri)
+        xs.append(x)
+        ys.append(y)
+        nama.append(np.full(len(x), label))
+    return {'x': np.concatenate(xs), 'y': np.concatenate(ys), 'seri': np.concatenate(nama)}
+
+
+def _spec_garis(judul, label_x, label_y, warna, garis_bantu=(), interpolasi='linear'):
+    """Spesifikasi garis berlapis; ``garis_bantu`` berisi (sumbu, nilai, warna, teks)."""
+    lapisan = [{
+        'mark': {'type': 'line', 'interpolate': interpolasi, 'clip': True},
+        'encoding': {
+            'x': {'field': 'x', 'type': 'quantitative', 'title': label_x},
+            'y': {'field': 'y', 'type': 'quantitative', 'title': label_y},
+            'color': {'field': 'seri', 'type': 'nominal', 'title': None,
+                      'scale': {'domain': list(warna), 'range': list(warna.values())}},
+            'tooltip': [{'field': 'seri', 'type': 'nominal'},
+                        {'field': 'x', 'type': 'quantitative', 'format': ',.2f', 'title': label_x},
+                        {'field': 'y', 'type': 'quantitative', 'format': ',.2f', 'title': label_y}],
+        },
+    }]
+    for sumbu, nilai, warna_garis, teks in garis_bantu:
+        lapisan.append({
+            'mark': {'type': 'rule', 'color': warna_garis, 'strokeDash': [6, 4]},
+            'encoding': {sumbu: {'datum': float(nilai)}, 'tooltip': {'value': teks}},
+        })
+    return {'title': judul, 'layer': lapisan, 'params': [{'name': 'zoom', 'select': 'interval', 'bind': 'scales'}]}
+
+
+# Ini code untuk kurva biaya EOQ versi interaktif
+@lru_cache(maxsize=UKURAN_CACHE)
+def klien_biaya_eoq(D, S, H):
+    hasil = hitung_eoq(D, S, H, 0, 0)
+    eoq, total_biaya = float(hasil.eoq), float(hasil.total_biaya)
+    q, simpan, pesan, total = kurva_biaya(D, S, H, eoq, n_titik=TITIK_KURVA)
+    data = _deret({'Biaya Penyimpanan': (q, simpan), 'Biaya Pemesanan': (q, pesan), 'Total Biaya': (q, total)})
+    spec = _spec_garis('Analisis Biaya Persediaan (EOQ)', 'Kuantitas Pemesanan (kg)', 'Biaya Tahunan (Rp)',
+                       {'Biaya Penyimpanan': 'blue', 'Biaya Pemesanan': 'green', 'Total Biaya': 'red'},
+                       [('x', eoq, 'purple', f'EOQ: {eoq:,.1f} kg, biaya Rp {total_biaya:,.0f}')] if eoq > 0 else ())
+    return data, spec
+
+
+# Ini code untuk siklus persediaan versi interaktif
+@lru_cache(maxsize=UKURAN_CACHE)
+def klien_siklus_persediaan(D, S, H, lead_time, safety_stock):
+    hasil = hitung_eoq(D, S, H, lead_time, safety_stock)
+    eoq, rop = float(hasil.eoq), float(hasil.rop)
+    siklus, permintaan_harian = float(hasil.siklus_pemesanan), float(hasil.permintaan_harian)
+    seri = {}
+    if siklus > 0 and eoq > 0:
+        seri['Tingkat Persediaan'] = siklus_persediaan(eoq, safety_stock, permintaan_harian, siklus,
+                                                      n_titik=TITIK_KURVA)
+    data = _deret(seri) if seri else {'x': np.zeros(0), 'y': np.zeros(0), 'seri': np.zeros(0, dtype=str)}
+    spec = _spec_garis('Simulasi Siklus Persediaan', 'Waktu (Hari)', 'Jumlah Stok (kg)',
+                       {'Tingkat Persediaan': 'steelblue'},
+                       [('y', rop, 'orange', f'ROP ({rop:.1f} kg)'),
+                        ('y', safety_stock, 'red', f'Stok Pengaman ({safety_stock} kg)')])
+    return data, spec
+
+
+# Ini code untuk distribusi panjang antrian versi interaktif
+@lru_cache(maxsize=UKURAN_CACHE)
+def klien_pn_antrian(lmbda, mu, c=1):
+    n = np.arange(0, 15)
+    p_n = distribusi_pn_mmc(lmbda, mu, c, n_max=n[-1])
+    data = {'n': n, 'p': p_n}
+    spec = {
+        'title': 'Distribusi Probabilitas Jumlah Mobil dalam Sistem',
+        'mark': {'type': 'bar', 'color': 'skyblue', 'tooltip': True},
+        'encoding': {
+            'x': {'field': 'n', 'type': 'ordinal', 'title': 'Jumlah Mobil dalam Sistem (n)', 'axis': {'labelAngle': 0}},
+            'y': {'field': 'p', 'type': 'quantitative', 'title': 'Probabilitas (Pn)', 'axis': {'format': '.0%'}},
+        },
+    }
+    return data, spec
+
+
+def distribusi_layanan(mu, cv_layanan):
+    """Distribusi waktu layanan dengan rata-rata 1/mu dan koefisien variasi tertentu."""
+    if cv_layanan == 1:
+        return Distribusi.eksponensial(1 / mu)
+    if cv_layanan == 0:
+        return Distribusi.deterministik(1 / mu)
+    return Distribusi.lognormal(1 / mu, cv_layanan)
+
+
+@lru_cache(maxsize=UKURAN_CACHE)
+def data_jejak_antrian(lmbda, mu, c, cv_layanan, n_pelanggan, seed=0):
+    """Jejak panjang antrian (menit, jumlah) satu replikasi, sudah diturunkan ke anggaran titik."""
+    hasil = simulasi_antrian(lmbda, distribusi_layanan(mu, cv_layanan), c, n_pelanggan=n_pelanggan,
+                             seed=seed, simpan_jejak=True)
+    waktu, panjang = hasil.jejak
+    return turunkan(waktu * 60, panjang)
+
+
+# Ini code untuk jejak panjang antrian hasil simulasi versi interaktif
+@lru_cache(maxsize=UKURAN_CACHE)
+def klien_jejak_antrian(lmbda, mu, c, cv_layanan, n_pelanggan, seed=0):
+    x, y = data_jejak_antrian(lmbda, mu, c, cv_layanan, n_pelanggan, seed)
+    data = {'x': x, 'y': y, 'seri': np.full(len(x), 'Panjang Antrian')}
+    spec = _spec_garis('Jejak Panjang Antrian (Satu Replikasi)', 'Waktu (menit)', 'Mobil dalam Antrian',
+                       {'Panjang Antrian': '#ff6347'}, interpolasi='step-after')
+    return data, spec
+
+
+@lru_cache(maxsize=UKURAN_CACHE)
+def data_jejak_persediaan(Q, rop, permintaan_harian, lead_time, safety_stock, sd_permintaan, sd_lead_time, n_tahun):
+    """Stok akhir hari (hari, kg) replikasi pertama, sudah diturunkan ke anggaran titik."""
+    hasil = simulasi_persediaan(Q, rop, permintaan_harian, lead_time, safety_stock, sd_permintaan=sd_permintaan,
+                                sd_lead_time=sd_lead_time, n_tahun=n_tahun, n_replikasi=1, simpan_jejak=True)
+    stok = hasil.jejak_stok
+    return turunkan(np.arange(1, len(stok) + 1, dtype=float), stok)
+
+
+# Ini code untuk jejak stok hasil simulasi Monte Carlo versi interaktif
+@lru_cache(maxsize=UKURAN_CACHE)
+def klien_jejak_persediaan(Q, rop, permintaan_harian, lead_time, safety_stock, sd_permintaan, sd_lead_time, n_tahun):
+    x, y = data_jejak_persediaan(Q, rop, permintaan_harian, lead_time, safety_stock,
+                                 sd_permintaan, sd_lead_time, n_tahun)
+    data = {'x': x, 'y': y, 'seri': np.full(len(x), 'Stok Akhir Hari')}
+    spec = _spec_garis('Jejak Stok Hasil Simulasi (Satu Replikasi)', 'Hari', 'Jumlah Stok (kg)',
+                       {'Stok Akhir Hari': 'steelblue'},
+                       [('y', rop, 'orange', f'ROP ({rop:.1f} kg)'), ('y', 0, 'red', 'Stok habis')],
+                       interpolasi='step-after')
+    return data, spec
+
+
+@lru_cache(maxsize=UKURAN_CACHE)
+def data_antrian_transien(jam_mulai, lmbda, c, mu, dt=1 / 60, durasi=24):
+    """Deret per menit: jam, L(t), Lq(t), persentil ke-90 jumlah di sistem, lambda(t), dan kapasitas c(t) mu."""
+    profil_lambda = profil_sepotong(jam_mulai, lmbda, dt, durasi)
+    profil_c = profil_sepotong(jam_mulai, c, dt, durasi)
+    hasil = antrian_transien(profil_lambda, profil_c, mu, dt)
+    p90 = np.argmax(np.cumsum(hasil.p, axis=1) >= 0.9, axis=1).astype(float)
+    return hasil.t, hasil.L, hasil.Lq, p90, profil_lambda, profil_c * mu
+
+
+# Ini code untuk antrian jam sibuk (transien) versi interaktif
+@lru_cache(maxsize=UKURAN_CACHE)
+def klien_antrian_transien(jam_mulai, lmbda, c, mu):
+    jam, L, Lq, p90, _, _ = data_antrian_transien(jam_mulai, lmbda, c, mu)
+    data = _deret({'Rata-rata di Sistem L(t)': (jam, L), 'Rata-rata di Antrian Lq(t)': (jam, Lq),
+                   'Persentil ke-90 di Sistem': (jam, p90)})
+    spec = _spec_garis('Panjang Antrian Sepanjang Hari', 'Jam', 'Jumlah Mobil',
+                       {'Rata-rata di Sistem L(t)': 'steelblue', 'Rata-rata di Antrian Lq(t)': '#ff6347',
+                        'Persentil ke-90 di Sistem': 'gray'})
+    return data, spec
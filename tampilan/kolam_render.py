@@ -0,0 +1,95 @@
+"""Kolam thread pekerja untuk merender grafik di luar thread skrip Streamlit.
+
+Thread skrip hanya mengirim permintaan render lalu melanjutkan menulis
+metrik; byte gambar diambil dari ``Future`` setelah elemen lain terkirim.
+Antrean dibatasi: bila pekerja dan antrean penuh, grafik dirender langsung
+di thread pemanggil sehingga beban tidak menumpuk tanpa batas. Permintaan
+untuk grafik yang sama yang sedang dirender berbagi satu ``Future``.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .cache_grafik import encode_figure
+
+PEKERJA_DEFAULT = 2
+KEDALAMAN_ANTREAN_DEFAULT = 16
+
+
+class KolamRender:
+    """Render grafik lewat :class:`~tampilan.cache_grafik.CacheGrafik` di thread pekerja."""
+
+    def __init__(self, cache, n_pekerja=PEKERJA_DEFAULT, kedalaman_antrean=KEDALAMAN_ANTREAN_DEFAULT):
+        self.cache = cache
+        self.n_pekerja = n_pekerja
+        self.kedalaman_antrean = kedalaman_antrean
+        self._pool = ThreadPoolExecutor(max_workers=n_pekerja, thread_name_prefix="render")
+        # Slot = pekerja yang sibuk + permintaan yang menunggu di antrean
+        self._slot = threading.BoundedSemaphore(n_pekerja + kedalaman_antrean)
+        self._berjalan = {}
+        self._lock = threading.Lock()
+        self.dikirim = 0
+        self.digabung = 0
+        self.langsung = 0
+
+    def kirim(self, model, parameter, buat_figure, format="png"):
+        """Kembalikan ``Future`` berisi byte gambar; selesai seketika bila ada di cache."""
+        kunci = (model, tuple(parameter), format)
+        data = self.cache.ambil(kunci)
+        if data is not None:
+            return _selesai(data)
+        with self._lock:
+            future = self._berjalan.get(kunci)
+            if future is not None:
+                self.digabung += 1
+                return future
+            antre = self._slot.acquire(blocking=False)
+            if antre:
+                self.dikirim += 1
+                future = self._berjalan[kunci] = self._pool.submit(self._render, kunci, buat_figure)
+            else:
+                self.langsung += 1
+                future = self._berjalan[kunci] = Future()
+        if antre:
+            future.add_done_callback(lambda _: self._lepas(kunci, lepas_slot=True))
+            return future
+
+        # Antrean penuh: render di thread pemanggil (tekanan balik)
+        try:
+            future.set_result(self._render(kunci, buat_figure))
+        except Exception as e:
+            future.set_exception(e)
+        self._lepas(kunci)
+        return future
+
+    def _lepas(self, kunci, lepas_slot=False):
+        with self._lock:
+            self._berjalan.pop(kunci, None)
+        if lepas_slot:
+            self._slot.release()
+
+    def _render(self, kunci, buat_figure):
+        model, parameter, format = kunci
+        data = encode_figure(buat_figure(*parameter), format)
+        self.cache.simpan(kunci, data)
+        return data
+
+    def statistik(self):
+        with self._lock:
+            return {
+                "pekerja": self.n_pekerja,
+                "kedalaman_antrean": self.kedalaman_antrean,
+                "sedang_dirender": len(self._berjalan),
+                "dikirim": self.dikirim,
+                "digabung": self.digabung,
+                "langsung": self.langsung,
+            }
+
+    def tutup(self, tunggu=True):
+        self._pool.shutdown(wait=tunggu)
+
+
+def _selesai(data):
+    future = Future()
+    future.set_result(data)
+    return future
+
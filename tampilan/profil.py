@@ -0,0 +1,188 @@
+"""Profil kinerja per rerun: waktu fase compute, plot, dan emit setiap tab.
+
+Profiler bersifat opt-in. Saat tidak aktif, ``tab`` dan ``fase`` hanya
+mengembalikan context manager kosong sehingga biaya tambahannya dapat
+diabaikan. Saat aktif, durasi diukur dengan ``time.perf_counter_ns``
+(monoton) dan disimpan dalam jendela bergulir untuk persentil.
+
+Fase ``emit`` tidak diukur langsung: nilainya adalah total waktu tab
+dikurangi fase yang diukur, yaitu waktu untuk memanggil ``st.*``
+(metric, latex, markdown, image) dan serialisasinya.
+
+Ekspor berkala dijalankan thread daemon sehingga berkas tetap diperbarui
+walau tidak ada tab yang dijalankan. Berkas Prometheus juga memuat waktu
+ekspor terakhir agar scraper dapat mengenali instance yang macet.
+"""
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+UKURAN_JENDELA = 1000
+KUANTIL = (0.5, 0.9, 0.99)
+FASE_DIUKUR = ('compute', 'plot')
+
+
+class _Seri:
+    __slots__ = ('jendela', 'n', 'total_ns')
+
+    def __init__(self, ukuran_jendela):
+        self.jendela = deque(maxlen=ukuran_jendela)
+        self.n = 0
+        self.total_ns = 0
+
+    def tambah(self, durasi_ns):
+        self.jendela.append(durasi_ns)
+        self.n += 1
+        self.total_ns += durasi_ns
+
+
+def _kuantil(urut, q):
+    # Metode nearest-rank; cukup untuk jendela berukuran ratusan sampel
+    return urut[max(0, math.ceil(q * len(urut)) - 1)]
+
+
+class Profiler:
+    """Pengumpul durasi per (tab, fase) dengan persentil bergulir dan ekspor berkala."""
+
+    def __init__(self, aktif=False, path_jsonl=None, path_prometheus=None, interval_ekspor=60.0,
+                 ukuran_jendela=UKURAN_JENDELA):
+        self.aktif = aktif
+        self.path_jsonl = path_jsonl
+        self.path_prometheus = path_prometheus
+        self.interval_ekspor = interval_ekspor
+        self.ukuran_jendela = ukuran_jendela
+        self._seri = {}
+        self._lock = threading.Lock()
+        self._lokal = threading.local()
+        self._ekspor_terakhir = time.monotonic()
+        self._berhenti = threading.Event()
+        if aktif and (path_jsonl or path_prometheus) and interval_ekspor > 0:
+            threading.Thread(target=self._ekspor_berkala, name='profil-ekspor', daemon=True).start()
+
+    @classmethod
+    def dari_env(cls, environ=os.environ):
+        """Bangun profiler dari variabel lingkungan PROFIL_DASHBOARD, PROFIL_JSONL, dst."""
+        return cls(
+            aktif=environ.get("PROFIL_DASHBOARD", "0") not in ("", "0", "false"),
+            path_jsonl=environ.get("PROFIL_JSONL") or None,
+            path_prometheus=environ.get("PROFIL_PROMETHEUS") or None,
+            interval_ekspor=float(environ.get("PROFIL_INTERVAL", 60)),
+        )
+
+    def catat(self, tab, fase, durasi_ns):
+        with self._lock:
+            seri = self._seri.get((tab, fase))
+            if seri is None:
+                seri = self._seri[(tab, fase)] = _Seri(self.ukuran_jendela)
+            seri.tambah(durasi_ns)
+
+    def tab(self, nama):
+        """Ukur satu eksekusi tab; fase di dalamnya dikaitkan ke tab ini."""
+        if not self.aktif:
+            return nullcontext()
+        return self._tab(nama)
+
+    @contextmanager
+    def _tab(self, nama):
+        induk = getattr(self._lokal, 'tab', None), getattr(self._lokal, 'terukur', None)
+        self._lokal.tab = nama
+        self._lokal.terukur = dict.fromkeys(FASE_DIUKUR, 0)
+        awal = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            total = time.perf_counter_ns() - awal
+            terukur = self._lokal.terukur
+            for fase, durasi in terukur.items():
+                self.catat(nama, fase, durasi)
+            self.catat(nama, 'emit', max(0, total - sum(terukur.values())))
+            self.catat(nama, 'total', total)
+            self._lokal.tab, self._lokal.terukur = induk
+            self.mungkin_ekspor()
+
+    def fase(self, nama):
+        """Ukur fase ``compute`` atau ``plot`` di dalam tab yang sedang berjalan."""
+        if not self.aktif or getattr(self._lokal, 'tab', None) is None:
+            return nullcontext()
+        return self._fase(nama)
+
+    @contextmanager
+    def _fase(self, nama):
+        awal = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            terukur = self._lokal.terukur
+            terukur[nama] = terukur.get(nama, 0) + time.perf_counter_ns() - awal
+
+    def ringkasan(self):
+        """Daftar dict per (tab, fase): n, rata-rata, dan persentil dalam milidetik."""
+        with self._lock:
+            salinan = {k: (list(s.jendela), s.n, s.total_ns) for k, s in self._seri.items()}
+        baris = []
+        for (tab, fase), (jendela, n, total_ns) in sorted(salinan.items()):
+            urut = sorted(jendela)
+            data = {'tab': tab, 'fase': fase, 'n': n, 'total_ms': total_ns / 1e6,
+                    'rata_ms': sum(urut) / len(urut) / 1e6}
+            for q in KUANTIL:
+                data[f'p{int(q * 100)}_ms'] = _kuantil(urut, q) / 1e6
+            baris.append(data)
+        return baris
+
+    def _ekspor_berkala(self):
+        while not self._berhenti.wait(self.interval_ekspor):
+            self.mungkin_ekspor()
+
+    def hentikan(self):
+        """Hentikan thread ekspor berkala."""
+        self._berhenti.set()
+
+    def mungkin_ekspor(self):
+        """Ekspor bila interval sudah lewat; dipanggil thread ekspor dan di akhir setiap eksekusi tab."""
+        if not (self.path_jsonl or self.path_prometheus):
+            return
+        sekarang = time.monotonic()
+        with self._lock:
+            if sekarang - self._ekspor_terakhir < self.interval_ekspor:
+                return
+            self._ekspor_terakhir = sekarang
+        self.ekspor()
+
+    def ekspor(self):
+        ringkasan = self.ringkasan()
+        waktu = time.time()
+        if self.path_jsonl:
+            with open(self.path_jsonl, 'a', encoding='utf-8') as f:
+                for baris in ringkasan:
+                    f.write(json.dumps({'waktu': waktu, **baris}) + '\n')
+        if self.path_prometheus:
+            # Tulis ke berkas sementara lalu ganti, agar scraper tidak membaca berkas setengah jadi
+            sementara = f"{self.path_prometheus}.tmp"
+            with open(sementara, 'w', encoding='utf-8') as f:
+                f.write(format_prometheus(ringkasan, waktu))
+            os.replace(sementara, self.path_prometheus)
+
+
+def format_prometheus(ringkasan, waktu=None):
+    """Format teks eksposisi Prometheus (tipe summary) dalam satuan detik.
+
+    ``waktu`` (detik Unix) ditulis sebagai gauge waktu ekspor terakhir.
+    """
+    baris = []
+    if waktu is not None:
+        gauge = 'dashboard_ekspor_terakhir_detik'
+        baris += [f'# HELP {gauge} Waktu Unix ekspor profil terakhir.', f'# TYPE {gauge} gauge',
+                  f'{gauge} {waktu:.3f}']
+    nama = 'dashboard_fase_detik'
+    baris += [f'# HELP {nama} Durasi fase per eksekusi tab dashboard.', f'# TYPE {nama} summary']
+    for r in ringkasan:
+        label = f'tab="{r["tab"]}",fase="{r["fase"]}"'
+        for q in KUANTIL:
+            baris.append(f'{nama}{{{label},quantile="{q}"}} {r[f"p{int(q * 100)}_ms"] / 1e3:.6g}')
+        baris.append(f'{nama}_sum{{{label}}} {r["total_ms"] / 1e3:.6g}')
+        baris.append(f'{nama}_count{{{label}}} {r["n"]}')
+    return '\n'.join(baris) + '\n'
@@ -0,0 +1,48 @@
+"""Penurunan jumlah titik deret panjang sebelum dikirim ke browser.
+
+Algoritme Largest-Triangle-Three-Buckets (LTTB, Steinarsson 2013) memilih
+satu titik per ember dengan luas segitiga terbesar terhadap titik terpilih
+sebelumnya dan rata-rata ember berikutnya. Titik yang dipilih adalah titik
+asli dengan urutan terjaga, sehingga puncak dan lembah tetap terlihat.
+"""
+import numpy as np
+
+ANGGARAN_TITIK = 1000
+
+
+def lttb(x, y, n_maks=ANGGARAN_TITIK):
+    """Indeks paling banyak ``n_maks`` titik dari deret (x, y) yang terurut menurut x."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= n_maks or n_maks < 3:
+        return np.arange(n) if n <= n_maks else np.linspace(0, n - 1, n_maks).astype(np.int64)
+
+    # Titik pertama dan terakhir selalu disimpan; sisanya dibagi ke n_maks - 2 ember
+    tepi = np.linspace(1, n - 1, n_maks - 1).astype(np.int64)
+    # Rata-rata setiap ember dihitung sekaligus lewat jumlah kumulatif
+    cx = np.concatenate([[0.0], np.cumsum(x)])
+    cy = np.concatenate([[0.0], np.cumsum(y)])
+    lebar = np.diff(tepi)
+    rata_x = (cx[tepi[1:]] - cx[tepi[:-1]]) / lebar
+    rata_y = (cy[tepi[1:]] - cy[tepi[:-1]]) / lebar
+    # Ember terakhir dibandingkan dengan titik terakhir
+    rata_x = np.append(rata_x[1:], x[-1])
+    rata_y = np.append(rata_y[1:], y[-1])
+
+    terpilih = np.empty(n_maks, dtype=np.int64)
+    terpilih[0], terpilih[-1] = 0, n - 1
+    a = 0
+    for k in range(n_maks - 2):
+        awal, akhir = tepi[k], tepi[k + 1]
+        bx, by = x[awal:akhir], y[awal:akhir]
+        luas = np.abs((x[a] - rata_x[k]) * (by - y[a]) - (x[a] - bx) * (rata_y[k] - y[a]))
+        a = awal + int(np.argmax(luas))
+        terpilih[k + 1] = a
+    return terpilih
+
+
+def turunkan(x, y, n_maks=ANGGARAN_TITIK):
+    """Pasangan (x, y) hasil LTTB."""
+    i = lttb(x, y, n_maks)
+    return np.asarray(x)[i], np.asarray(y)[i]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from model_matematika import antrian_transien, hitung_mmc, profil_sepotong
+from model_matematika.antrian_transien import _kapasitas_awal
+
+
+def _generator(lmbda, c, mu, K):
+    """Matriks laju Q rantai lahir-mati {0..K} dengan c server."""
+    n = np.arange(K + 1)
+    Q = np.zeros((K + 1, K + 1))
+    Q[n[:-1], n[:-1] + 1] = lmbda
+    Q[n[1:], n[1:] - 1] = np.minimum(n[1:], c) * mu
+    Q[n, n] = -Q.sum(axis=1)
+    return Q
+
+
+@pytest.mark.parametrize('dt', [1 / 60, 0.25, 2.0])   # dt = 2 jam memecah uniformisasi (laju * dt > 20)
+def test_langkah_sama_dengan_expm(dt):
+    linalg = pytest.importorskip('scipy.linalg')
+    mu, K = 35.0, 60
+    lmbda = np.array([10.0, 45.0, 80.0, 0.0, 30.0])
+    c = np.array([1, 1, 2, 3, 2])
+    hasil = antrian_transien(lmbda, c, mu, dt, n_awal=3, K=K)
+
+    p = np.zeros(K + 1)
+    p[3] = 1.0
+    for k in range(lmbda.size):
+        p = p @ linalg.expm(_generator(lmbda[k], c[k], mu, K) * dt)
+        np.testing.assert_allclose(hasil.p[k + 1], p, atol=1e-11)
+    np.testing.assert_allclose(hasil.p.sum(axis=1), 1.0, atol=1e-12)
+
+
+def test_menuju_keadaan_tunak_mmc():
+    hasil = antrian_transien(np.full(400, 50.0), 2, 35.0, 0.05, K=200)
+    tunak = hitung_mmc(50.0, 35.0, 2)
+    assert hasil.L[-1] == pytest.approx(float(tunak.L), rel=1e-8)
+    assert hasil.Lq[-1] == pytest.approx(float(tunak.Lq), rel=1e-8)
+
+
+def test_kewalahan_menggandakan_K_sampai_toleransi():
+    # lambda > c * mu selama tiga jam: antrian tumbuh lalu terurai
+    dt, mu, toleransi = 1 / 60, 35.0, 1e-9
+    lmbda = profil_sepotong([0, 2, 5], [20.0, 50.0, 10.0], dt, 12)
+    c = profil_sepotong([0, 2, 5], [1, 1, 1], dt, 12).astype(int)
+    K_awal = _kapasitas_awal(lmbda, c, mu, dt, 0)
+    assert antrian_transien(lmbda, c, mu, dt, K=K_awal).massa_batas > toleransi
+
+    hasil = antrian_transien(lmbda, c, mu, dt, toleransi=toleransi)
+    assert hasil.K > K_awal
+    assert hasil.massa_batas <= toleransi
+    assert hasil.Lq.max() > 10 and hasil.Lq[-1] < 1
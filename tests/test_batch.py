@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+import math
+
+import pytest
+
+from model_matematika import hitung_mmc
+from model_matematika.batch import jalankan_batch
+
+CSV_ANTRIAN = (
+    'kode,lmbda,mu,c\n'
+    'a,30,35,\n'             # c kosong -> bawaan 1
+    'b,9,6,\n'               # c = 1 tidak stabil
+    '"toko, pusat",30,20,2\n'
+    'd,,35,1\n'              # parameter wajib kosong -> NaN
+    'e,50,35,2\n'
+)
+
+
+def _jalankan(teks, format_masukan='csv', format_keluaran='csv', ukuran_chunk=2):
+    keluaran = io.StringIO()
+    n = jalankan_batch('antrian', io.StringIO(teks), keluaran, format_masukan, format_keluaran,
+                       ukuran_chunk=ukuran_chunk)
+    return n, keluaran.getvalue()
+
+
+def test_csv_sel_kosong_kutip_dan_batas_chunk():
+    n, teks = _jalankan(CSV_ANTRIAN)
+    assert n == 5
+    baris = list(csv.DictReader(io.StringIO(teks)))
+    # Header hanya ditulis sekali walau ada tiga chunk, dan urutan baris terjaga
+    assert teks.count('kode,') == 1
+    assert [b['kode'] for b in baris] == ['a', 'b', 'toko, pusat', 'd', 'e']
+
+    assert float(baris[0]['Wq']) == pytest.approx(float(hitung_mmc(30.0, 35.0, 1).Wq), rel=1e-9)
+    # Sel c kosong memakai bawaan 1, sehingga lambda > mu tidak stabil
+    assert math.isnan(float(baris[1]['Wq']))
+    assert float(baris[1]['rho']) == pytest.approx(1.5)
+    assert float(baris[2]['Wq']) == pytest.approx(float(hitung_mmc(30.0, 20.0, 2).Wq), rel=1e-9)
+    assert all(math.isnan(float(v)) for k, v in baris[3].items() if k != 'kode')
+    assert float(baris[4]['L']) == pytest.approx(float(hitung_mmc(50.0, 35.0, 2).L), rel=1e-9)
+
+
+def test_jsonl_kunci_hilang_dan_nilai_null():
+    masukan = ''.join(json.dumps(r) + '\n' for r in [
+        {'kode': 'a', 'lmbda': 30, 'mu': 35},
+        {'kode': 'b', 'lmbda': 30, 'mu': 35, 'c': None},
+        {'kode': 'c', 'mu': 35, 'c': 2},
+        {'kode': 'd', 'lmbda': 50, 'mu': 35, 'c': 2},
+    ])
+    n, teks = _jalankan(masukan, 'jsonl', 'jsonl', ukuran_chunk=3)
+    rekaman = [json.loads(b) for b in teks.splitlines()]
+    assert n == 4 and [r['kode'] for r in rekaman] == ['a', 'b', 'c', 'd']
+    assert rekaman[0]['Wq'] == pytest.approx(rekaman[1]['Wq'])
+    assert rekaman[0]['Wq'] == pytest.approx(float(hitung_mmc(30.0, 35.0, 1).Wq))
+    assert all(v is None for k, v in rekaman[2].items() if k != 'kode')
+    assert rekaman[3]['L'] == pytest.approx(float(hitung_mmc(50.0, 35.0, 2).L))
+
+
+def test_csv_ke_jsonl_sama_dengan_csv():
+    _, teks_csv = _jalankan(CSV_ANTRIAN, ukuran_chunk=50)
+    _, teks_jsonl = _jalankan(CSV_ANTRIAN, 'csv', 'jsonl', ukuran_chunk=50)
+    for dari_csv, dari_jsonl in zip(csv.DictReader(io.StringIO(teks_csv)), map(json.loads, teks_jsonl.splitlines())):
+        assert dari_csv['kode'] == dari_jsonl['kode']
+        for k, v in dari_jsonl.items():
+            if k != 'kode':
+                assert (v is None and float(dari_csv[k]) != float(dari_csv[k])) or float(dari_csv[k]) == pytest.approx(v)
+
+
+def test_kolom_wajib_tidak_ada():
+    with pytest.raises(KeyError, match='mu'):
+        _jalankan('kode,lmbda\na,30\n')
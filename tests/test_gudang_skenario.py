@@ -0,0 +1,96 @@
+import io
+import itertools
+
+import numpy as np
+import pytest
+
+from model_matematika import GudangSkenario, HasilEOQ, gudang_skenario, hitung_eoq
+
+
+@pytest.fixture
+def jam(monkeypatch):
+    # Jam tiruan yang selalu maju agar urutan LRU tidak bergantung resolusi time.time()
+    detik = itertools.count(1_000_000)
+    monkeypatch.setattr(gudang_skenario.time, 'time', lambda: float(next(detik)))
+
+
+def _ukuran(gudang):
+    return gudang.statistik()['ukuran_byte']
+
+
+def test_eviksi_lru_sampai_90_persen_batas(tmp_path, jam):
+    data = np.arange(100, dtype=float)
+    percobaan = GudangSkenario(tmp_path / 'ukur.db')
+    percobaan.simpan('m', {'i': 0}, data)
+    per_baris = _ukuran(percobaan)
+
+    batas = 10 * per_baris + per_baris // 2
+    gudang = GudangSkenario(tmp_path / 'g.db', batas_byte=batas)
+    for i in range(10):
+        gudang.simpan('m', {'i': i}, data)
+    assert gudang.eviksi == 0
+    # Akses ulang baris 0 dan 1 sehingga baris 2 dan 3 menjadi yang paling lama tidak diakses
+    gudang.ambil('m', {'i': 0})
+    gudang.ambil('m', {'i': 1})
+    gudang.simpan('m', {'i': 10}, data)
+
+    assert _ukuran(gudang) <= int(batas * 0.9)
+    assert gudang.eviksi == 2
+    tidak_ada = object()
+    tersisa = [i for i in range(11) if gudang.ambil('m', {'i': i}, tidak_ada) is not tidak_ada]
+    assert tersisa == [0, 1] + list(range(4, 11))
+
+
+def test_simpan_ulang_kunci_sama_tidak_memicu_eviksi(tmp_path, jam):
+    data = np.arange(100, dtype=float)
+    gudang = GudangSkenario(tmp_path / 'g.db', batas_byte=10_000)
+    # Perkiraan total berjalan menghitung berlebih untuk INSERT OR REPLACE; hitung ulang harus mengoreksinya
+    for _ in range(200):
+        gudang.simpan('m', {'i': 0}, data)
+    gudang.simpan('m', {'i': 1}, data)
+    assert gudang.eviksi == 0
+    assert gudang.statistik()['jumlah'] == 2
+
+
+def test_ekspor_impor_ndarray_dan_namedtuple(tmp_path):
+    asal = GudangSkenario(tmp_path / 'asal.db')
+    eoq = hitung_eoq(1000.0, 50.0, 2.0, 5.0, 10.0)
+    matriks = np.arange(12, dtype=np.int32).reshape(3, 4)
+    asal.simpan('eoq', {'D': 1000.0}, eoq)
+    asal.simpan('matriks', {'n': 3}, {'a': matriks, (1, 2): [1.5, None, 'x']})
+    asal.simpan_skenario('dasar', 'eoq', {'D': 1000.0, 'rentang': np.array([1.0, 2.0])})
+
+    berkas = io.StringIO()
+    assert asal.ekspor(berkas) == 3
+    tujuan = GudangSkenario(tmp_path / 'tujuan.db')
+    berkas.seek(0)
+    assert tujuan.impor(berkas) == 3
+    berkas.seek(0)
+    assert tujuan.impor(berkas) == 0   # baris yang sudah ada diabaikan
+
+    hasil = tujuan.ambil('eoq', {'D': 1000.0})
+    assert isinstance(hasil, HasilEOQ)
+    for nama in HasilEOQ._fields:
+        np.testing.assert_array_equal(getattr(hasil, nama), getattr(eoq, nama))
+    isi = tujuan.ambil('matriks', {'n': 3})
+    assert isi['a'].dtype == np.int32 and isi['a'].shape == (3, 4)
+    np.testing.assert_array_equal(isi['a'], matriks)
+    assert isi[(1, 2)] == [1.5, None, 'x']
+    model, parameter = tujuan.ambil_skenario('dasar')
+    assert model == 'eoq' and parameter['D'] == 1000.0
+    np.testing.assert_array_equal(parameter['rentang'], [1.0, 2.0])
+
+
+def test_versi_baru_tidak_memakai_hasil_lama(tmp_path):
+    path = tmp_path / 'g.db'
+    lama = GudangSkenario(path, versi='1.0.0')
+    lama.simpan('m', {'x': 1}, 42.0)
+    baru = GudangSkenario(path, versi='1.1.0')
+    assert baru.ambil('m', {'x': 1}) is None
+    baru.simpan('m', {'x': 1}, 43.0)
+    assert baru.statistik()['jumlah'] == 2
+
+    baru.bersihkan(hanya_versi_lama=True)
+    assert baru.statistik()['jumlah'] == 1
+    assert baru.ambil('m', {'x': 1}) == 43.0
+    assert lama.ambil('m', {'x': 1}) is None
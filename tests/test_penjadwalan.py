@@ -0,0 +1,17 @@
+import numpy as np
+
+from model_matematika import daftar_shift, jadwal_shift, selesaikan_ilp
+
+
+def test_jadwal_shift_biaya_tidak_seragam_sama_dengan_ilp():
+    rng = np.random.default_rng(0)
+    T = 24
+    mulai, panjang = daftar_shift(T, 8)
+    cakupan = ((np.arange(T) >= mulai[:, None]) & (np.arange(T) < (mulai + panjang)[:, None])).T.astype(float)
+    for _ in range(30):
+        kebutuhan = rng.integers(0, 5, T)
+        biaya = rng.uniform(5, 15, mulai.size)
+        jadwal = jadwal_shift(kebutuhan, 8, biaya=biaya)
+        optimum = selesaikan_ilp(biaya, -cakupan, -kebutuhan.astype(float), maksimasi=False)
+        assert np.all(jadwal.cakupan >= kebutuhan)
+        assert jadwal.jumlah @ biaya <= optimum.x @ biaya + 1e-6
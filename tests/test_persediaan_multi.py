@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from model_matematika import eoq_terkendala
+
+
+@pytest.mark.parametrize('kendala', [
+    {'ruang': [1.0, 1.0, 1.0, 2.0], 'kapasitas_ruang': 5.0},
+    {'biaya_unit': [3.0, 1.0, 2.0, 4.0], 'anggaran': 8.0},
+    {'ruang': [1.0, 1.0, 1.0, 2.0], 'kapasitas_ruang': 5.0, 'biaya_unit': [3.0, 1.0, 2.0, 4.0], 'anggaran': 8.0},
+])
+def test_sku_tanpa_permintaan_dengan_kendala_aktif(kendala):
+    D, S, H = [100.0, 0.0, 50.0, 0.0], [10.0, 10.0, 10.0, 10.0], [2.0, 0.0, 1.0, 1.0]
+    hasil = eoq_terkendala(D, S, H, **kendala)
+    assert np.all(np.isfinite(hasil.Q))
+    assert hasil.Q[1] == 0 and hasil.Q[3] == 0
+    assert np.all(hasil.Q <= hasil.Q_bebas + 1e-12)
+
+    # Kendala mengikat pada batasnya dan Q memenuhi rumus Lagrange dengan harga bayangan yang dilaporkan
+    a_ruang = np.array(kendala.get('ruang', [0.0] * 4))
+    a_anggaran = np.array(kendala.get('biaya_unit', [0.0] * 4))
+    penyebut = np.array(H) + 2 * (hasil.harga_bayangan_ruang * a_ruang + hasil.harga_bayangan_anggaran * a_anggaran)
+    aktif = np.array(D) > 0
+    np.testing.assert_allclose(hasil.Q[aktif], np.sqrt(2 * np.array(D) * S / penyebut)[aktif], rtol=1e-8)
+    if 'kapasitas_ruang' in kendala:
+        assert hasil.pemakaian_ruang <= kendala['kapasitas_ruang'] * (1 + 1e-8)
+    if 'anggaran' in kendala:
+        assert hasil.pemakaian_anggaran <= kendala['anggaran'] * (1 + 1e-8)
+    assert hasil.harga_bayangan_ruang + hasil.harga_bayangan_anggaran > 0
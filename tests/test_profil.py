@@ -0,0 +1,51 @@
+import json
+import threading
+import time
+
+from tampilan import Profiler, format_prometheus
+
+
+def _gauge(teks):
+    baris = [b for b in teks.splitlines() if b.startswith('dashboard_ekspor_terakhir_detik ')]
+    return float(baris[0].split()[1])
+
+
+def test_ekspor_berkala_tanpa_eksekusi_tab(tmp_path):
+    prom, jsonl = tmp_path / 'profil.prom', tmp_path / 'profil.jsonl'
+    profiler = Profiler(aktif=True, path_jsonl=str(jsonl), path_prometheus=str(prom), interval_ekspor=0.05)
+    try:
+        profiler.catat('antrian', 'total', 2_000_000)
+        batas = time.monotonic() + 5
+        while not prom.exists() and time.monotonic() < batas:
+            time.sleep(0.01)
+        pertama = _gauge(prom.read_text())
+        # Instance menganggur: berkas tetap diperbarui dan gauge waktu ekspor terus maju
+        time.sleep(0.3)
+        kedua = _gauge(prom.read_text())
+    finally:
+        profiler.hentikan()
+    assert kedua > pertama
+    assert abs(kedua - time.time()) < 5
+    assert 'dashboard_fase_detik_count{tab="antrian",fase="total"} 1' in prom.read_text()
+    rekaman = [json.loads(b) for b in jsonl.read_text().splitlines()]
+    assert len(rekaman) >= 2 and rekaman[-1]['tab'] == 'antrian' and rekaman[-1]['waktu'] > rekaman[0]['waktu']
+
+
+def _thread_ekspor():
+    return sum(t.name == 'profil-ekspor' for t in threading.enumerate())
+
+
+def test_tanpa_tujuan_atau_tidak_aktif_tidak_ada_thread(tmp_path):
+    sebelum = _thread_ekspor()
+    Profiler(aktif=True, interval_ekspor=0.05)
+    Profiler(aktif=False, path_prometheus=str(tmp_path / 'x.prom'), interval_ekspor=0.05)
+    time.sleep(0.1)
+    assert _thread_ekspor() == sebelum
+    assert not (tmp_path / 'x.prom').exists()
+
+
+def test_format_prometheus_dengan_waktu():
+    teks = format_prometheus([], 1_700_000_000.5)
+    assert '# TYPE dashboard_ekspor_terakhir_detik gauge' in teks
+    assert _gauge(teks) == 1_700_000_000.5
+    assert 'dashboard_ekspor_terakhir_detik' not in format_prometheus([])
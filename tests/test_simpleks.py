@@ -0,0 +1,237 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from model_matematika import LPInkremental, selesaikan_ilp, selesaikan_lp
+
+
+def _optimum_titik_sudut(c, A, b, lb, ub):
+    """Optimum maksimasi LP kecil berbatas dengan enumerasi semua titik sudut."""
+    n = c.size
+    G = np.vstack([A, np.eye(n), -np.eye(n)])
+    h = np.concatenate([b, ub, -lb])
+    terbaik = -np.inf
+    for aktif in itertools.combinations(range(G.shape[0]), n):
+        aktif = list(aktif)
+        if abs(np.linalg.det(G[aktif])) < 1e-9:
+            continue
+        x = np.linalg.solve(G[aktif], h[aktif])
+        if np.all(G @ x <= h + 1e-7):
+            terbaik = max(terbaik, c @ x)
+    return terbaik
+
+
+def test_lp_optimum_dan_dual_diketahui():
+    # Contoh klasik Wyndor: maks 3x + 5y
+    A = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+    hasil = selesaikan_lp([3.0, 5.0], A, [4.0, 12.0, 18.0])
+    assert hasil.status == 'optimal'
+    np.testing.assert_allclose(hasil.x, [2.0, 6.0], atol=1e-9)
+    assert hasil.nilai == pytest.approx(36.0)
+    np.testing.assert_allclose(hasil.dual, [0.0, 1.5, 1.0], atol=1e-9)
+
+
+def test_lp_minimasi_dengan_kendala_lebih_besar_sama_dengan():
+    # min 2x + 3y dengan x + y >= 4 dan x + 3y >= 6, ditulis sebagai -A x <= -b
+    hasil = selesaikan_lp([2.0, 3.0], [[-1.0, -1.0], [-1.0, -3.0]], [-4.0, -6.0], maksimasi=False)
+    assert hasil.status == 'optimal'
+    np.testing.assert_allclose(hasil.x, [3.0, 1.0], atol=1e-9)
+    assert hasil.nilai == pytest.approx(9.0)
+
+
+def test_lp_dual_sama_dengan_turunan_nilai_terhadap_b():
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        A = rng.uniform(0.5, 3.0, (4, 3))
+        b = rng.uniform(5.0, 15.0, 4)
+        c = rng.uniform(1.0, 5.0, 3)
+        hasil = selesaikan_lp(c, A, b)
+        eps = 1e-5
+        for i in range(4):
+            geser = b.copy()
+            geser[i] += eps
+            assert (selesaikan_lp(c, A, geser).nilai - hasil.nilai) / eps == pytest.approx(hasil.dual[i], abs=1e-4)
+
+
+def test_lp_acak_sama_dengan_enumerasi_titik_sudut():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        A = rng.uniform(-2.0, 3.0, (4, 3))
+        b = rng.uniform(1.0, 10.0, 4)
+        c = rng.uniform(-2.0, 5.0, 3)
+        lb, ub = np.zeros(3), rng.uniform(1.0, 8.0, 3)
+        hasil = selesaikan_lp(c, A, b, lb, ub)
+        assert hasil.status == 'optimal'
+        assert hasil.nilai == pytest.approx(_optimum_titik_sudut(c, A, b, lb, ub), abs=1e-7)
+        assert np.all(A @ hasil.x <= b + 1e-7)
+        assert np.all((hasil.x >= lb - 1e-9) & (hasil.x <= ub + 1e-9))
+
+
+def test_lp_tidak_layak():
+    assert selesaikan_lp([1.0, 1.0], [[1.0, 1.0], [-1.0, 0.0]], [1.0, -2.0]).status == 'tidak_layak'
+    assert selesaikan_lp([1.0], [[1.0]], [5.0], lb=[3.0], ub=[2.0]).status == 'tidak_layak'
+
+
+def test_lp_tak_terbatas():
+    hasil = selesaikan_lp([1.0, 1.0], [[-1.0, 1.0]], [2.0])
+    assert hasil.status == 'tak_terbatas'
+    with pytest.raises(ValueError):
+        selesaikan_ilp([1.0, 1.0], [[-1.0, 1.0]], [2.0])
+
+
+def test_lp_batas_variabel_dan_flip_batas_atas():
+    # Kedua variabel berhenti di batas atasnya tanpa kendala yang mengikat
+    hasil = selesaikan_lp([1.0, 1.0], [[1.0, 1.0]], [10.0], ub=[3.0, 4.0])
+    assert hasil.nilai == pytest.approx(7.0)
+    assert hasil.di_atas[:2].all()
+    # x di batas atas, y di basis mengisi sisa kendala
+    hasil = selesaikan_lp([2.0, 1.0], [[1.0, 1.0]], [5.0], ub=[3.0, np.inf])
+    np.testing.assert_allclose(hasil.x, [3.0, 2.0], atol=1e-9)
+    assert hasil.di_atas[0] and not hasil.di_atas[1]
+    # Batas bawah positif pada minimasi
+    hasil = selesaikan_lp([1.0, 1.0], [[1.0, 1.0]], [10.0], lb=[1.0, 2.0], maksimasi=False)
+    np.testing.assert_allclose(hasil.x, [1.0, 2.0], atol=1e-9)
+
+
+def test_lp_warm_start_sama_dengan_start_dingin():
+    rng = np.random.default_rng(2)
+    for _ in range(50):
+        A = rng.uniform(0.5, 3.0, (5, 4))
+        b = rng.uniform(5.0, 15.0, 5)
+        c = rng.uniform(1.0, 5.0, 4)
+        awal = selesaikan_lp(c, A, b)
+        basis = (awal.basis, awal.di_atas)
+        # Batas baru (seperti cabang branch-and-bound) membuat basis lama hanya layak dual
+        ub = np.where(rng.random(4) < 0.5, np.floor(awal.x), np.inf)
+        for args in ((c, A, b, None, ub), (c, A, b * rng.uniform(0.7, 1.3, 5), None, None)):
+            hangat = selesaikan_lp(*args, basis_awal=basis)
+            dingin = selesaikan_lp(*args)
+            assert hangat.status == dingin.status == 'optimal'
+            assert hangat.nilai == pytest.approx(dingin.nilai, abs=1e-8)
+
+
+def test_ilp_knapsack_diketahui():
+    hasil = selesaikan_ilp([8.0, 11.0, 6.0, 4.0], [[5.0, 7.0, 4.0, 3.0]], [14.0], ub=[1.0] * 4)
+    assert hasil.status == 'optimal'
+    assert hasil.nilai == pytest.approx(21.0)
+    np.testing.assert_allclose(hasil.x, [0.0, 1.0, 1.0, 1.0])
+
+
+def test_ilp_acak_sama_dengan_enumerasi():
+    rng = np.random.default_rng(3)
+    grid = np.array(list(itertools.product(range(6), repeat=3)), dtype=float)
+    for _ in range(50):
+        A = rng.integers(1, 6, (3, 3)).astype(float)
+        b = rng.integers(5, 20, 3).astype(float)
+        c = rng.integers(1, 10, 3).astype(float)
+        hasil = selesaikan_ilp(c, A, b, ub=[5.0] * 3)
+        layak = np.all(grid @ A.T <= b, axis=1)
+        assert hasil.status == 'optimal'
+        assert hasil.nilai == pytest.approx((grid[layak] @ c).max())
+
+
+def test_ilp_campuran_dan_tidak_layak():
+    # Hanya x yang bulat: maks x + y dengan 2x + 2y <= 5, x <= 1.5
+    hasil = selesaikan_ilp([1.0, 1.0], [[2.0, 2.0], [1.0, 0.0]], [5.0, 1.5], integer=[True, False])
+    assert hasil.status == 'optimal'
+    assert hasil.nilai == pytest.approx(2.5)
+    assert hasil.x[0] == np.round(hasil.x[0])
+    # Tidak ada bilangan bulat di [0.2, 0.8]
+    assert selesaikan_ilp([1.0], [[1.0]], [1.0], lb=[0.2], ub=[0.8]).status == 'tidak_layak'
+
+
+def _lp_acak(rng, m=5, n=4):
+    return rng.uniform(1.0, 5.0, n), rng.uniform(0.5, 3.0, (m, n)), rng.uniform(5.0, 15.0, m)
+
+
+def _di_dalam(nilai, bawah, atas):
+    """Titik tengah rentang yang dipotong ke jendela +-5 di sekitar nilai sekarang."""
+    return 0.5 * (max(bawah, nilai - 5.0) + min(atas, nilai + 5.0))
+
+
+def _di_luar(bawah, atas):
+    return atas + 1.0 if np.isfinite(atas) else bawah - 1.0
+
+
+def _sama(hasil, segar):
+    assert hasil.status == segar.status
+    if segar.status != 'optimal':
+        return
+    assert hasil.nilai == pytest.approx(segar.nilai, abs=1e-8)
+    np.testing.assert_allclose(hasil.x, segar.x, atol=1e-8)
+    np.testing.assert_allclose(hasil.dual, segar.dual, atol=1e-8)
+    np.testing.assert_allclose(hasil.reduced_cost, segar.reduced_cost, atol=1e-8)
+
+
+@pytest.mark.parametrize('maksimasi', [True, False])
+def test_inkremental_b_di_dalam_dan_di_luar_rentang(maksimasi):
+    rng = np.random.default_rng(4)
+    for _ in range(30):
+        c, A, b = _lp_acak(rng)
+        if not maksimasi:
+            A, b = -A, -b
+        lp = LPInkremental(c, A, b, maksimasi=maksimasi)
+        i = int(rng.integers(b.size))
+        bawah, atas = lp.rentang_b(i)
+        b_baru = lp.b.copy()
+
+        # Di dalam rentang: diperbarui tanpa menyelesaikan ulang
+        b_baru[i] = _di_dalam(b_baru[i], bawah, atas)
+        ulang = lp.diselesaikan_ulang
+        _sama(lp.ubah_b(i, b_baru[i]), selesaikan_lp(c, A, b_baru, maksimasi=maksimasi))
+        assert lp.diselesaikan_ulang == ulang
+
+        # Di luar rentang: kembali ke penyelesaian penuh
+        keluar = _di_luar(*lp.rentang_b(i))
+        if np.isfinite(keluar):
+            b_baru[i] = keluar
+            _sama(lp.ubah_b(i, b_baru[i]), selesaikan_lp(c, A, b_baru, maksimasi=maksimasi))
+            assert lp.diselesaikan_ulang == ulang + 1
+
+
+@pytest.mark.parametrize('maksimasi', [True, False])
+def test_inkremental_c_di_dalam_dan_di_luar_rentang(maksimasi):
+    rng = np.random.default_rng(5)
+    for _ in range(30):
+        c, A, b = _lp_acak(rng)
+        if not maksimasi:
+            A, b = -A, -b
+        lp = LPInkremental(c, A, b, maksimasi=maksimasi)
+        j = int(rng.integers(c.size))
+        bawah, atas = lp.rentang_c(j)
+        c_baru = lp.c.copy()
+
+        c_baru[j] = _di_dalam(c_baru[j], bawah, atas)
+        ulang = lp.diselesaikan_ulang
+        _sama(lp.ubah_c(j, c_baru[j]), selesaikan_lp(c_baru, A, b, maksimasi=maksimasi))
+        assert lp.diselesaikan_ulang == ulang
+
+        keluar = _di_luar(*lp.rentang_c(j))
+        if np.isfinite(keluar):
+            c_baru[j] = keluar
+            _sama(lp.ubah_c(j, keluar), selesaikan_lp(c_baru, A, b, maksimasi=maksimasi))
+            assert lp.diselesaikan_ulang == ulang + 1
+
+
+def test_harga_bayangan_sama_dengan_dual_penyelesaian_baru():
+    rng = np.random.default_rng(6)
+    for _ in range(30):
+        c, A, b = _lp_acak(rng)
+        lp = LPInkremental(c, A, b)
+        # Beberapa perubahan berurutan, sebagian di dalam rentang dan sebagian di luar
+        b_baru, c_baru = b * rng.uniform(0.8, 1.2, b.size), c * rng.uniform(0.8, 1.2, c.size)
+        lp.perbarui(c=c_baru, b=b_baru)
+        sens = lp.sensitivitas()
+        segar = selesaikan_lp(c_baru, A, b_baru)
+        np.testing.assert_allclose(sens.dual, segar.dual, atol=1e-8)
+        np.testing.assert_allclose(sens.reduced_cost, segar.reduced_cost, atol=1e-8)
+        np.testing.assert_allclose(sens.slack, b_baru - A @ segar.x, atol=1e-8)
+        # Harga bayangan = turunan nilai optimal terhadap b selama masih di dalam rentang
+        for i in range(b.size):
+            bawah, atas = sens.rentang_b[i]
+            if atas - b_baru[i] > 1e-3:
+                geser = b_baru.copy()
+                geser[i] += 1e-3
+                turunan = (selesaikan_lp(c_baru, A, geser).nilai - segar.nilai) / 1e-3
+                assert turunan == pytest.approx(sens.dual[i], abs=1e-6)
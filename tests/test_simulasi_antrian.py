@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from model_matematika import Distribusi, simulasi_antrian
+
+
+def test_balking_nol_berlaku_saat_server_sibuk_dan_antrian_kosong():
+    # balking=[1.0]: setiap pelanggan yang mendapati server sibuk batal, jadi sistem menjadi M/M/1/1
+    lmbda, mu = 5.0, 6.0
+    hasil = simulasi_antrian(lmbda, Distribusi.eksponensial(1 / mu), 1, n_pelanggan=100_000, balking=[1.0])
+    assert hasil.Lq == 0.0
+    assert hasil.Wq == 0.0
+    assert hasil.n_balking > 0
+    rho = lmbda / mu
+    blokir = rho / (1 + rho)
+    assert hasil.n_balking / (100_000 - 1_000) == pytest.approx(blokir, abs=0.01)
+    assert hasil.utilisasi == pytest.approx(rho * (1 - blokir), abs=0.01)
+
+
+def test_balking_nol_tidak_berlaku_saat_ada_server_bebas():
+    # Dengan banyak server hampir tidak ada pelanggan yang mendapati semua server sibuk
+    hasil = simulasi_antrian(1.0, Distribusi.eksponensial(1.0), 20, n_pelanggan=20_000, balking=[1.0])
+    assert hasil.n_balking == 0
+    assert hasil.Lq == 0.0